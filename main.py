@@ -1,34 +1,53 @@
+import argparse
 import asyncio
 import pygame
 from src.game import Game
-from src.settings import WINDOW_WIDTH, WINDOW_HEIGHT
-from src.scenes.main_menu import MainMenuScene
-from src.scenes.personality_test import PersonalityTestScene
-from src.scenes.avatar_select import AvatarSelectScene
-from src.scenes.dress_up import DressUpScene
-from src.scenes.college_app import CollegeAppScene
-from src.scenes.decision import DecisionScene
-from src.scenes.export import ExportScene
+from src.presentation import PRESENTERS, create_presenter
+from src.replay import InputRecorder
+from src.rng import reseed
+from src.scene_registry import SceneRegistry
+
+
+def parse_args():
+    parser = argparse.ArgumentParser(description="HYBRIS: Create Your Applicant")
+    parser.add_argument("--renderer", choices=sorted(PRESENTERS), default="surface",
+                        help="presentation backend (sdl2 uses SDL's software renderer)")
+    parser.add_argument("--seed", type=int, help="seed for gameplay randomness (default: random)")
+    parser.add_argument("--record", metavar="PATH",
+                        help="record input to PATH for tools/replay.py")
+    args, _ = parser.parse_known_args()
+    return args
+
+
+def build_scenes():
+    # Each scene's module is imported and the scene built the first time it's needed
+    return SceneRegistry({
+        "MAIN_MENU": "src.scenes.main_menu:MainMenuScene",
+        "PERSONALITY_TEST": "src.scenes.personality_test:PersonalityTestScene",
+        "AVATAR_SELECT": "src.scenes.avatar_select:AvatarSelectScene",
+        "DRESS_UP": "src.scenes.dress_up:DressUpScene",
+        "COLLEGE_APP": "src.scenes.college_app:CollegeAppScene",
+        "DECISION": "src.scenes.decision:DecisionScene",
+        "EXPORT": "src.scenes.export:ExportScene",
+    })
 
 
 async def main():
+    args = parse_args()
     pygame.init()
     info = pygame.display.Info()
-    screen = pygame.display.set_mode((info.current_w, info.current_h), pygame.RESIZABLE)
-    pygame.display.set_caption("HYBRIS: Create Your Applicant")
-
-    scenes = {
-        "MAIN_MENU": MainMenuScene(),
-        "PERSONALITY_TEST": PersonalityTestScene(),
-        "AVATAR_SELECT": AvatarSelectScene(),
-        "DRESS_UP": DressUpScene(),
-        "COLLEGE_APP": CollegeAppScene(),
-        "DECISION": DecisionScene(),
-        "EXPORT": ExportScene(),
-    }
-
-    game = Game(screen, scenes, "MAIN_MENU")
-    await game.run()
+    presenter = create_presenter(args.renderer, (info.current_w, info.current_h),
+                                 "HYBRIS: Create Your Applicant")
+
+    seed = reseed(args.seed)
+    game = Game(presenter, build_scenes(), "MAIN_MENU")
+    if args.record:
+        game.recorder = InputRecorder(args.record, seed, "MAIN_MENU")
+    try:
+        await game.run()
+    finally:
+        if game.recorder is not None:
+            game.recorder.close()
     pygame.quit()
 
 
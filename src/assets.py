@@ -0,0 +1,63 @@
+import weakref
+import pygame
+from src.font_loader import get_font, is_font_loaded
+
+# Decoded images by path, shared between scenes. Entries live only as long as
+# some scene holds the surface (see Scene.assets), so unloading the last scene
+# that uses a file frees it; the next request decodes it again.
+_images = weakref.WeakValueDictionary()
+# Paths that failed to load, so they aren't retried
+_missing = set()
+
+
+class Manifest:
+    """The images (paths) and fonts ((size, bold, italic)) a scene needs,
+    in the order they should be loaded. Duplicates are dropped."""
+
+    def __init__(self, images=(), fonts=()):
+        self.images = list(dict.fromkeys(images))
+        self.fonts = list(dict.fromkeys(fonts))
+
+
+def load_image(path):
+    """Return the alpha-converted image at path, or None if it can't be loaded.
+    Decodes it now unless another holder already has it."""
+    surf = _images.get(path)
+    if surf is None and path not in _missing:
+        try:
+            surf = pygame.image.load(path).convert_alpha()
+        except (pygame.error, FileNotFoundError):
+            _missing.add(path)
+            return None
+        _images[path] = surf
+    return surf
+
+
+def _image_ready(path, held):
+    return path in held or path in _images or path in _missing
+
+
+def prefetch(manifest, held):
+    """Generator that loads manifest's assets, yielding after each file it had
+    to decode. Images are stored in held (path -> Surface, or None for a file
+    that failed), which keeps them resident."""
+    for path in manifest.images:
+        if path not in held:
+            decoded = not _image_ready(path, held)
+            held[path] = load_image(path)
+            if decoded:
+                yield
+    for font in manifest.fonts:
+        if not is_font_loaded(*font):
+            get_font(*font)
+            yield
+
+
+def progress(manifest, held):
+    """Return the fraction (0.0-1.0) of manifest's assets already loaded."""
+    total = len(manifest.images) + len(manifest.fonts)
+    if not total:
+        return 1.0
+    done = sum(1 for path in manifest.images if _image_ready(path, held))
+    done += sum(1 for font in manifest.fonts if is_font_loaded(*font))
+    return done / total
@@ -1,7 +1,19 @@
+import io
 import os
+from collections import OrderedDict
 import pygame
+from src.settings import TEXT_CACHE_BYTES
 
 _font_cache = {}
+# Font -> (size, bold, italic) for the fonts get_font hands out
+_font_styles = {}
+# (text, size, bold, italic, color, antialias) -> rendered surface, least
+# recently used first, and the pixel bytes they hold
+_text_cache = OrderedDict()
+_text_bytes = 0
+_text_stats = {"hits": 0, "misses": 0, "evictions": 0}
+# Raw TTF bytes by filename, so each file is read from disk once for all sizes
+_font_data = {}
 
 _FONT_DIR = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "assets", "fonts")
 
@@ -13,16 +25,81 @@ _FONT_FILES = {
 }
 
 
+def _font_file(filename):
+    data = _font_data.get(filename)
+    if data is None:
+        with open(os.path.join(_FONT_DIR, filename), "rb") as f:
+            data = _font_data[filename] = f.read()
+    return io.BytesIO(data)
+
+
 def get_font(size, bold=False, italic=False):
     """Return a cached pygame.font.Font for the given size and style."""
     key = (size, bold, italic)
     if key not in _font_cache:
         filename = _FONT_FILES.get((bold, italic), "EBGaramond-Regular.ttf")
-        path = os.path.join(_FONT_DIR, filename)
         try:
-            font = pygame.font.Font(path, size)
+            font = pygame.font.Font(_font_file(filename), size)
         except FileNotFoundError:
-            fallback = os.path.join(_FONT_DIR, "EBGaramond-Regular.ttf")
-            font = pygame.font.Font(fallback, size)
+            font = pygame.font.Font(_font_file("EBGaramond-Regular.ttf"), size)
         _font_cache[key] = font
+        _font_styles[font] = key
     return _font_cache[key]
+
+
+def is_font_loaded(size, bold=False, italic=False):
+    return (size, bold, italic) in _font_cache
+
+
+def render_text(text, size, bold=False, italic=False, color=(0, 0, 0), antialias=True):
+    """Return text rendered in the get_font(size, bold, italic) font.
+
+    Surfaces are shared through an LRU cache of at most TEXT_CACHE_BYTES,
+    so a string drawn again (a card re-rendered on hover, a scene entered
+    twice) is rasterised once. Blit the result; don't draw on it.
+    """
+    global _text_bytes
+    color = tuple(color)
+    key = (text, size, bold, italic, color, antialias)
+    surf = _text_cache.get(key)
+    if surf is not None:
+        _text_cache.move_to_end(key)
+        _text_stats["hits"] += 1
+        return surf
+    _text_stats["misses"] += 1
+    surf = get_font(size, bold, italic).render(text, antialias, color)
+    nbytes = _surface_bytes(surf)
+    if nbytes > TEXT_CACHE_BYTES:
+        return surf
+    _text_cache[key] = surf
+    _text_bytes += nbytes
+    while _text_bytes > TEXT_CACHE_BYTES:
+        _, old = _text_cache.popitem(last=False)
+        _text_bytes -= _surface_bytes(old)
+        _text_stats["evictions"] += 1
+    return surf
+
+
+def render_with(font, text, color, antialias=True):
+    """font.render(text, antialias, color) through render_text's cache, for
+    a font from get_font; any other font renders uncached."""
+    style = _font_styles.get(font)
+    if style is None:
+        return font.render(text, antialias, color)
+    return render_text(text, *style, color=color, antialias=antialias)
+
+
+def text_cache_stats():
+    """Return hit, miss and eviction counts and the cache's current size."""
+    return dict(_text_stats, entries=len(_text_cache), bytes=_text_bytes)
+
+
+def clear_text_cache():
+    """Drop every cached text surface (the counters are kept)."""
+    global _text_bytes
+    _text_cache.clear()
+    _text_bytes = 0
+
+
+def _surface_bytes(surf):
+    return surf.get_bytesize() * surf.get_width() * surf.get_height()
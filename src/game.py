@@ -1,28 +1,67 @@
 import asyncio
+import math
+import sys
+import time
 import pygame
 from src.settings import (
-    LOGICAL_WIDTH, LOGICAL_HEIGHT, FPS, COLOR_BG_DARK
+    LOGICAL_WIDTH, LOGICAL_HEIGHT, FPS, IDLE_FPS, IDLE_GRACE, DIRTY_RECT_MAX_COVERAGE,
+    SIM_DT, MAX_FRAME_DT, WARMUP_BUDGET, WARMUP_SWITCH_BUDGET,
+    SCENE_TRANSITION, SCENE_TRANSITION_TIME
 )
+from src.scene import LOGICAL_RECT
+from src.input import FrameInput
+from src.presentation import RESIZE_EVENTS, EXPOSE_EVENTS
+from src.profiler import FrameProfiler, ProfilerOverlay
+from src.transitions import create_transition
+from src.state import GameState
+
+IS_WEB = sys.platform == "emscripten"
+PROFILER_HOTKEY = pygame.K_F3
 
 
 class Game:
-    """Main game controller. Manages the loop, scene transitions, and scaling."""
+    """Main game controller. Manages the loop, scene transitions, and scaling.
+
+    Drawing to the window is delegated to a presenter from src.presentation.
+    Scenes come from a SceneRegistry, which builds them on first use and is
+    told about every switch so it can unload idle ones. Switches animate
+    with a transition from src.transitions, played from a snapshot of the
+    outgoing scene's last frame.
+    """
 
-    def __init__(self, screen, scenes, start_scene_name):
-        self.screen = screen
+    def __init__(self, presenter, scenes, start_scene_name):
+        self.presenter = presenter
         self.logical_surface = pygame.Surface((LOGICAL_WIDTH, LOGICAL_HEIGHT))
         self.scenes = scenes
         self.current_scene_name = start_scene_name
         self.current_scene = self.scenes[start_scene_name]
         self.clock = pygame.time.Clock()
+        self.active_until = 0
+        self.sim_accumulator = 0.0
+        self.warmups = {}
+        self.pending_switch = None
+        self.transition = None
+        # Warm-up generator steps run this frame; when warmup_quota is set
+        # (replaying a recording) that many run instead of a time budget's worth
+        self.warmup_steps = 0
+        self.warmup_quota = None
+        # An InputRecorder from src.replay that run() hands every frame to
+        self.recorder = None
+        self.frame_input = FrameInput()
+        # True while frame_input holds events the current scene hasn't had
+        self.input_held = False
+        self.profiler = FrameProfiler()
+        self.profiler_overlay = ProfilerOverlay(self.profiler)
         self.running = True
-        self.persistent = {}
-        self.current_scene.startup(self.persistent)
+        self.persistent = GameState()
+        self.full_present = True
+        self.presented_version = -1
+        self._enter_scene(start_scene_name)
         self._update_scaling()
 
     def _update_scaling(self):
         """Recalculate scale factor and offset to fit logical surface in window."""
-        win_w, win_h = self.screen.get_size()
+        win_w, win_h = self.presenter.get_size()
         scale_x = win_w / LOGICAL_WIDTH
         scale_y = win_h / LOGICAL_HEIGHT
         self.scale = min(scale_x, scale_y)
@@ -30,6 +69,15 @@ class Game:
         self.scaled_h = int(LOGICAL_HEIGHT * self.scale)
         self.offset_x = (win_w - self.scaled_w) // 2
         self.offset_y = (win_h - self.scaled_h) // 2
+        # Nearest-neighbour scaling repeats every (src_step -> dst_step) pixels;
+        # damaged rects snapped to that grid scale to exactly the full-frame result.
+        gx = math.gcd(LOGICAL_WIDTH, self.scaled_w) or 1
+        gy = math.gcd(LOGICAL_HEIGHT, self.scaled_h) or 1
+        self.align_x = (LOGICAL_WIDTH // gx, self.scaled_w // gx)
+        self.align_y = (LOGICAL_HEIGHT // gy, self.scaled_h // gy)
+        self.presenter.set_viewport(
+            (self.offset_x, self.offset_y, self.scaled_w, self.scaled_h))
+        self.full_present = True
 
     def _translate_mouse(self, pos):
         """Convert window mouse coords to logical coords."""
@@ -39,60 +87,290 @@ class Game:
         ly = max(0, min(ly, LOGICAL_HEIGHT - 1))
         return (lx, ly)
 
-    async def run(self):
-        while self.running:
+    def _logical_to_window(self, rect):
+        """Map a grid-aligned logical rect to its window rect."""
+        (qx, px), (qy, py) = self.align_x, self.align_y
+        return pygame.Rect(self.offset_x + rect.x // qx * px, self.offset_y + rect.y // qy * py,
+                           rect.w // qx * px, rect.h // qy * py)
+
+    def _coalesce_damage(self, damage):
+        """Snap, clip and merge damaged rects. Returns None if a full present is cheaper."""
+        qx, qy = self.align_x[0], self.align_y[0]
+        merged = []
+        for rect in damage:
+            rect = rect.clip(LOGICAL_RECT)
+            if not rect.w or not rect.h:
+                continue
+            left, top = rect.left // qx * qx, rect.top // qy * qy
+            right, bottom = -(-rect.right // qx) * qx, -(-rect.bottom // qy) * qy
+            rect = pygame.Rect(left, top, right - left, bottom - top)
+            for i, other in enumerate(merged):
+                if rect.colliderect(other):
+                    merged[i] = other.union(rect)
+                    break
+            else:
+                merged.append(rect)
+        area = sum(r.w * r.h for r in merged)
+        if area > LOGICAL_WIDTH * LOGICAL_HEIGHT * DIRTY_RECT_MAX_COVERAGE:
+            return None
+        return merged
+
+    def _present(self, damage):
+        """Hand the logical surface to the presenter, whole or per damaged rect."""
+        if damage is not None and not self.full_present:
+            if not damage:
+                return
+            rects = self._coalesce_damage(damage)
+            if rects is not None:
+                self.presenter.present_rects(
+                    self.logical_surface,
+                    [(rect, self._logical_to_window(rect)) for rect in rects])
+                return
+        self.full_present = False
+        self.presenter.present_full(self.logical_surface)
+
+    def set_profiling(self, enabled, overlay=False):
+        """Turn frame profiling (and optionally its on-screen overlay) on or off."""
+        self.profiler.enabled = enabled
+        self.presenter.profiler = self.profiler if enabled else None
+        if self.profiler_overlay.visible and not (enabled and overlay):
+            self.full_present = True
+        self.profiler_overlay.visible = enabled and overlay
+
+    def _wait_for_frame(self):
+        """Pace the loop and collect events. Returns (dt, raw_events).
+
+        Runs at FPS while the scene animates or input was recent; otherwise
+        blocks on the event queue, waking at IDLE_FPS so timers still advance.
+        """
+        now = pygame.time.get_ticks()
+        if (self.current_scene.is_animating() or self.pending_switch or self.warmups
+                or self.transition or now < self.active_until):
             dt = self.clock.tick(FPS) / 1000.0
             raw_events = pygame.event.get()
+        elif IS_WEB:
+            # Blocking would stall the browser tab; just tick slowly instead
+            dt = self.clock.tick(IDLE_FPS) / 1000.0
+            raw_events = pygame.event.get()
+        else:
+            first = pygame.event.wait(1000 // IDLE_FPS)
+            raw_events = pygame.event.get()
+            if first.type != pygame.NOEVENT:
+                raw_events.insert(0, first)
+            dt = self.clock.tick() / 1000.0
+        if raw_events:
+            self.active_until = pygame.time.get_ticks() + int(IDLE_GRACE * 1000)
+        return dt, raw_events
 
-            # Translate mouse positions to logical coordinates
-            events = []
-            for event in raw_events:
-                if event.type == pygame.QUIT:
-                    self.running = False
-                    return
-                if event.type == pygame.VIDEORESIZE:
-                    self.screen = pygame.display.set_mode(
-                        (event.w, event.h), pygame.RESIZABLE)
-                    self._update_scaling()
-                    continue
-                if event.type in (pygame.MOUSEBUTTONDOWN, pygame.MOUSEBUTTONUP, pygame.MOUSEMOTION):
-                    lpos = self._translate_mouse(event.pos)
-                    if event.type == pygame.MOUSEMOTION:
-                        new_event = pygame.event.Event(event.type,
-                            pos=lpos, rel=event.rel, buttons=event.buttons)
-                    elif event.type == pygame.MOUSEBUTTONDOWN:
-                        new_event = pygame.event.Event(event.type,
-                            pos=lpos, button=event.button)
-                    else:  # MOUSEBUTTONUP
-                        new_event = pygame.event.Event(event.type,
-                            pos=lpos, button=event.button)
-                    events.append(new_event)
-                else:
-                    events.append(event)
-
-            self.current_scene.handle_events(events)
-            self.current_scene.update(dt)
-
-            if self.current_scene.quit:
+    async def run(self):
+        while self.running:
+            dt, raw_events = self._wait_for_frame()
+            self.step(dt, raw_events)
+            if self.recorder is not None and self.running:
+                self.recorder.add_frame(dt, self.frame_input.new_events, self.warmup_steps)
+            await asyncio.sleep(0)
+
+    def step(self, dt, raw_events):
+        """Run one frame: translate events, update, draw and present.
+
+        run() feeds it from the clock and event queue; headless tools call it
+        directly with synthetic events and a fixed dt.
+        """
+        prof = self.profiler if self.profiler.enabled else None
+        if prof:
+            prof.begin_frame(self.current_scene_name)
+
+        self.warmup_steps = 0
+        # Translate mouse positions to logical coordinates
+        frame_input = self.frame_input
+        frame_input.begin(keep=self.input_held)
+        toggle_overlay = False
+        for event in raw_events:
+            if event.type in (pygame.QUIT, pygame.WINDOWCLOSE):
                 self.running = False
                 return
+            if event.type in RESIZE_EVENTS:
+                if self.presenter.handle_resize(event):
+                    self._update_scaling()
+                continue
+            if event.type in EXPOSE_EVENTS:
+                self.presenter.expose()
+                self.full_present = True
+                continue
+            if event.type == pygame.KEYDOWN and event.key == PROFILER_HOTKEY:
+                toggle_overlay = not toggle_overlay
+                continue
+            frame_input.add(event, self._translate_mouse)
 
-            if self.current_scene.done:
-                self._switch_scene()
+        if prof:
+            prof.lap("events")
+        if self.pending_switch:
+            # The outgoing scene's last frame stays up until the next is ready
+            self._continue_switch(WARMUP_SWITCH_BUDGET)
+            self.input_held = True
+        else:
+            # The incoming scene takes input once its transition has finished,
+            # including whatever was held for it until then
+            self.input_held = self.transition is not None
+            if not self.input_held:
+                self.current_scene.handle_input(frame_input)
+            if prof:
+                prof.lap("handle_events")
+            self.sim_accumulator += min(dt, MAX_FRAME_DT)
+            while self.sim_accumulator >= SIM_DT and self.running and not self.pending_switch:
+                self.sim_accumulator -= SIM_DT
+                self._simulate(SIM_DT)
+            self._run_warmups(WARMUP_BUDGET)
+        if prof:
+            prof.lap("update")
+        if not self.running:
+            return
 
-            self.current_scene.draw(self.logical_surface)
-            scaled = pygame.transform.scale(
-                self.logical_surface, (self.scaled_w, self.scaled_h)
-            )
-            self.screen.fill(COLOR_BG_DARK)
-            self.screen.blit(scaled, (self.offset_x, self.offset_y))
-            pygame.display.flip()
-            await asyncio.sleep(0)
+        scene = self.current_scene
+        scene.frame_alpha = self.sim_accumulator / SIM_DT
+        overlay = self.profiler_overlay
+        transition = self.transition
+        if transition is not None and transition.done:
+            self.transition = transition = None
+            self.full_present = True
+        damage = []
+        if transition is not None:
+            # Full frames until it ends; before the incoming scene has
+            # started up, the snapshot just stays on screen
+            needs_draw = transition.started or self.full_present
+            damage = None
+            if transition.started:
+                scene.take_damage()
+                transition.draw(self.logical_surface, scene)
+            elif needs_draw:
+                self.logical_surface.blit(transition.snapshot, (0, 0))
+        else:
+            needs_draw = (self.full_present or not scene.tracks_damage
+                          or scene.frame_version != self.presented_version)
+        if needs_draw and transition is None:
+            damage = scene.take_damage()
+            scene.draw(self.logical_surface)
+        if prof:
+            prof.lap("draw")
+        if overlay.visible:
+            overlay.update(dt)
+            rect = overlay.draw(self.logical_surface, self.current_scene_name)
+            if damage is not None:
+                damage.append(rect)
+        if needs_draw or overlay.visible:
+            self._present(damage)
+            self.presented_version = scene.frame_version
+        if transition is not None:
+            # Advanced after drawing, so its first frame is the snapshot whole
+            transition.update(min(dt, MAX_FRAME_DT))
+        if prof:
+            prof.end_frame()
+        if toggle_overlay:
+            # Applied between frames so a frame is never half-profiled
+            visible = not self.profiler_overlay.visible
+            self.set_profiling(visible, overlay=visible)
+
+    def _simulate(self, dt):
+        """Run one fixed update step and act on the scene's flags."""
+        scene = self.current_scene
+        scene.update(dt)
+        if scene.warmup_request:
+            name, hints = scene.warmup_request
+            scene.warmup_request = None
+            self._start_warmup(name, self.persistent.replace(**hints))
+        if scene.quit:
+            self.running = False
+        elif scene.done:
+            self._switch_scene()
+
+    def advance(self, seconds):
+        """Run fixed simulation steps covering seconds of game time, without
+        drawing or waiting. Lets headless tools run faster than real time."""
+        self.sim_accumulator += seconds
+        while self.sim_accumulator >= SIM_DT and self.running:
+            self.sim_accumulator -= SIM_DT
+            if self.pending_switch:
+                self._continue_switch(None)
+            self._simulate(SIM_DT)
+
+    def goto(self, scene_name, transition="cut"):
+        """Leave the current scene for scene_name, finishing its warm-up inline.
+        No transition plays unless one is named; step() then animates it."""
+        self.current_scene.next_scene = scene_name
+        self._switch_scene(transition)
+        if self.pending_switch:
+            self._continue_switch(None)
 
-    def _switch_scene(self):
+    # ── Warm-up ─────────────────────────────────────────────────────
+
+    def _start_warmup(self, scene_name, persistent):
+        # Tools may run Game with only some scenes registered
+        if scene_name not in self.scenes:
+            return
+        task = self.scenes[scene_name].warm_up(persistent)
+        if task is None:
+            self.warmups.pop(scene_name, None)
+        else:
+            self.warmups[scene_name] = task
+
+    def _step_task(self, task, deadline):
+        """Advance a warm-up generator until it finishes (True) or the deadline
+        passes. While replaying, the frame's warmup_quota stands in for the clock."""
+        while deadline is None or self._in_budget(deadline):
+            self.warmup_steps += 1
+            try:
+                next(task)
+            except StopIteration:
+                return True
+        return False
+
+    def _in_budget(self, deadline):
+        if self.warmup_quota is None:
+            return time.perf_counter() < deadline
+        return self.warmup_steps < self.warmup_quota
+
+    def _run_warmups(self, budget):
+        if not self.warmups:
+            return
+        deadline = time.perf_counter() + budget
+        for name, task in list(self.warmups.items()):
+            if not self._step_task(task, deadline):
+                return
+            del self.warmups[name]
+
+    def _continue_switch(self, budget):
+        name, task = self.pending_switch
+        deadline = None if budget is None else time.perf_counter() + budget
+        if self._step_task(task, deadline):
+            self.pending_switch = None
+            self._enter_scene(name)
+
+    def _switch_scene(self, transition=None):
+        """Leave for the current scene's next_scene. transition names the
+        animation, defaulting to the incoming scene's own or SCENE_TRANSITION."""
         next_name = self.current_scene.next_scene
         persistent = self.current_scene.cleanup()
         self.persistent.update(persistent)
-        self.current_scene_name = next_name
-        self.current_scene = self.scenes[next_name]
+        self.warmups.pop(next_name, None)
+        self.scenes.left(self.current_scene_name, next_name, pinned=self.warmups)
+        incoming = self.scenes[next_name]
+        self.transition = create_transition(
+            transition or incoming.transition or SCENE_TRANSITION,
+            self.logical_surface.copy(), SCENE_TRANSITION_TIME)
+        task = incoming.warm_up(self.persistent)
+        if task is None:
+            self._enter_scene(next_name)
+        else:
+            self.pending_switch = (next_name, task)
+
+    def _enter_scene(self, name):
+        self.current_scene_name = name
+        self.current_scene = self.scenes[name]
         self.current_scene.startup(self.persistent)
+        self.full_present = True
+        if self.transition is not None:
+            self.transition.start()
+        # Prefetch what the following scenes need while this one is up
+        for upcoming in self.current_scene.upcoming:
+            if upcoming not in self.warmups:
+                self._start_warmup(upcoming, self.persistent)
@@ -0,0 +1,59 @@
+import pygame
+
+MOUSE_EVENTS = (pygame.MOUSEBUTTONDOWN, pygame.MOUSEBUTTONUP, pygame.MOUSEMOTION)
+
+
+class FrameInput:
+    """Per-frame input snapshot handed to Scene.handle_input.
+
+    Game reuses one instance for the whole session. events holds this frame's
+    events with mouse positions already in logical coordinates; runs of
+    consecutive MOUSEMOTION events are folded into one. Clicks, keys and text
+    pass through unchanged and in order.
+
+    Input that arrives while no scene can take it (a switch is loading or
+    animating) is held: begin(keep=True) leaves the earlier events in place
+    and new ones are added after them, so the incoming scene gets them all.
+    """
+
+    __slots__ = ("events", "mouse_pos", "mouse_moved", "fresh")
+
+    def __init__(self):
+        self.events = []
+        self.mouse_pos = (0, 0)
+        self.mouse_moved = False
+        self.fresh = 0
+
+    def begin(self, keep=False):
+        """Start a frame, dropping the last frame's events unless keep is True."""
+        if keep:
+            self.fresh = len(self.events)
+            return
+        self.events.clear()
+        self.mouse_moved = False
+        self.fresh = 0
+
+    @property
+    def new_events(self):
+        """Events added since begin(), without any held from earlier frames."""
+        return self.events[self.fresh:]
+
+    def add(self, event, translate):
+        """Append a raw event, translating mouse positions with translate(pos).
+
+        Events are updated in place instead of being rebuilt.
+        """
+        etype = event.type
+        if etype in MOUSE_EVENTS:
+            event.pos = translate(event.pos)
+            self.mouse_pos = event.pos
+            if etype == pygame.MOUSEMOTION:
+                self.mouse_moved = True
+                events = self.events
+                if len(events) > self.fresh and events[-1].type == pygame.MOUSEMOTION:
+                    last = events[-1]
+                    last.pos = event.pos
+                    last.rel = (last.rel[0] + event.rel[0], last.rel[1] + event.rel[1])
+                    last.buttons = event.buttons
+                    return
+        self.events.append(event)
@@ -0,0 +1,155 @@
+import pygame
+from src.settings import LOGICAL_WIDTH, LOGICAL_HEIGHT, COLOR_BG_DARK
+
+RESIZE_EVENTS = (pygame.VIDEORESIZE, pygame.WINDOWSIZECHANGED)
+EXPOSE_EVENTS = (pygame.VIDEOEXPOSE, pygame.WINDOWEXPOSED)
+
+
+class SurfacePresenter:
+    """Default backend: CPU-scales the logical surface onto the display surface.
+
+    Frames are scaled straight into a subsurface covering the content rect.
+    The letterbox bars around it are painted only after a resize or expose.
+    """
+
+    name = "surface"
+    profiler = None
+
+    def __init__(self, screen):
+        self.screen = screen
+        self.content_rect = pygame.Rect(0, 0, 0, 0)
+        self.content = None
+        self.bars_dirty = True
+
+    @classmethod
+    def create(cls, size, caption):
+        screen = pygame.display.set_mode(size, pygame.RESIZABLE)
+        pygame.display.set_caption(caption)
+        return cls(screen)
+
+    def get_size(self):
+        return self.screen.get_size()
+
+    def handle_resize(self, event):
+        """Recreate the display surface. Returns True if the window size changed."""
+        if event.type != pygame.VIDEORESIZE:
+            return False
+        self.screen = pygame.display.set_mode((event.w, event.h), pygame.RESIZABLE)
+        return True
+
+    def expose(self):
+        """The window contents were lost; repaint the bars with the next frame."""
+        self.bars_dirty = True
+
+    def set_viewport(self, content_rect):
+        self.content_rect = pygame.Rect(content_rect)
+        # Persistent scale destination: a view onto the display, not a copy
+        self.content = self.screen.subsurface(self.content_rect)
+        self.bars_dirty = True
+
+    def _paint_bars(self):
+        win = self.screen.get_rect()
+        cr = self.content_rect
+        for bar in (pygame.Rect(0, 0, win.w, cr.top),
+                    pygame.Rect(0, cr.bottom, win.w, win.h - cr.bottom),
+                    pygame.Rect(0, cr.top, cr.left, cr.h),
+                    pygame.Rect(cr.right, cr.top, win.w - cr.right, cr.h)):
+            if bar.w > 0 and bar.h > 0:
+                self.screen.fill(COLOR_BG_DARK, bar)
+
+    def present_full(self, logical_surface):
+        pygame.transform.scale(logical_surface, self.content_rect.size, self.content)
+        if self.profiler:
+            self.profiler.lap("scale")
+        if self.bars_dirty:
+            self.bars_dirty = False
+            self._paint_bars()
+            pygame.display.flip()
+        else:
+            pygame.display.update(self.content_rect)
+        if self.profiler:
+            self.profiler.lap("present")
+
+    def present_rects(self, logical_surface, rects):
+        """Present (logical_rect, window_rect) pairs produced by Game's damage tracking."""
+        updated = []
+        for rect, wrect in rects:
+            local = wrect.move(-self.content_rect.x, -self.content_rect.y)
+            pygame.transform.scale(logical_surface.subsurface(rect), wrect.size,
+                                   self.content.subsurface(local))
+            updated.append(wrect)
+        if self.profiler:
+            self.profiler.lap("scale")
+        pygame.display.update(updated)
+        if self.profiler:
+            self.profiler.lap("present")
+
+
+class RendererPresenter:
+    """SDL2 Renderer backend: uploads the logical surface to a streaming texture
+    and lets SDL scale it into the letterboxed viewport."""
+
+    name = "sdl2"
+    profiler = None
+
+    def __init__(self, window, renderer):
+        from pygame._sdl2.video import Texture
+        self.window = window
+        self.renderer = renderer
+        self.texture = Texture(renderer, (LOGICAL_WIDTH, LOGICAL_HEIGHT), streaming=True)
+        self.content_rect = pygame.Rect(0, 0, 0, 0)
+
+    @classmethod
+    def create(cls, size, caption, software=True):
+        """Open a window with a renderer. software=True works without a GPU."""
+        from pygame._sdl2.video import Window, Renderer
+        # Surface.convert()/convert_alpha() need a display mode; a hidden 1x1
+        # one provides the pixel format without a second visible window.
+        pygame.display.set_mode((1, 1), pygame.HIDDEN)
+        window = Window(caption, size, resizable=True)
+        renderer = Renderer(window, accelerated=0 if software else -1)
+        return cls(window, renderer)
+
+    def get_size(self):
+        return self.window.size
+
+    def handle_resize(self, event):
+        return event.type == pygame.WINDOWSIZECHANGED
+
+    def expose(self):
+        # The renderer clears and redraws the whole target on every present
+        pass
+
+    def set_viewport(self, content_rect):
+        self.content_rect = pygame.Rect(content_rect)
+
+    def present_full(self, logical_surface):
+        self.texture.update(logical_surface)
+        self._render()
+
+    def present_rects(self, logical_surface, rects):
+        for rect, _ in rects:
+            self.texture.update(logical_surface.subsurface(rect), area=rect)
+        self._render()
+
+    def _render(self):
+        # Texture uploads are lapped as "scale"; SDL scales during the copy
+        if self.profiler:
+            self.profiler.lap("scale")
+        self.renderer.draw_color = (*COLOR_BG_DARK, 255)
+        self.renderer.clear()
+        self.texture.draw(dstrect=self.content_rect)
+        self.renderer.present()
+        if self.profiler:
+            self.profiler.lap("present")
+
+
+PRESENTERS = {
+    SurfacePresenter.name: SurfacePresenter,
+    RendererPresenter.name: RendererPresenter,
+}
+
+
+def create_presenter(name, size, caption):
+    """Create the named presentation backend with a window of the given size."""
+    return PRESENTERS[name].create(size, caption)
@@ -0,0 +1,126 @@
+import time
+from array import array
+import pygame
+from src.font_loader import get_font
+from src.settings import (
+    PROFILER_SAMPLES, PROFILER_OVERLAY_INTERVAL,
+    COLOR_PANEL_BG, COLOR_PANEL_BORDER, COLOR_TEXT, COLOR_TEXT_DIM
+)
+
+# Phases of one Game frame, in the order they are lapped. "scale" covers the
+# presenter's CPU scale or texture upload, "present" the blit + flip/update.
+PHASES = ("events", "handle_events", "update", "draw", "scale", "present")
+PERCENTILES = (50, 95, 99)
+
+
+class PhaseRing:
+    """Fixed-size ring buffer of frame-phase durations in seconds."""
+
+    __slots__ = ("samples", "index", "count")
+
+    def __init__(self, size):
+        self.samples = array("d", bytes(8 * size))
+        self.index = 0
+        self.count = 0
+
+    def add(self, value):
+        self.samples[self.index] = value
+        self.index = (self.index + 1) % len(self.samples)
+        if self.count < len(self.samples):
+            self.count += 1
+
+    def values(self):
+        return self.samples[:self.count]
+
+
+def summarize(values):
+    """Return mean and percentile stats in milliseconds for a sequence of seconds."""
+    if not values:
+        return {"samples": 0}
+    ordered = sorted(values)
+    n = len(ordered)
+    stats = {"samples": n, "mean": sum(ordered) / n * 1000.0}
+    for p in PERCENTILES:
+        stats[f"p{p}"] = ordered[min(n - 1, n * p // 100)] * 1000.0
+    return stats
+
+
+class FrameProfiler:
+    """Per-scene, per-phase frame timer. Game only calls into it while enabled."""
+
+    def __init__(self, size=PROFILER_SAMPLES):
+        self.enabled = False
+        self.size = size
+        self.rings = {}
+        self._scene_rings = None
+        self._frame_start = 0.0
+        self._last = 0.0
+
+    def reset(self):
+        self.rings = {}
+
+    def begin_frame(self, scene_name):
+        rings = self.rings.get(scene_name)
+        if rings is None:
+            rings = {phase: PhaseRing(self.size) for phase in PHASES + ("total",)}
+            self.rings[scene_name] = rings
+        self._scene_rings = rings
+        self._frame_start = self._last = time.perf_counter()
+
+    def lap(self, phase):
+        """Record the time since the previous lap (or frame start) under phase."""
+        now = time.perf_counter()
+        self._scene_rings[phase].add(now - self._last)
+        self._last = now
+
+    def end_frame(self):
+        self._scene_rings["total"].add(time.perf_counter() - self._frame_start)
+
+    def stats(self, scene_name):
+        """Return {phase: {"samples", "mean", "p50", "p95", "p99"}} in ms for a scene."""
+        rings = self.rings.get(scene_name, {})
+        return {phase: summarize(ring.values()) for phase, ring in rings.items()}
+
+    def all_stats(self):
+        return {name: self.stats(name) for name in self.rings}
+
+
+class ProfilerOverlay:
+    """Corner panel listing p50/p95/p99 per phase for the current scene."""
+
+    def __init__(self, profiler):
+        self.profiler = profiler
+        self.visible = False
+        self.panel = None
+        self.refresh_timer = 0.0
+
+    def update(self, dt):
+        self.refresh_timer -= dt
+
+    def draw(self, surface, scene_name):
+        """Blit the panel onto surface and return the rect it covers."""
+        if self.panel is None or self.refresh_timer <= 0:
+            self.panel = self._render(scene_name)
+            self.refresh_timer = PROFILER_OVERLAY_INTERVAL
+        return surface.blit(self.panel, (8, 8))
+
+    def _render(self, scene_name):
+        font = get_font(18)
+        stats = self.profiler.stats(scene_name)
+        rows = [(f"{scene_name}  (ms)", "p50", "p95", "p99")]
+        for phase in PHASES + ("total",):
+            s = stats.get(phase, {})
+            if s.get("samples"):
+                rows.append((phase, *(f"{s[f'p{p}']:.2f}" for p in PERCENTILES)))
+            else:
+                rows.append((phase, "-", "-", "-"))
+        col_x = (10, 140, 200, 260)
+        line_h = font.get_linesize()
+        panel = pygame.Surface((320, line_h * len(rows) + 12))
+        panel.fill(COLOR_PANEL_BG)
+        pygame.draw.rect(panel, COLOR_PANEL_BORDER, panel.get_rect(), 1)
+        for i, row in enumerate(rows):
+            color = COLOR_TEXT_DIM if i == 0 else COLOR_TEXT
+            for x, cell in zip(col_x, row):
+                panel.blit(font.render(cell, True, color), (x, 6 + i * line_h))
+        return panel
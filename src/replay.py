@@ -0,0 +1,85 @@
+import gzip
+import json
+import pygame
+
+# Bumped whenever the file layout changes; older recordings are refused
+RECORDING_VERSION = 1
+
+# Event attributes of these types are kept; anything else (window objects)
+# is dropped. Lists come back as tuples, as pygame hands out positions.
+_PLAIN = (type(None), bool, int, float, str, tuple, list)
+
+
+def _encode_event(event):
+    attrs = {key: value for key, value in event.dict.items() if isinstance(value, _PLAIN)}
+    return [event.type, attrs]
+
+
+def _decode_event(data):
+    etype, attrs = data
+    return pygame.event.Event(etype, {key: tuple(value) if isinstance(value, list) else value
+                                      for key, value in attrs.items()})
+
+
+class InputRecorder:
+    """Writes every frame Game.run completes to a gzipped JSON-lines file.
+
+    The first line is a header with the rng seed and start scene. Each frame
+    after it is [dt, warmup_steps, events]: the frame's dt, how many warm-up
+    generator steps Game ran in it (warm-ups are budgeted by wall time, so
+    replays follow the count instead), and the events that arrived in it
+    after FrameInput has translated them to logical coordinates and folded
+    mouse motion; input Game held over from earlier frames isn't repeated.
+    Resize, expose and profiler-hotkey events never reach the scene and
+    aren't kept.
+    """
+
+    def __init__(self, path, seed, start_scene):
+        self.path = path
+        self.frames = 0
+        self.file = gzip.open(path, "wt", encoding="utf-8")
+        self._write({"version": RECORDING_VERSION, "seed": seed, "start_scene": start_scene,
+                     "pygame": pygame.version.ver})
+
+    def _write(self, data):
+        self.file.write(json.dumps(data, separators=(",", ":")) + "\n")
+
+    def add_frame(self, dt, events, warmup_steps):
+        self._write([dt, warmup_steps, [_encode_event(event) for event in events]])
+        self.frames += 1
+
+    def close(self):
+        if self.file is not None:
+            self.file.close()
+            self.file = None
+
+
+class Recording:
+    """A recording loaded by load_recording(); frames yields
+    (dt, warmup_steps, events) with events rebuilt as pygame events."""
+
+    def __init__(self, header, frames):
+        self.seed = header["seed"]
+        self.start_scene = header["start_scene"]
+        self.pygame_version = header.get("pygame")
+        self._frames = frames
+
+    def __len__(self):
+        return len(self._frames)
+
+    @property
+    def frames(self):
+        for dt, steps, events in self._frames:
+            yield dt, steps, [_decode_event(event) for event in events]
+
+
+def load_recording(path):
+    """Read a file written by InputRecorder. Raises ValueError if it was
+    written in another format version."""
+    with gzip.open(path, "rt", encoding="utf-8") as f:
+        header = json.loads(f.readline())
+        if header.get("version") != RECORDING_VERSION:
+            raise ValueError(f"{path}: recording version {header.get('version')}, "
+                             f"expected {RECORDING_VERSION}")
+        frames = [json.loads(line) for line in f if line.strip()]
+    return Recording(header, frames)
@@ -0,0 +1,14 @@
+import random
+
+# The one generator scenes draw gameplay randomness from, instead of the
+# random module. main.py seeds it at startup and recordings store the seed,
+# so a replayed session draws the same numbers in the same order.
+rng = random.Random()
+
+
+def reseed(seed=None):
+    """Seed rng with seed, or a fresh one if None. Returns the seed used."""
+    if seed is None:
+        seed = random.SystemRandom().randrange(1 << 32)
+    rng.seed(seed)
+    return seed
@@ -1,23 +1,183 @@
+import pygame
+from src.settings import LOGICAL_WIDTH, LOGICAL_HEIGHT
+from src.assets import load_image, prefetch, progress
+from src.state import GameState
+from src.ui.router import EventRouter
+from src.ui.widgets import Widget
+
+LOGICAL_RECT = pygame.Rect(0, 0, LOGICAL_WIDTH, LOGICAL_HEIGHT)
+
+
+def surface_bytes(obj, seen=None):
+    """Sum the pixel memory of the surfaces reachable from obj through
+    containers and widgets, counting each surface once."""
+    if seen is None:
+        seen = set()
+    if id(obj) in seen:
+        return 0
+    seen.add(id(obj))
+    if isinstance(obj, pygame.Surface):
+        return obj.get_bytesize() * obj.get_width() * obj.get_height()
+    if isinstance(obj, dict):
+        return sum(surface_bytes(v, seen) for v in obj.values())
+    if isinstance(obj, (list, tuple, set)):
+        return sum(surface_bytes(v, seen) for v in obj)
+    if isinstance(obj, Widget):
+        return surface_bytes(vars(obj), seen)
+    return 0
+
+
 class Scene:
     """Abstract base class for all game scenes."""
 
+    # Scenes that report changes via invalidate() set this to True. They are
+    # only redrawn when frame_version moves, and only their damaged rects are
+    # presented. Everything else is redrawn and presented every tick.
+    tracks_damage = False
+
+    # Cached static layers, bottom to top. Each is painted once by
+    # draw_layer(name, surface) over the layers below it and kept until
+    # invalidate_layer(); draw() blits the stack with composite_layers() and
+    # paints only the dynamic parts on top.
+    layers = ()
+
+    # Scenes likely to follow this one. Game warms them up (prefetching their
+    # manifests) in the background while this scene is on screen.
+    upcoming = ()
+
+    # How Game animates into this scene: a name from src.transitions, "cut",
+    # or None for settings.SCENE_TRANSITION.
+    transition = None
+
     def __init__(self):
         self.done = False
         self.quit = False
         self.next_scene = None
-        self.persistent = {}
+        self.persistent = GameState()
+        self.damage = []
+        self.full_damage = True
+        self.frame_version = 0
+        # Fraction of a fixed simulation step elapsed since the last update(),
+        # set by Game before draw() for scenes that interpolate motion.
+        self.frame_alpha = 0.0
+        # (scene_name, hints) for Game to start warming up; see request_warmup
+        self.warmup_request = None
+        # name -> surface holding that layer flattened over the ones below it
+        self._layer_cache = {}
+        # Hover, press and clicks for the widgets registered with router.add();
+        # it is cleared on startup and invalidates only widgets that change
+        self.router = EventRouter(self.invalidate)
+        # path -> Surface (None if missing) for the images this scene keeps loaded
+        self.assets = {}
 
     def startup(self, persistent):
-        """Called when scene becomes active. Receives shared data dict."""
+        """Called when scene becomes active. Receives the shared GameState."""
         self.persistent = persistent
         self.done = False
         self.quit = False
         self.next_scene = None
+        self.router.clear()
+        self.invalidate()
+
+    def manifest(self, persistent):
+        """Return the assets.Manifest of images and fonts startup(persistent) uses."""
+        return None
+
+    def warm_up(self, persistent):
+        """Return a generator that prepares heavy resources for startup(persistent)
+        a slice at a time, or None if nothing needs preparing. Game steps it
+        between frames and only calls startup() once it is exhausted.
+
+        By default it prefetches the scene's manifest."""
+        manifest = self.manifest(persistent)
+        if manifest is None or progress(manifest, self.assets) == 1.0:
+            return None
+        return prefetch(manifest, self.assets)
+
+    def image(self, path):
+        """Return the image at path (None if it can't be loaded), keeping it
+        in self.assets. Decodes it now if warm_up() didn't prefetch it."""
+        if path not in self.assets:
+            self.assets[path] = load_image(path)
+        return self.assets[path]
+
+    def request_warmup(self, scene_name, **hints):
+        """Ask Game to start warming up another scene, with hints layered over
+        the shared persistent data (e.g. a species chosen but not yet confirmed)."""
+        self.warmup_request = (scene_name, hints)
 
     def cleanup(self):
         """Called when scene is leaving. Returns data to pass forward."""
         return self.persistent
 
+    def unload(self):
+        """Drop resources that startup() and warm_up() rebuild. The scene
+        registry calls this on scenes that have been off screen a while."""
+        self._layer_cache.clear()
+        self.router.clear()
+        self.assets = {}
+
+    def resident_bytes(self):
+        """Approximate bytes of surfaces the scene holds on to."""
+        return surface_bytes(vars(self))
+
+    def invalidate(self, rect=None):
+        """Mark a logical-space rect as changed, or the whole frame if rect is None."""
+        self.frame_version += 1
+        if rect is None:
+            self.full_damage = True
+            self.damage = []
+        elif not self.full_damage:
+            self.damage.append(pygame.Rect(rect))
+
+    def invalidate_layer(self, name=None):
+        """Repaint layer name (and those above it), or every layer if name is None,
+        at the next composite. Also invalidates the whole frame."""
+        if name is None:
+            self._layer_cache.clear()
+        else:
+            for above in self.layers[self.layers.index(name):]:
+                self._layer_cache.pop(above, None)
+        self.invalidate()
+
+    def draw_layer(self, name, surface):
+        """Paint static layer name onto surface, which already holds the layers below."""
+        raise NotImplementedError
+
+    def composite_layers(self, surface):
+        """Blit the cached static layers onto surface, painting any that are missing."""
+        below = None
+        for name in self.layers:
+            layer = self._layer_cache.get(name)
+            if layer is None:
+                layer = pygame.Surface(LOGICAL_RECT.size)
+                if below is not None:
+                    layer.blit(below, (0, 0))
+                self.draw_layer(name, layer)
+                self._layer_cache[name] = layer
+            below = layer
+        if below is not None:
+            surface.blit(below, (0, 0))
+
+    def take_damage(self):
+        """Return rects damaged since the last call, or None for a full-frame present."""
+        if not self.tracks_damage or self.full_damage:
+            self.full_damage = False
+            self.damage = []
+            return None
+        rects, self.damage = self.damage, []
+        return rects
+
+    def is_animating(self):
+        """Return True while the scene needs full-rate frames without input."""
+        return True
+
+    def handle_input(self, frame_input):
+        """Receive this frame's FrameInput. Defaults to routing the mouse through
+        self.router, then handle_events(frame_input.events)."""
+        self.router.handle(frame_input)
+        self.handle_events(frame_input.events)
+
     def handle_events(self, events):
         raise NotImplementedError
 
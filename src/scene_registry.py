@@ -0,0 +1,70 @@
+import importlib
+from src.settings import SCENE_KEEP_WARM, SCENE_MEMORY_BUDGET
+
+
+class SceneRegistry:
+    """Scene lookup for Game that constructs scenes on first use and unloads
+    the ones left idle.
+
+    specs maps scene names to a Scene subclass or a "module:Class" path,
+    imported only when the scene is first needed. Game calls left() each time
+    it switches away from a scene; scenes off screen beyond the keep_warm most
+    recently left, or beyond memory_budget bytes between them, have unload()
+    called and reload their resources on their next startup() or warm_up().
+    """
+
+    def __init__(self, specs, keep_warm=SCENE_KEEP_WARM, memory_budget=SCENE_MEMORY_BUDGET):
+        self.specs = dict(specs)
+        self.keep_warm = keep_warm
+        self.memory_budget = memory_budget
+        self.scenes = {}
+        # Off-screen scenes still holding resources, least recently left first
+        self.idle = []
+
+    def __getitem__(self, name):
+        scene = self.scenes.get(name)
+        if scene is None:
+            scene = self.scenes[name] = self._construct(self.specs[name])
+        return scene
+
+    def __contains__(self, name):
+        return name in self.specs
+
+    def __iter__(self):
+        return iter(self.specs)
+
+    @staticmethod
+    def _construct(spec):
+        if isinstance(spec, str):
+            module, _, cls = spec.partition(":")
+            spec = getattr(importlib.import_module(module), cls)
+        return spec()
+
+    def left(self, name, entering, pinned=()):
+        """Record that Game switched from scene name to entering, then unload
+        idle scenes the policy no longer allows. Scenes in pinned (e.g. with a
+        warm-up in flight) are kept."""
+        if name in self.idle:
+            self.idle.remove(name)
+        self.idle.append(name)
+        if entering in self.idle:
+            self.idle.remove(entering)
+        keep = set(pinned) | {entering}
+        candidates = [n for n in self.idle if n not in keep]
+        while candidates and (len(candidates) > self.keep_warm or self._over_budget(candidates)):
+            self.unload(candidates.pop(0))
+
+    def _over_budget(self, names):
+        if self.memory_budget is None:
+            return False
+        return sum(self.scenes[n].resident_bytes() for n in names) > self.memory_budget
+
+    def unload(self, name):
+        """Release an off-screen scene's resources now."""
+        if name in self.idle:
+            self.idle.remove(name)
+        self.scenes[name].unload()
+
+    def resident_bytes(self):
+        """Approximate bytes of surfaces held by each constructed scene, by name."""
+        return {name: scene.resident_bytes() for name, scene in self.scenes.items()}
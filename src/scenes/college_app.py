@@ -1,23 +1,31 @@
 import pygame
 from src.scene import Scene
-from src.font_loader import get_font
+from src.assets import Manifest
+from src.font_loader import get_font, render_with
+from src.ui.skins import rounded_skin
+from src.ui.text import truncate
+from src.ui.widgets import Button, Card, Label, Panel, ProgressBar, TextInput
 from src.settings import (
     LOGICAL_WIDTH, LOGICAL_HEIGHT, COLOR_BG, COLOR_BG_ALT, COLOR_TEXT,
     COLOR_TEXT_DIM, COLOR_TEXT_LIGHT, COLOR_ACCENT, COLOR_ACCENT_DARK,
-    COLOR_PANEL_BG, COLOR_PANEL_BORDER, COLOR_PANEL_HOVER,
-    COLOR_BUTTON_IDLE, COLOR_BUTTON_TEXT, COLOR_RULE_LINE, MAX_COLLEGE_APPS
+    COLOR_PANEL_BG, COLOR_PANEL_BORDER, COLOR_BUTTON_IDLE,
+    COLOR_RULE_LINE, MAX_COLLEGE_APPS, MAX_STATEMENT_LENGTH
 )
 from src.data.colleges import COLLEGES
 from src.data.euphemisms import LOADING_SUBTEXTS
 
 
 class CollegeAppScene(Scene):
+    tracks_damage = True
+    upcoming = ("DECISION",)
+
     def __init__(self):
         super().__init__()
         self.phase = "select"
         self.selected_colleges = []
-        self.college_rects = []
-        self.confirm_rect = None
+        self.college_cards = []
+        self.confirm_button = None
+        self.labels = []
         self.font = None
         self.small_font = None
         self.title_font = None
@@ -26,12 +34,17 @@ class CollegeAppScene(Scene):
         self.applications = []
         self.app_essay_choice = 0
         self.app_extra_selected = set()
-        self.app_statement = ""
-        self.app_cursor_visible = True
         self.app_cursor_timer = 0
-        self.essay_rects = []
-        self.extra_rects = []
-        self.submit_rect = None
+        self.essay_cards = []
+        self.extra_cards = []
+        self.submit_button = None
+        self.statement_rect = None
+        self.statement_box = None
+        self.statement_input = None
+        self.statement_count = None
+        self.statement_placeholder = None
+        self.progress_bar = None
+        self.process_label = None
         self.process_timer = 0
 
     def startup(self, persistent):
@@ -47,66 +60,219 @@ class CollegeAppScene(Scene):
         self.tiny_font = get_font(26)
         self._build_select_layout()
 
+    def manifest(self, persistent):
+        return Manifest(fonts=[(32, True, False), (30, False, False), (44, True, False),
+                               (26, False, False)])
+
+    def unload(self):
+        super().unload()
+        self.labels = []
+        self.college_cards = []
+        self.essay_cards = []
+        self.extra_cards = []
+        self.confirm_button = self.submit_button = None
+        self.statement_box = self.statement_input = None
+        self.statement_count = self.statement_placeholder = None
+        self.progress_bar = self.process_label = None
+
     def _build_select_layout(self):
-        self.college_rects = []
+        self.labels = [
+            Label("College Application Portal  \u00b7  Select 2 Institutions", self.small_font,
+                  COLOR_TEXT_DIM, topleft=(80, 30)),
+            Label("Where Will You Apply?", self.title_font, COLOR_ACCENT_DARK,
+                  center=(LOGICAL_WIDTH//2, 100)),
+            Label(f"Select {MAX_COLLEGE_APPS} of {len(COLLEGES)} institutions.", self.tiny_font,
+                  COLOR_TEXT_LIGHT, center=(LOGICAL_WIDTH//2, 144)),
+        ]
+        self.college_cards = []
         y = 180
-        for _ in COLLEGES:
-            self.college_rects.append(pygame.Rect(100, y, LOGICAL_WIDTH - 200, 180))
+        for college in COLLEGES:
+            self.college_cards.append(Card((100, y, LOGICAL_WIDTH - 200, 180),
+                                           content=self._college_content(college),
+                                           selected_border_width=3))
             y += 200
-        self.confirm_rect = pygame.Rect(0, 0, 360, 68)
-        self.confirm_rect.center = (LOGICAL_WIDTH // 2, y + 40)
+        self.confirm_button = Button(
+            (0, 0, 360, 68), "", self.font,
+            fills={"idle": COLOR_BUTTON_IDLE, "disabled": COLOR_BG_ALT},
+            borders={"idle": COLOR_ACCENT, "disabled": COLOR_PANEL_BORDER})
+        self.confirm_button.rect.center = (LOGICAL_WIDTH // 2, y + 40)
+        self._sync_select()
+        self.router.clear()
+        for card in self.college_cards:
+            self.router.add(card, on_click=self._toggle_college)
+        self.router.add(self.confirm_button, on_click=lambda _: self._begin_applications())
+
+    def _sync_select(self):
+        """Reflect selected_colleges in the cards and the confirm button."""
+        for i, card in enumerate(self.college_cards):
+            card.set_selected(i in self.selected_colleges)
+        ok = len(self.selected_colleges) == MAX_COLLEGE_APPS
+        self.confirm_button.set_enabled(ok)
+        self.confirm_button.set_text(
+            "Begin Applications" if ok else f"Select {MAX_COLLEGE_APPS - len(self.selected_colleges)} More")
 
     def _build_app_layout(self):
         college = COLLEGES[self.selected_colleges[self.current_app_index]]
-        self.essay_rects = []
+        pl = self.persistent.profile_label or "Applicant"
+        sp = (self.persistent.species or "?").capitalize()
+        self.labels = [
+            Label(f"Application {self.current_app_index+1} of {len(self.selected_colleges)}  \u00b7  {college.name}",
+                  self.small_font, COLOR_TEXT_DIM, topleft=(80, 24)),
+            Label(f"Applicant: {sp}  |  Type: {pl}", self.tiny_font, COLOR_TEXT_LIGHT, topleft=(80, 76)),
+            Label("Select Essay Prompt:", self.font, COLOR_ACCENT_DARK, topleft=(80, 136)),
+        ]
+        self.essay_cards = []
         y = 170
-        for _ in college.essay_prompts:
-            self.essay_rects.append(pygame.Rect(80, y, LOGICAL_WIDTH - 160, 64))
+        for prompt in college.essay_prompts:
+            self.essay_cards.append(Card((80, y, LOGICAL_WIDTH - 160, 64),
+                                         content=self._essay_content(prompt), radius=8))
             y += 76
-        self.extra_rects = []
+        ya = self.essay_cards[-1].rect.bottom + 20 if self.essay_cards else 360
+        self.labels.append(Label("Select 2 Activities:", self.font, COLOR_ACCENT_DARK, topleft=(80, ya)))
+        self.extra_cards = []
         y += 28
-        for _ in college.extracurriculars:
-            self.extra_rects.append(pygame.Rect(80, y, LOGICAL_WIDTH - 160, 44))
+        for activity in college.extracurriculars:
+            self.extra_cards.append(Card((80, y, LOGICAL_WIDTH - 160, 44),
+                                         content=self._extra_content(activity), radius=6, bleed=8))
             y += 52
-        last_bottom = self.extra_rects[-1].bottom if self.extra_rects else y
-        submit_y = last_bottom + 20 + 32 + 68 + 90
-        self.submit_rect = pygame.Rect(0, 0, 360, 68)
-        self.submit_rect.center = (LOGICAL_WIDTH // 2, submit_y)
+        last_bottom = self.extra_cards[-1].rect.bottom if self.extra_cards else y
+        ys = last_bottom + 20 if self.extra_cards else 620
+        self.labels.append(Label("Personal Statement:", self.font, COLOR_ACCENT_DARK, topleft=(80, ys)))
+        # Three lines of statement; longer ones scroll
+        rows = 3 * self.small_font.get_linesize()
+        self.statement_rect = sr = pygame.Rect(80, last_bottom + 20 + 32, LOGICAL_WIDTH - 160, rows + 24)
+        self.statement_box = Panel(sr, radius=8)
+        self.statement_input = TextInput(sr.inflate(-32, -24), self.small_font, COLOR_TEXT,
+                                         max_length=MAX_STATEMENT_LENGTH)
+        self.statement_count = Label("", self.tiny_font, COLOR_TEXT_LIGHT, cached=False,
+                                     topright=(sr.right, sr.bottom+6))
+        self.statement_placeholder = Label("Begin typing your authentic narrative here\u2026",
+                                           self.tiny_font, COLOR_TEXT_LIGHT, topleft=(sr.x+16, sr.y+40))
+        submit_y = sr.bottom + 90
+        self.submit_button = Button((0, 0, 360, 68), "Submit Application", self.font)
+        self.submit_button.rect.center = (LOGICAL_WIDTH // 2, submit_y)
         self.app_essay_choice = 0
         self.app_extra_selected = set()
-        self.app_statement = ""
+        self._sync_apply()
+        self.router.clear()
+        for card in self.essay_cards:
+            self.router.add(card, on_click=self._choose_essay)
+        for card in self.extra_cards:
+            self.router.add(card, on_click=self._toggle_extra)
+        self.router.add(self.submit_button, on_click=lambda _: self._submit_application())
 
-    def handle_events(self, events):
-        if self.phase == "select": self._handle_select(events)
-        elif self.phase == "apply": self._handle_apply(events)
+    def _sync_apply(self):
+        """Reflect the essay/activity choices and statement text in the widgets."""
+        for i, card in enumerate(self.essay_cards):
+            card.set_selected(i == self.app_essay_choice)
+        for i, card in enumerate(self.extra_cards):
+            card.set_selected(i in self.app_extra_selected)
+        self._sync_statement()
 
-    def _handle_select(self, events):
-        for event in events:
-            if event.type == pygame.MOUSEBUTTONDOWN and event.button == 1:
-                for i, r in enumerate(self.college_rects):
-                    if r.collidepoint(event.pos):
-                        if i in self.selected_colleges: self.selected_colleges.remove(i)
-                        elif len(self.selected_colleges) < MAX_COLLEGE_APPS: self.selected_colleges.append(i)
-                if self.confirm_rect.collidepoint(event.pos) and len(self.selected_colleges) == MAX_COLLEGE_APPS:
-                    self.phase = "apply"
-                    self.current_app_index = 0
-                    self._build_app_layout()
+    def _sync_statement(self):
+        self.statement_count.set_text(f"{len(self.statement_input.text)}/{MAX_STATEMENT_LENGTH}")
+
+    def _build_processing(self):
+        cx = LOGICAL_WIDTH // 2
+        bw, bh = 520, 28
+        bx, by = (LOGICAL_WIDTH-bw)//2, LOGICAL_HEIGHT//2
+        self.labels = [Label("Submitting applications\u2026", self.title_font, COLOR_TEXT,
+                             topleft=(cx - 240, LOGICAL_HEIGHT//2 - 80))]
+        self.progress_bar = ProgressBar((bx, by, bw, bh))
+        self.process_label = Label(LOADING_SUBTEXTS[0], self.tiny_font, COLOR_TEXT_LIGHT, midtop=(cx, by + 48))
+
+    # ── Card content ──
+
+    def _college_content(self, college):
+        def paint(surface, r, state):
+            sel = state == "selected"
+            bd = COLOR_ACCENT if sel else COLOR_PANEL_BORDER
+            cb = pygame.Rect(r.x+24, r.y+24, 32, 32)
+            rounded_skin(COLOR_PANEL_BG, bd, 2, 4).draw(surface, cb)
+            if sel:
+                pygame.draw.line(surface, COLOR_ACCENT, (cb.x+6, cb.centery), (cb.centerx, cb.bottom-6), 3)
+                pygame.draw.line(surface, COLOR_ACCENT, (cb.centerx, cb.bottom-6), (cb.right-6, cb.y+6), 3)
+            surface.blit(render_with(self.font, college.name, COLOR_TEXT), (r.x+76, r.y+20))
+            surface.blit(render_with(self.tiny_font, college.motto, COLOR_ACCENT), (r.x+76, r.y+56))
+            surface.blit(render_with(self.small_font, college.tagline, COLOR_TEXT_DIM), (r.x+76, r.y+90))
+            ext = ", ".join(college.extracurriculars[:3]) + "\u2026"
+            surface.blit(render_with(self.tiny_font, ext, COLOR_TEXT_LIGHT), (r.x+76, r.y+130))
+        return paint
+
+    def _essay_content(self, prompt):
+        def paint(surface, r, state):
+            sel = state == "selected"
+            bd = COLOR_ACCENT if sel else COLOR_PANEL_BORDER
+            pygame.draw.circle(surface, bd, (r.x+28, r.centery), 12, 2)
+            if sel: pygame.draw.circle(surface, COLOR_ACCENT, (r.x+28, r.centery), 8)
+            pr = truncate(prompt, self.small_font, r.width-70)
+            surface.blit(render_with(self.small_font, pr, COLOR_TEXT if sel else COLOR_TEXT_DIM), (r.x+52, r.centery-14))
+        return paint
+
+    def _extra_content(self, activity):
+        def paint(surface, r, state):
+            sel = state == "selected"
+            bd = COLOR_ACCENT if sel else COLOR_PANEL_BORDER
+            cb = pygame.Rect(r.x+12, r.centery-12, 24, 24)
+            rounded_skin(COLOR_PANEL_BG, bd, 2, 4).draw(surface, cb)
+            if sel:
+                pygame.draw.line(surface, COLOR_ACCENT, (cb.x+4, cb.centery), (cb.centerx, cb.bottom-4), 3)
+                pygame.draw.line(surface, COLOR_ACCENT, (cb.centerx, cb.bottom-4), (cb.right-4, cb.y+4), 3)
+            surface.blit(render_with(self.small_font, activity,
+                                     COLOR_TEXT if sel else COLOR_TEXT_DIM), (r.x+48, r.centery-14))
+        return paint
 
-    def _handle_apply(self, events):
+    def handle_events(self, events):
+        if self.phase != "apply":
+            return
         for event in events:
-            if event.type == pygame.MOUSEBUTTONDOWN and event.button == 1:
-                for i, r in enumerate(self.essay_rects):
-                    if r.collidepoint(event.pos): self.app_essay_choice = i
-                for i, r in enumerate(self.extra_rects):
-                    if r.collidepoint(event.pos):
-                        if i in self.app_extra_selected: self.app_extra_selected.remove(i)
-                        elif len(self.app_extra_selected) < 2: self.app_extra_selected.add(i)
-                if self.submit_rect.collidepoint(event.pos): self._submit_application()
-            elif event.type == pygame.KEYDOWN:
-                if event.key == pygame.K_BACKSPACE: self.app_statement = self.app_statement[:-1]
-                elif event.key == pygame.K_RETURN and self.app_statement: self._submit_application()
-                elif event.unicode and len(self.app_statement) < 200 and event.unicode.isprintable():
-                    self.app_statement += event.unicode
+            if event.type == pygame.KEYDOWN:
+                damage = None
+                if event.key == pygame.K_BACKSPACE: damage = self.statement_input.backspace()
+                elif event.key == pygame.K_RETURN and self.statement_input.text:
+                    self._submit_application()
+                    return
+                elif event.unicode and event.unicode.isprintable():
+                    damage = self.statement_input.append(event.unicode)
+                if damage:
+                    old_count = self.statement_count.rect
+                    self._sync_statement()
+                    self.invalidate(damage)
+                    self.invalidate(old_count.union(self.statement_count.rect))
+
+    # ── Clicks ──
+
+    def _toggle_college(self, card):
+        i = self.college_cards.index(card)
+        if i in self.selected_colleges: self.selected_colleges.remove(i)
+        elif len(self.selected_colleges) < MAX_COLLEGE_APPS: self.selected_colleges.append(i)
+        else: return
+        old_button = self.confirm_button.bounds
+        self._sync_select()
+        self.invalidate(card.bounds)
+        self.invalidate(old_button.union(self.confirm_button.bounds))
+
+    def _begin_applications(self):
+        self.phase = "apply"
+        self.current_app_index = 0
+        self._build_app_layout()
+        self.invalidate()
+
+    def _choose_essay(self, card):
+        i = self.essay_cards.index(card)
+        if i != self.app_essay_choice:
+            self.invalidate(self.essay_cards[self.app_essay_choice].bounds)
+            self.invalidate(card.bounds)
+            self.app_essay_choice = i
+            self._sync_apply()
+
+    def _toggle_extra(self, card):
+        i = self.extra_cards.index(card)
+        if i in self.app_extra_selected: self.app_extra_selected.remove(i)
+        elif len(self.app_extra_selected) < 2: self.app_extra_selected.add(i)
+        else: return
+        self._sync_apply()
+        self.invalidate(card.bounds)
 
     def _submit_application(self):
         college = COLLEGES[self.selected_colleges[self.current_app_index]]
@@ -114,146 +280,74 @@ class CollegeAppScene(Scene):
             "college": college.name, "college_id": college.id,
             "essay_topic_index": self.app_essay_choice,
             "extracurricular_selections": list(self.app_extra_selected),
-            "personal_statement_length": len(self.app_statement),
+            "personal_statement_length": len(self.statement_input.text),
         })
         self.current_app_index += 1
         if self.current_app_index < len(self.selected_colleges):
             self._build_app_layout()
         else:
-            self.persistent["applications"] = self.applications
+            self.persistent.applications = self.applications
             self.phase = "processing"
             self.process_timer = 0
+            self.router.clear()
+            self._build_processing()
+        self.invalidate()
+
+    def is_animating(self):
+        # The 2 Hz cursor blink in the apply phase is served by the idle tick rate
+        return self.phase == "processing"
 
     def update(self, dt):
         if self.phase == "apply":
             self.app_cursor_timer += dt
-            self.app_cursor_visible = (self.app_cursor_timer % 1.0) < 0.5
+            visible = (self.app_cursor_timer % 1.0) < 0.5
+            if self.statement_input.set_caret_visible(visible):
+                self.invalidate(self.statement_input.caret_rect)
         elif self.phase == "processing":
             self.process_timer += dt
+            t = self.process_timer / 3.0
+            if t < 0.3: p = t/0.3*0.33
+            elif t < 0.45: p = 0.33
+            elif t < 0.65: p = 0.33 + (t-0.45)/0.2*0.33
+            elif t < 0.8: p = 0.66
+            else: p = 0.66 + (t-0.8)/0.2*0.34
+            if self.progress_bar.set_value(p):
+                self.invalidate(self.progress_bar.rect)
+            idx = min(int(self.process_timer), len(LOADING_SUBTEXTS)-1)
+            old_rect = self.process_label.rect
+            if self.process_label.set_text(LOADING_SUBTEXTS[idx]):
+                self.invalidate(old_rect.union(self.process_label.rect))
             if self.process_timer >= 3.0:
                 self.next_scene = "DECISION"
                 self.done = True
 
     def draw(self, surface):
         surface.fill(COLOR_BG)
+        for label in self.labels:
+            label.draw(surface)
         if self.phase == "select": self._draw_select(surface)
         elif self.phase == "apply": self._draw_apply(surface)
         elif self.phase == "processing": self._draw_processing(surface)
 
     def _draw_select(self, surface):
-        surface.blit(self.small_font.render(
-            "College Application Portal  \u00b7  Select 2 Institutions", True, COLOR_TEXT_DIM), (80, 30))
         pygame.draw.line(surface, COLOR_RULE_LINE, (80, 64), (LOGICAL_WIDTH - 80, 64), 2)
-        t = self.title_font.render("Where Will You Apply?", True, COLOR_ACCENT_DARK)
-        surface.blit(t, t.get_rect(center=(LOGICAL_WIDTH//2, 100)))
-        s = self.tiny_font.render(f"Select {MAX_COLLEGE_APPS} of {len(COLLEGES)} institutions.", True, COLOR_TEXT_LIGHT)
-        surface.blit(s, s.get_rect(center=(LOGICAL_WIDTH//2, 144)))
-
-        for i, college in enumerate(COLLEGES):
-            r = self.college_rects[i]
-            sel = i in self.selected_colleges
-            bg = COLOR_PANEL_HOVER if sel else COLOR_PANEL_BG
-            pygame.draw.rect(surface, bg, r, border_radius=10)
-            bd = COLOR_ACCENT if sel else COLOR_PANEL_BORDER
-            pygame.draw.rect(surface, bd, r, 3 if sel else 2, border_radius=10)
-            cb = pygame.Rect(r.x+24, r.y+24, 32, 32)
-            pygame.draw.rect(surface, COLOR_PANEL_BG, cb, border_radius=4)
-            pygame.draw.rect(surface, bd, cb, 2, border_radius=4)
-            if sel:
-                pygame.draw.line(surface, COLOR_ACCENT, (cb.x+6, cb.centery), (cb.centerx, cb.bottom-6), 3)
-                pygame.draw.line(surface, COLOR_ACCENT, (cb.centerx, cb.bottom-6), (cb.right-6, cb.y+6), 3)
-            surface.blit(self.font.render(college.name, True, COLOR_TEXT), (r.x+76, r.y+20))
-            surface.blit(self.tiny_font.render(college.motto, True, COLOR_ACCENT), (r.x+76, r.y+56))
-            surface.blit(self.small_font.render(college.tagline, True, COLOR_TEXT_DIM), (r.x+76, r.y+90))
-            ext = ", ".join(college.extracurriculars[:3]) + "\u2026"
-            surface.blit(self.tiny_font.render(ext, True, COLOR_TEXT_LIGHT), (r.x+76, r.y+130))
-
-        ok = len(self.selected_colleges) == MAX_COLLEGE_APPS
-        bg = COLOR_BUTTON_IDLE if ok else COLOR_BG_ALT
-        pygame.draw.rect(surface, bg, self.confirm_rect, border_radius=8)
-        pygame.draw.rect(surface, COLOR_ACCENT if ok else COLOR_PANEL_BORDER, self.confirm_rect, 2, border_radius=8)
-        lbl = "Begin Applications" if ok else f"Select {MAX_COLLEGE_APPS - len(self.selected_colleges)} More"
-        bt = self.font.render(lbl, True, COLOR_BUTTON_TEXT if ok else COLOR_TEXT_LIGHT)
-        surface.blit(bt, bt.get_rect(center=self.confirm_rect.center))
+        for card in self.college_cards:
+            card.draw(surface)
+        self.confirm_button.draw(surface)
 
     def _draw_apply(self, surface):
-        college = COLLEGES[self.selected_colleges[self.current_app_index]]
-        surface.blit(self.small_font.render(
-            f"Application {self.current_app_index+1} of {len(self.selected_colleges)}  \u00b7  {college.name}",
-            True, COLOR_TEXT_DIM), (80, 24))
         pygame.draw.line(surface, COLOR_RULE_LINE, (80, 56), (LOGICAL_WIDTH-80, 56), 2)
-
-        pl = self.persistent.get("profile_label", "Applicant")
-        sp = self.persistent.get("species", "?").capitalize()
-        surface.blit(self.tiny_font.render(f"Applicant: {sp}  |  Type: {pl}", True, COLOR_TEXT_LIGHT), (80, 76))
-
-        surface.blit(self.font.render("Select Essay Prompt:", True, COLOR_ACCENT_DARK), (80, 136))
-        for i, r in enumerate(self.essay_rects):
-            sel = (i == self.app_essay_choice)
-            bg = COLOR_PANEL_HOVER if sel else COLOR_PANEL_BG
-            pygame.draw.rect(surface, bg, r, border_radius=8)
-            bd = COLOR_ACCENT if sel else COLOR_PANEL_BORDER
-            pygame.draw.rect(surface, bd, r, 2, border_radius=8)
-            pygame.draw.circle(surface, bd, (r.x+28, r.centery), 12, 2)
-            if sel: pygame.draw.circle(surface, COLOR_ACCENT, (r.x+28, r.centery), 8)
-            pr = self._truncate(college.essay_prompts[i], self.small_font, r.width-70)
-            surface.blit(self.small_font.render(pr, True, COLOR_TEXT if sel else COLOR_TEXT_DIM), (r.x+52, r.centery-14))
-
-        ya = self.essay_rects[-1].bottom + 20 if self.essay_rects else 360
-        surface.blit(self.font.render("Select 2 Activities:", True, COLOR_ACCENT_DARK), (80, ya))
-        for i, r in enumerate(self.extra_rects):
-            sel = i in self.app_extra_selected
-            bg = COLOR_PANEL_HOVER if sel else COLOR_PANEL_BG
-            pygame.draw.rect(surface, bg, r, border_radius=6)
-            bd = COLOR_ACCENT if sel else COLOR_PANEL_BORDER
-            pygame.draw.rect(surface, bd, r, 2, border_radius=6)
-            cb = pygame.Rect(r.x+12, r.centery-12, 24, 24)
-            pygame.draw.rect(surface, COLOR_PANEL_BG, cb, border_radius=4)
-            pygame.draw.rect(surface, bd, cb, 2, border_radius=4)
-            if sel:
-                pygame.draw.line(surface, COLOR_ACCENT, (cb.x+4, cb.centery), (cb.centerx, cb.bottom-4), 3)
-                pygame.draw.line(surface, COLOR_ACCENT, (cb.centerx, cb.bottom-4), (cb.right-4, cb.y+4), 3)
-            surface.blit(self.small_font.render(college.extracurriculars[i], True,
-                         COLOR_TEXT if sel else COLOR_TEXT_DIM), (r.x+48, r.centery-14))
-
-        ys = self.extra_rects[-1].bottom + 20 if self.extra_rects else 620
-        surface.blit(self.font.render("Personal Statement:", True, COLOR_ACCENT_DARK), (80, ys))
-        sr = pygame.Rect(80, ys+32, LOGICAL_WIDTH-160, 68)
-        pygame.draw.rect(surface, COLOR_PANEL_BG, sr, border_radius=8)
-        pygame.draw.rect(surface, COLOR_PANEL_BORDER, sr, 2, border_radius=8)
-        dt = self.app_statement + ("|" if self.app_cursor_visible else "")
-        mc = (sr.width-32) // 14
-        surface.blit(self.small_font.render(dt[-mc:], True, COLOR_TEXT), (sr.x+16, sr.y+12))
-        surface.blit(self.tiny_font.render(f"{len(self.app_statement)}/200", True, COLOR_TEXT_LIGHT), (sr.right-70, sr.bottom+6))
-        if not self.app_statement:
-            surface.blit(self.tiny_font.render("Begin typing your authentic narrative here\u2026", True, COLOR_TEXT_LIGHT), (sr.x+16, sr.y+40))
-
-        pygame.draw.rect(surface, COLOR_BUTTON_IDLE, self.submit_rect, border_radius=8)
-        pygame.draw.rect(surface, COLOR_PANEL_BORDER, self.submit_rect, 2, border_radius=8)
-        sl = self.font.render("Submit Application", True, COLOR_BUTTON_TEXT)
-        surface.blit(sl, sl.get_rect(center=self.submit_rect.center))
+        for card in self.essay_cards:
+            card.draw(surface)
+        for card in self.extra_cards:
+            card.draw(surface)
+        self.statement_box.draw(surface)
+        self.statement_input.draw(surface)
+        self.statement_count.draw(surface)
+        if not self.statement_input.text:
+            self.statement_placeholder.draw(surface)
+        self.submit_button.draw(surface)
 
     def _draw_processing(self, surface):
-        cx = LOGICAL_WIDTH // 2
-        surface.blit(self.title_font.render("Submitting applications\u2026", True, COLOR_TEXT),
-                     (cx - 240, LOGICAL_HEIGHT//2 - 80))
-        bw, bh = 520, 28
-        bx, by = (LOGICAL_WIDTH-bw)//2, LOGICAL_HEIGHT//2
-        t = self.process_timer / 3.0
-        if t < 0.3: p = t/0.3*0.33
-        elif t < 0.45: p = 0.33
-        elif t < 0.65: p = 0.33 + (t-0.45)/0.2*0.33
-        elif t < 0.8: p = 0.66
-        else: p = 0.66 + (t-0.8)/0.2*0.34
-        p = min(p, 1.0)
-        pygame.draw.rect(surface, COLOR_PANEL_BORDER, (bx, by, bw, bh), border_radius=14)
-        fw = int(bw*p)
-        if fw > 0: pygame.draw.rect(surface, COLOR_ACCENT, (bx, by, fw, bh), border_radius=14)
-        idx = min(int(self.process_timer), len(LOADING_SUBTEXTS)-1)
-        sub = self.tiny_font.render(LOADING_SUBTEXTS[idx], True, COLOR_TEXT_LIGHT)
-        surface.blit(sub, (cx - sub.get_width()//2, by + 48))
-
-    def _truncate(self, text, font, max_w):
-        if font.size(text)[0] <= max_w: return text
-        while font.size(text + "\u2026")[0] > max_w and text: text = text[:-1]
-        return text + "\u2026"
+        self.progress_bar.draw(surface)
+        self.process_label.draw(surface)
@@ -1,15 +1,19 @@
 import os
 import math
-import random
 import pygame
 from src.scene import Scene
-from src.font_loader import get_font
+from src.assets import Manifest, prefetch
+from src.font_loader import get_font, render_with
+from src.rng import rng
+from src.ui import effects
+from src.ui.skins import rounded_skin
+from src.ui.widgets import Button, Card, Label, Panel
 from src.settings import (
     LOGICAL_WIDTH, LOGICAL_HEIGHT, COLOR_BG,
     COLOR_TEXT, COLOR_TEXT_DIM, COLOR_TEXT_LIGHT,
     COLOR_ACCENT, COLOR_ACCENT_DARK, COLOR_ACCENT_LIGHT,
     COLOR_PANEL_BG, COLOR_PANEL_BORDER, COLOR_PANEL_HOVER,
-    COLOR_BUTTON_TEXT, COLOR_RULE_LINE, SPRITE_DIR
+    COLOR_RULE_LINE, SPRITE_DIR, SIM_DT
 )
 from src.data.accessories import ACCESSORIES, ACCESSORY_LOOKUP, ACCESSORIES_BY_SLOT
 from src.entities.character import Character
@@ -68,7 +72,88 @@ COLOR_TITLE = (140, 85, 95)              # warm rose title
 COLOR_SPARKLE = (255, 220, 180)          # warm gold sparkle
 
 
+class WardrobeCard(Card):
+    """Accessory card: thumbnail, name and equipped badge. Lifts with a soft
+    shadow on hover; "selected" means equipped."""
+
+    bleed = 4
+    pointer_states = ("hover", "hover")
+
+    def __init__(self, rect, acc, thumb, name_font):
+        super().__init__(rect, radius=10)
+        self.acc = acc
+        self.thumb = thumb
+        self.name_font = name_font
+
+    def render(self):
+        state = self.state
+        is_equipped = state == "selected"
+        is_hover = state == "hover"
+        b = self.bleed
+        surf = pygame.Surface((self.rect.w + 2 * b, self.rect.h + 2 * b), pygame.SRCALPHA)
+
+        # Card styling
+        if is_equipped:
+            bg = COLOR_CARD_EQUIPPED
+            bc = COLOR_EQUIPPED_RING
+            bw = 3
+        elif is_hover:
+            bg = COLOR_CARD_HOVER
+            bc = (210, 170, 185)
+            bw = 2
+        else:
+            bg = COLOR_CARD_BG
+            bc = COLOR_CARD_BORDER
+            bw = 1
+
+        draw_rect = pygame.Rect(b, b - (3 if is_hover else 0), self.rect.w, self.rect.h)
+
+        # Card drop shadow
+        if is_equipped or is_hover:
+            surf.blit(effects.rect(draw_rect.size, (160, 130, 145), 30, radius=10),
+                      (draw_rect.x, draw_rect.y + 2))
+
+        # Card fill
+        rounded_skin(bg, radius=10).draw(surf, draw_rect)
+
+        # Inner thumbnail area background (subtle cream)
+        thumb_area_h = CARD_H - 30
+        thumb_bg = pygame.Rect(draw_rect.x + 4, draw_rect.y + 4,
+                               draw_rect.w - 8, thumb_area_h - 4)
+        rounded_skin((248, 243, 240), radius=7).draw(surf, thumb_bg)
+
+        # Card border
+        rounded_skin(border=bc, border_width=bw, radius=10).draw(surf, draw_rect)
+
+        # Thumbnail centered in upper part of card
+        thumb = self.thumb
+        if thumb:
+            thx = draw_rect.centerx - thumb.get_width() // 2
+            thy = draw_rect.y + 4 + thumb_area_h // 2 - thumb.get_height() // 2
+            surf.blit(thumb, (thx, thy))
+
+        # Item name label at bottom of card
+        name = render_with(self.name_font, self.acc.display_name,
+                           COLOR_TITLE if is_equipped else COLOR_ITEM_NAME)
+        surf.blit(name, (draw_rect.centerx - name.get_width() // 2, draw_rect.bottom - 22))
+
+        # Equipped indicator
+        if is_equipped:
+            dot_x = draw_rect.right - 14
+            dot_y = draw_rect.top + 14
+            # Outer glow
+            surf.blit(effects.circle(10, (240, 115, 120), 80), (dot_x - 10, dot_y - 10))
+            # Filled dot with white ring
+            pygame.draw.circle(surf, COLOR_EQUIPPED_DOT, (dot_x, dot_y), 7)
+            pygame.draw.circle(surf, (255, 255, 255), (dot_x, dot_y), 5)
+            pygame.draw.circle(surf, COLOR_EQUIPPED_DOT, (dot_x, dot_y), 3)
+        return surf
+
+
 class DressUpScene(Scene):
+    layers = ("background", "chrome")
+    upcoming = ("COLLEGE_APP",)
+
     def __init__(self):
         super().__init__()
         self.character = None
@@ -78,14 +163,19 @@ class DressUpScene(Scene):
         self.label_font = None
         self.name_font = None
         self.slot_row_rects = {}
-        self.item_btn_rects = {}
-        self.confirm_rect = None
-        self.reset_rect = None
-        self.exit_rect = None
+        self.item_cards = {}
+        self.slot_badges = []
+        self.confirm_button = None
+        self.reset_button = None
+        self.exit_button = None
+        self.title_label = None
+        self.frame_rect = None
+        self.mirror_rect = None
+        self.equipped_label = None
+        self.tooltip_panel = None
+        self.tooltip_label = None
         self.tooltip_text = ""
         self.tooltip_timer = 0
-        self.hover_item = None
-        self.mouse_logical = (0, 0)
         self.anim_time = 0.0
 
         # Sparkle particles
@@ -100,10 +190,13 @@ class DressUpScene(Scene):
         self.preview_scale = 1.0
         self.preview_w = 0
         self.preview_h = 0
+        # Loaded sprite sets per species, and in-progress loader generators
+        self.sprite_sets = {}
+        self.sprite_loaders = {}
 
     def startup(self, persistent):
         super().startup(persistent)
-        species = persistent.get("species", "cat")
+        species = persistent.species or "cat"
         self.character = Character(species)
         self.font = get_font(28, bold=True)
         self.small_font = get_font(22)
@@ -112,104 +205,168 @@ class DressUpScene(Scene):
         self.name_font = get_font(16)
         self.tooltip_text = ""
         self.tooltip_timer = 0
-        self.hover_item = None
         self.anim_time = 0.0
         self.sparkles = []
-        self._load_sprites()
+        self._use_sprites(species)
         self._build_layout()
 
+    def warm_up(self, persistent):
+        return self._sprite_task(persistent.species or "cat")
+
+    def _sprite_task(self, species):
+        """Return the generator loading species' sprites, or None if loaded."""
+        if species in self.sprite_sets:
+            return None
+        if species not in self.sprite_loaders:
+            self.sprite_loaders[species] = self._load_sprites(species)
+        return self.sprite_loaders[species]
+
+    def unload(self):
+        super().unload()
+        self.sprite_sets = {}
+        self.sprite_loaders = {}
+        self.base_surface = self.preview_base = None
+        self.overlay_cache = {}
+        self.standalone_cache = {}
+        self.thumb_surfaces = {}
+        self.item_cards = {}
+        self.slot_badges = []
+        self.sparkles = []
+        self.confirm_button = self.reset_button = self.exit_button = None
+        self.title_label = self.equipped_label = None
+        self.tooltip_panel = self.tooltip_label = None
+
     # ── Sprite Loading ──────────────────────────────────────────────
 
-    def _load_sprites(self):
-        species = self.character.species
+    def _use_sprites(self, species):
+        """Make the species' sprite set current, finishing any pending load first."""
+        task = self._sprite_task(species)
+        if task is not None:
+            for _ in task:
+                pass
+        sprites = self.sprite_sets[species]
+        self.base_surface = sprites["base_surface"]
+        self.preview_base = sprites["preview_base"]
+        self.overlay_cache = sprites["overlay_cache"]
+        self.standalone_cache = sprites["standalone_cache"]
+        self.thumb_surfaces = sprites["thumb_surfaces"]
+        self.preview_scale = sprites["preview_scale"]
+        self.preview_w = sprites["preview_w"]
+        self.preview_h = sprites["preview_h"]
+
+    def manifest(self, persistent):
+        return self._sprite_manifest(persistent.species or "cat")
+
+    def _sprite_manifest(self, species):
+        images = [self._base_path(species)]
+        for slot in BODY_FITTED_SLOTS:
+            images += [self._overlay_path(acc, species) for acc in ACCESSORIES_BY_SLOT.get(slot, [])]
+        for slot in STANDALONE_SLOTS:
+            images += [self._standalone_path(acc) for acc in ACCESSORIES_BY_SLOT.get(slot, [])]
+        return Manifest(images, fonts=[(28, True, False), (22, False, False), (44, True, False),
+                                       (22, True, False), (16, False, False)])
+
+    @staticmethod
+    def _base_path(species):
+        return os.path.join(SPRITE_DIR, "characters", f"{species}_base.png")
+
+    @staticmethod
+    def _overlay_path(acc, species):
+        """Per-animal sprite for a body-fitted accessory, else the universal one."""
+        per_animal = os.path.join(SPRITE_DIR, "accessories", f"{acc.sprite_key}_{species}.png")
+        if os.path.exists(per_animal):
+            return per_animal
+        return os.path.join(SPRITE_DIR, "accessories", f"{acc.sprite_key}.png")
+
+    @staticmethod
+    def _standalone_path(acc):
+        return os.path.join(SPRITE_DIR, "accessories", f"{acc.sprite_key}.png")
+
+    def _load_sprites(self, species):
+        """Generator that prefetches one species' sprites, then builds its
+        preview and thumbnails, yielding after each step so Game can spread
+        the work across frames."""
         anch = ANCHORS[species]
+        yield from prefetch(self._sprite_manifest(species), self.assets)
 
-        base_path = os.path.join(SPRITE_DIR, "characters", f"{species}_base.png")
-        try:
-            self.base_surface = pygame.image.load(base_path).convert_alpha()
-        except (pygame.error, FileNotFoundError):
-            self.base_surface = pygame.Surface((anch["w"], anch["h"]), pygame.SRCALPHA)
+        base_surface = self.image(self._base_path(species))
+        if base_surface is None:
+            base_surface = pygame.Surface((anch["w"], anch["h"]), pygame.SRCALPHA)
+        yield
 
-        raw_w, raw_h = self.base_surface.get_size()
-        self.preview_scale = CHAR_PREVIEW_H / raw_h
-        self.preview_w = max(1, int(raw_w * self.preview_scale))
-        self.preview_h = CHAR_PREVIEW_H
-        self.preview_base = pygame.transform.scale(
-            self.base_surface, (self.preview_w, self.preview_h))
+        raw_w, raw_h = base_surface.get_size()
+        preview_scale = CHAR_PREVIEW_H / raw_h
+        preview_w = max(1, int(raw_w * preview_scale))
+        preview_h = CHAR_PREVIEW_H
+        preview_base = pygame.transform.scale(base_surface, (preview_w, preview_h))
 
-        self.overlay_cache = {}
+        overlay_cache = {}
         for slot in BODY_FITTED_SLOTS:
             for acc in ACCESSORIES_BY_SLOT.get(slot, []):
-                per_animal_path = os.path.join(SPRITE_DIR, "accessories", f"{acc.sprite_key}_{species}.png")
-                universal_path = os.path.join(SPRITE_DIR, "accessories", f"{acc.sprite_key}.png")
-                raw = None
-                for try_path in (per_animal_path, universal_path):
-                    try:
-                        raw = pygame.image.load(try_path).convert_alpha()
-                        break
-                    except (pygame.error, FileNotFoundError):
-                        continue
-                if raw:
-                    self.overlay_cache[acc.id] = raw
-                else:
-                    self.overlay_cache[acc.id] = pygame.Surface(
-                        (anch["w"], anch["h"]), pygame.SRCALPHA)
+                raw = self.image(self._overlay_path(acc, species))
+                if raw is None:
+                    raw = pygame.Surface((anch["w"], anch["h"]), pygame.SRCALPHA)
+                overlay_cache[acc.id] = raw
 
-        self.standalone_cache = {}
+        standalone_cache = {}
         for slot in STANDALONE_SLOTS:
             for acc in ACCESSORIES_BY_SLOT.get(slot, []):
-                path = os.path.join(SPRITE_DIR, "accessories", f"{acc.sprite_key}.png")
-                try:
-                    raw = pygame.image.load(path).convert_alpha()
-                    self.standalone_cache[acc.id] = raw
-                except (pygame.error, FileNotFoundError):
-                    self.standalone_cache[acc.id] = pygame.Surface((1, 1), pygame.SRCALPHA)
-
-        self._build_thumbnails()
+                raw = self.image(self._standalone_path(acc))
+                if raw is None:
+                    raw = pygame.Surface((1, 1), pygame.SRCALPHA)
+                standalone_cache[acc.id] = raw
 
-    def _build_thumbnails(self):
-        """Auto-crop each sprite and scale to thumbnail size.
+        thumb_surfaces = {}
+        for acc in ACCESSORIES:
+            thumb_surfaces[acc.id] = self._build_thumbnail(
+                acc, base_surface, overlay_cache, standalone_cache)
+            yield
+
+        self.sprite_sets[species] = {
+            "base_surface": base_surface, "preview_base": preview_base,
+            "overlay_cache": overlay_cache, "standalone_cache": standalone_cache,
+            "thumb_surfaces": thumb_surfaces, "preview_scale": preview_scale,
+            "preview_w": preview_w, "preview_h": preview_h,
+        }
+        self.sprite_loaders.pop(species, None)
+
+    def _build_thumbnail(self, acc, base_surface, overlay_cache, standalone_cache):
+        """Auto-crop an accessory sprite and scale it to thumbnail size.
         For body-fitted overlays, compose them ON the base character for a better preview."""
-        self.thumb_surfaces = {}
         pad = 6
         max_dim = THUMB_SIZE - pad * 2
 
-        for acc in ACCESSORIES:
-            is_body = acc.slot in BODY_FITTED_SLOTS
-            if is_body and acc.id in self.overlay_cache:
-                # For clothing, show it ON the character for a better preview
-                preview = self.base_surface.copy()
-                preview.blit(self.overlay_cache[acc.id], (0, 0))
-                raw = preview
-            elif acc.id in self.standalone_cache:
-                raw = self.standalone_cache[acc.id]
-            elif acc.id in self.overlay_cache:
-                raw = self.overlay_cache[acc.id]
-            else:
-                self.thumb_surfaces[acc.id] = pygame.Surface(
-                    (max_dim, max_dim), pygame.SRCALPHA)
-                continue
-
-            bbox = self._find_opaque_bbox(raw)
-            if not bbox:
-                self.thumb_surfaces[acc.id] = pygame.Surface(
-                    (max_dim, max_dim), pygame.SRCALPHA)
-                continue
-
-            l, t, r, b = bbox
-            cw, ch = r - l, b - t
-
-            cropped = pygame.Surface((cw, ch), pygame.SRCALPHA)
-            cropped.blit(raw, (-l, -t))
-
-            if cw >= ch:
-                new_w = max_dim
-                new_h = max(1, int(ch * max_dim / cw))
-            else:
-                new_h = max_dim
-                new_w = max(1, int(cw * max_dim / ch))
-
-            self.thumb_surfaces[acc.id] = pygame.transform.scale(cropped, (new_w, new_h))
+        is_body = acc.slot in BODY_FITTED_SLOTS
+        if is_body and acc.id in overlay_cache:
+            # For clothing, show it ON the character for a better preview
+            preview = base_surface.copy()
+            preview.blit(overlay_cache[acc.id], (0, 0))
+            raw = preview
+        elif acc.id in standalone_cache:
+            raw = standalone_cache[acc.id]
+        elif acc.id in overlay_cache:
+            raw = overlay_cache[acc.id]
+        else:
+            return pygame.Surface((max_dim, max_dim), pygame.SRCALPHA)
+
+        bbox = self._find_opaque_bbox(raw)
+        if not bbox:
+            return pygame.Surface((max_dim, max_dim), pygame.SRCALPHA)
+
+        l, t, r, b = bbox
+        cw, ch = r - l, b - t
+
+        cropped = pygame.Surface((cw, ch), pygame.SRCALPHA)
+        cropped.blit(raw, (-l, -t))
+
+        if cw >= ch:
+            new_w = max_dim
+            new_h = max(1, int(ch * max_dim / cw))
+        else:
+            new_h = max_dim
+            new_w = max(1, int(cw * max_dim / ch))
+
+        return pygame.transform.scale(cropped, (new_w, new_h))
 
     @staticmethod
     def _find_opaque_bbox(surface):
@@ -225,7 +382,8 @@ class DressUpScene(Scene):
 
     def _build_layout(self):
         self.slot_row_rects = {}
-        self.item_btn_rects = {}
+        self.item_cards = {}
+        self.slot_badges = []
 
         left_margin = 28
         row_w = 560
@@ -235,7 +393,14 @@ class DressUpScene(Scene):
 
         for i, slot in enumerate(SLOT_ORDER):
             ry = start_y + i * (row_h + row_gap)
-            self.slot_row_rects[slot] = pygame.Rect(left_margin, ry, row_w, row_h)
+            row_rect = self.slot_row_rects[slot] = pygame.Rect(left_margin, ry, row_w, row_h)
+
+            # Slot label badge (left side, vertically centered)
+            badge = Panel((row_rect.x + 6, row_rect.centery - 15, 88, 30), fill=COLOR_SHELF_LABEL_BG,
+                          border=COLOR_SHELF_BORDER, border_width=1, radius=15)
+            self.slot_badges.append(badge)
+            self.slot_badges.append(Label(SLOT_LABELS[slot], self.label_font, COLOR_TITLE,
+                                          center=badge.rect.center))
 
             items = ACCESSORIES_BY_SLOT.get(slot, [])
             label_w = 100
@@ -247,7 +412,8 @@ class DressUpScene(Scene):
             for j, acc in enumerate(items):
                 bx = btn_start_x + j * (CARD_W + 10)
                 by = ry + (row_h - CARD_H) // 2
-                self.item_btn_rects[acc.id] = pygame.Rect(bx, by, CARD_W, CARD_H)
+                self.item_cards[acc.id] = WardrobeCard((bx, by, CARD_W, CARD_H), acc,
+                                                       self.thumb_surfaces.get(acc.id), self.name_font)
 
         # Buttons below shelf rows
         btn_w = 180
@@ -259,71 +425,93 @@ class DressUpScene(Scene):
         total_btns = btn_w * 3 + btn_gap * 2
         btns_start = left_margin + (row_w - total_btns) // 2
 
-        self.reset_rect = pygame.Rect(btns_start, buttons_y, btn_w, btn_h)
-        self.confirm_rect = pygame.Rect(btns_start + btn_w + btn_gap, buttons_y, btn_w, btn_h)
-        self.exit_rect = pygame.Rect(btns_start + (btn_w + btn_gap) * 2, buttons_y, btn_w, btn_h)
+        def pill(x, text, idle_color, hover_color, font):
+            return Button((x, buttons_y, btn_w, btn_h), text, font,
+                          fills={"idle": idle_color, "hover": hover_color, "pressed": hover_color},
+                          borders={"idle": COLOR_SHELF_BORDER}, border_width=1,
+                          radius=btn_h // 2, gloss=True)
+
+        self.reset_button = pill(btns_start, "Reset",
+                                 COLOR_BTN_RESET, COLOR_BTN_RESET_HV, self.small_font)
+        self.confirm_button = pill(btns_start + btn_w + btn_gap, "Save & Continue",
+                                   COLOR_BTN_CONFIRM, COLOR_BTN_CONFIRM_HV, self.font)
+        self.exit_button = pill(btns_start + (btn_w + btn_gap) * 2, "Exit",
+                                COLOR_BTN_EXIT, COLOR_BTN_EXIT_HV, self.small_font)
+
+        species_name = self.character.species.capitalize()
+        self.title_label = Label(f"Dress Up Your {species_name}!", self.title_font, COLOR_TITLE,
+                                 midtop=(LOGICAL_WIDTH // 2, 22))
+        self.equipped_label = Label("", self.small_font, COLOR_TEXT_DIM, cached=False)
+        self.tooltip_label = Label("", self.small_font, COLOR_TITLE, cached=False,
+                                   midleft=(54, LOGICAL_HEIGHT - 28))
+        self.tooltip_panel = Panel((40, LOGICAL_HEIGHT - 44, 28, 32), fill=(255, 245, 242),
+                                   border=COLOR_SHELF_BORDER, border_width=1, radius=16)
+
+        # Mirror frame for the character preview, below the title rule
+        panel_x = 608
+        panel_y = self.title_label.rect.bottom + 6 + 8
+        self.frame_rect = pygame.Rect(panel_x, panel_y, LOGICAL_WIDTH - panel_x - 20,
+                                      LOGICAL_HEIGHT - panel_y - 60)
+        self.mirror_rect = self.frame_rect.inflate(-20, -20)
+        self.invalidate_layer("chrome")
+
+        self._sync_cards()
+        for card in self.item_cards.values():
+            self.router.add(card, on_click=self._toggle_item)
+        self.router.add(self.reset_button, on_click=lambda _: self._reset())
+        self.router.add(self.confirm_button, on_click=lambda _: self._confirm())
+        self.router.add(self.exit_button, on_click=lambda _: self._exit())
 
     # ── Events ──────────────────────────────────────────────────────
 
     def handle_events(self, events):
         for event in events:
-            if event.type == pygame.MOUSEBUTTONDOWN and event.button == 1:
-                pos = event.pos
-                if self.confirm_rect.collidepoint(pos):
-                    self._confirm()
-                    return
-                if self.reset_rect.collidepoint(pos):
-                    self._reset()
-                    return
-                if self.exit_rect.collidepoint(pos):
-                    self.next_scene = "MAIN_MENU"
-                    self.done = True
-                    return
-                for acc_id, rect in self.item_btn_rects.items():
-                    if rect.collidepoint(pos):
-                        acc = ACCESSORY_LOOKUP[acc_id]
-                        if self.character.equipped[acc.slot] == acc_id:
-                            self.character.unequip(acc.slot)
-                            self.tooltip_text = f"Removed {acc.display_name}"
-                        else:
-                            self.character.equip(acc)
-                            self.tooltip_text = f"\u201c{acc.flavor_text}\u201d"
-                            self._spawn_sparkles(rect.centerx, rect.centery, 6)
-                        self.tooltip_timer = 2.5
-                        return
-
-            elif event.type == pygame.MOUSEMOTION:
-                pos = event.pos
-                self.mouse_logical = pos
-                self.hover_item = None
-                for acc_id, rect in self.item_btn_rects.items():
-                    if rect.collidepoint(pos):
-                        self.hover_item = acc_id
-                        break
-
-            elif event.type == pygame.KEYDOWN and event.key == pygame.K_RETURN:
+            if event.type == pygame.KEYDOWN and event.key == pygame.K_RETURN:
                 self._confirm()
 
+    def _toggle_item(self, card):
+        acc = card.acc
+        if self.character.equipped[acc.slot] == acc.id:
+            self.character.unequip(acc.slot)
+            self.tooltip_text = f"Removed {acc.display_name}"
+        else:
+            self.character.equip(acc)
+            self.tooltip_text = f"\u201c{acc.flavor_text}\u201d"
+            self._spawn_sparkles(card.rect.centerx, card.rect.centery, 6)
+        self.tooltip_timer = 2.5
+        self._sync_cards()
+
+    def _sync_cards(self):
+        """Mark the cards of equipped accessories as selected."""
+        equipped = self.character.equipped
+        for acc_id, card in self.item_cards.items():
+            card.set_selected(equipped[card.acc.slot] == acc_id)
+
+    def _exit(self):
+        self.next_scene = "MAIN_MENU"
+        self.done = True
+
     def _confirm(self):
-        self.persistent["species"] = self.character.species
-        self.persistent["equipped_accessories"] = dict(self.character.equipped)
-        self.persistent["owned_accessories"] = list(self.character.owned_accessories)
-        self.persistent["cosmetic_tags"] = self.character.get_cosmetic_tags(ACCESSORY_LOOKUP)
+        self.persistent.species = self.character.species
+        self.persistent.equipped_accessories = dict(self.character.equipped)
+        self.persistent.owned_accessories = list(self.character.owned_accessories)
+        self.persistent.cosmetic_tags = self.character.get_cosmetic_tags(ACCESSORY_LOOKUP)
         self.next_scene = "COLLEGE_APP"
         self.done = True
 
     def _reset(self):
         for slot in SLOT_ORDER:
             self.character.unequip(slot)
+        self._sync_cards()
         self.tooltip_text = "Outfit reset!"
         self.tooltip_timer = 1.5
 
     def _spawn_sparkles(self, x, y, count):
         for _ in range(count):
-            angle = random.uniform(0, math.pi * 2)
-            speed = random.uniform(30, 80)
-            life = random.uniform(0.4, 0.9)
-            size = random.randint(2, 5)
+            angle = rng.uniform(0, math.pi * 2)
+            speed = rng.uniform(30, 80)
+            life = rng.uniform(0.4, 0.9)
+            size = rng.randint(2, 5)
             self.sparkles.append({
                 "x": float(x), "y": float(y),
                 "vx": math.cos(angle) * speed,
@@ -332,6 +520,10 @@ class DressUpScene(Scene):
                 "size": size,
             })
 
+    def is_animating(self):
+        # The mirror frame's orbiting sparkle accents never stop moving
+        return True
+
     def update(self, dt):
         self.anim_time += dt
 
@@ -353,196 +545,106 @@ class DressUpScene(Scene):
 
     # ── Drawing ─────────────────────────────────────────────────────
 
-    def draw(self, surface):
-        # Background with subtle horizontal stripes
-        surface.fill(COLOR_DRESS_BG)
-        for y in range(0, LOGICAL_HEIGHT, 6):
-            if (y // 6) % 2 == 0:
-                pygame.draw.line(surface, COLOR_DRESS_BG2, (0, y), (LOGICAL_WIDTH, y))
-
-        # Soft decorative border
-        border = pygame.Rect(8, 8, LOGICAL_WIDTH - 16, LOGICAL_HEIGHT - 16)
-        pygame.draw.rect(surface, COLOR_SHELF_BORDER, border, 2, border_radius=12)
-        inner_border = pygame.Rect(12, 12, LOGICAL_WIDTH - 24, LOGICAL_HEIGHT - 24)
-        pygame.draw.rect(surface, (240, 225, 230), inner_border, 1, border_radius=10)
-
-        # Title
-        species_name = self.character.species.capitalize()
-        title_text = f"Dress Up Your {species_name}!"
-        title = self.title_font.render(title_text, True, COLOR_TITLE)
-        tx = LOGICAL_WIDTH // 2 - title.get_width() // 2
-        ty = 22
-
-        # Title decorative line with dots
-        line_y = ty + title.get_height() + 6
-        pygame.draw.line(surface, COLOR_SHELF_BORDER,
-                         (50, line_y), (LOGICAL_WIDTH - 50, line_y), 1)
-        # Small decorative diamonds flanking title
-        for offset in [-1, 1]:
-            dx = tx + (0 if offset == -1 else title.get_width()) + offset * 18
-            dy = ty + title.get_height() // 2
-            pts = [(dx, dy - 5), (dx + 5, dy), (dx, dy + 5), (dx - 5, dy)]
-            pygame.draw.polygon(surface, COLOR_EQUIPPED_RING, pts)
+    def draw_layer(self, name, surface):
+        if name == "background":
+            # Background with subtle horizontal stripes
+            surface.fill(COLOR_DRESS_BG)
+            for y in range(0, LOGICAL_HEIGHT, 6):
+                if (y // 6) % 2 == 0:
+                    pygame.draw.line(surface, COLOR_DRESS_BG2, (0, y), (LOGICAL_WIDTH, y))
+
+            # Soft decorative border
+            border = pygame.Rect(8, 8, LOGICAL_WIDTH - 16, LOGICAL_HEIGHT - 16)
+            rounded_skin(border=COLOR_SHELF_BORDER, border_width=2, radius=12).draw(surface, border)
+            inner_border = pygame.Rect(12, 12, LOGICAL_WIDTH - 24, LOGICAL_HEIGHT - 24)
+            rounded_skin(border=(240, 225, 230), border_width=1, radius=10).draw(
+                surface, inner_border)
+        elif name == "chrome":
+            self._draw_title(surface)
+            self._draw_shelves(surface)
+            self._draw_mirror_frame(surface)
 
-        surface.blit(title, (tx, ty))
+    def draw(self, surface):
+        self.composite_layers(surface)
 
-        # Wardrobe (left side)
-        self._draw_wardrobe(surface)
+        # Item cards with thumbnails and names
+        for card in self.item_cards.values():
+            card.draw(surface)
 
-        # Character preview (right side) with decorative mirror frame
-        self._draw_character_panel(surface, line_y)
+        # Character preview (right side) inside the mirror frame
+        self._draw_character_panel(surface)
 
         # Bottom buttons
-        ml = self.mouse_logical
-        self._draw_pill_button(surface, self.reset_rect, "Reset", ml,
-                               COLOR_BTN_RESET, COLOR_BTN_RESET_HV)
-        self._draw_pill_button(surface, self.confirm_rect, "Save & Continue", ml,
-                               COLOR_BTN_CONFIRM, COLOR_BTN_CONFIRM_HV, bold=True)
-        self._draw_pill_button(surface, self.exit_rect, "Exit", ml,
-                               COLOR_BTN_EXIT, COLOR_BTN_EXIT_HV)
+        self.reset_button.draw(surface)
+        self.confirm_button.draw(surface)
+        self.exit_button.draw(surface)
 
         # Tooltip as floating pill
         if self.tooltip_text:
-            tt_font = self.small_font
-            tt = tt_font.render(self.tooltip_text, True, COLOR_TITLE)
-            tw = tt.get_width() + 28
-            th = 32
-            tx_pos = 40
-            ty_pos = LOGICAL_HEIGHT - 44
-            pill = pygame.Rect(tx_pos, ty_pos, tw, th)
-            pygame.draw.rect(surface, (255, 245, 242), pill, border_radius=16)
-            pygame.draw.rect(surface, COLOR_SHELF_BORDER, pill, 1, border_radius=16)
-            surface.blit(tt, (tx_pos + 14, ty_pos + th // 2 - tt.get_height() // 2))
+            self.tooltip_label.set_text(self.tooltip_text)
+            self.tooltip_panel.rect.width = self.tooltip_label.rect.width + 28
+            self.tooltip_panel.draw(surface)
+            self.tooltip_label.draw(surface)
 
-        # Sparkle particles
+        # Sparkle particles, extrapolated by the part of a sim step not yet run
+        lead = self.frame_alpha * SIM_DT
         for s in self.sparkles:
             alpha = int(255 * (s["life"] / s["max_life"]))
             sz = s["size"]
-            sparkle_surf = pygame.Surface((sz * 2, sz * 2), pygame.SRCALPHA)
-            color = (*COLOR_SPARKLE, alpha)
-            pygame.draw.circle(sparkle_surf, color, (sz, sz), sz)
-            surface.blit(sparkle_surf, (int(s["x"]) - sz, int(s["y"]) - sz))
+            sparkle_surf = effects.circle(sz, COLOR_SPARKLE, alpha)
+            sx = int(s["x"] + s["vx"] * lead)
+            sy = int(s["y"] + s["vy"] * lead)
+            surface.blit(sparkle_surf, (sx - sz, sy - sz))
+
+    def _draw_title(self, surface):
+        title = self.title_label
+        tx, ty = title.rect.topleft
+
+        # Title decorative line with dots
+        line_y = title.rect.bottom + 6
+        pygame.draw.line(surface, COLOR_SHELF_BORDER,
+                         (50, line_y), (LOGICAL_WIDTH - 50, line_y), 1)
+        # Small decorative diamonds flanking title
+        for offset in [-1, 1]:
+            dx = tx + (0 if offset == -1 else title.rect.width) + offset * 18
+            dy = ty + title.rect.height // 2
+            pts = [(dx, dy - 5), (dx + 5, dy), (dx, dy + 5), (dx - 5, dy)]
+            pygame.draw.polygon(surface, COLOR_EQUIPPED_RING, pts)
 
-    def _draw_wardrobe(self, surface):
+        title.draw(surface)
+
+    def _draw_shelves(self, surface):
         for slot in SLOT_ORDER:
             row_rect = self.slot_row_rects[slot]
 
             # Shelf row background
-            pygame.draw.rect(surface, COLOR_SHELF_PASTEL, row_rect, border_radius=12)
+            rounded_skin(COLOR_SHELF_PASTEL, radius=12).draw(surface, row_rect)
             # Top highlight edge
             highlight = pygame.Rect(row_rect.x + 4, row_rect.y + 2, row_rect.w - 8, 2)
-            pygame.draw.rect(surface, (252, 244, 247), highlight, border_radius=1)
+            rounded_skin((252, 244, 247), radius=1).draw(surface, highlight)
             # Bottom subtle shadow edge
             shadow_edge = pygame.Rect(row_rect.x + 4, row_rect.bottom - 3, row_rect.w - 8, 2)
-            shadow_surf = pygame.Surface((shadow_edge.w, shadow_edge.h), pygame.SRCALPHA)
-            shadow_surf.fill((180, 160, 170, 40))
-            surface.blit(shadow_surf, shadow_edge)
+            surface.blit(effects.rect(shadow_edge.size, (180, 160, 170), 40), shadow_edge)
             # Border
-            pygame.draw.rect(surface, COLOR_SHELF_BORDER, row_rect, 1, border_radius=12)
+            rounded_skin(border=COLOR_SHELF_BORDER, border_width=1, radius=12).draw(
+                surface, row_rect)
 
-            # Slot label badge (left side, vertically centered)
-            label_text = SLOT_LABELS[slot]
-            badge_w = 88
-            badge_h = 30
-            badge_x = row_rect.x + 6
-            badge_y = row_rect.centery - badge_h // 2
-            badge_rect = pygame.Rect(badge_x, badge_y, badge_w, badge_h)
-            pygame.draw.rect(surface, COLOR_SHELF_LABEL_BG, badge_rect, border_radius=15)
-            pygame.draw.rect(surface, COLOR_SHELF_BORDER, badge_rect, 1, border_radius=15)
-
-            label = self.label_font.render(label_text, True, COLOR_TITLE)
-            surface.blit(label, (badge_x + badge_w // 2 - label.get_width() // 2,
-                                 badge_y + badge_h // 2 - label.get_height() // 2))
-
-            # Item cards with thumbnails and names
-            items = ACCESSORIES_BY_SLOT.get(slot, [])
-            for acc in items:
-                rect = self.item_btn_rects[acc.id]
-                is_equipped = (self.character.equipped[slot] == acc.id)
-                is_hover = (self.hover_item == acc.id)
-
-                # Card styling
-                if is_equipped:
-                    bg = COLOR_CARD_EQUIPPED
-                    bc = COLOR_EQUIPPED_RING
-                    bw = 3
-                elif is_hover:
-                    bg = COLOR_CARD_HOVER
-                    bc = (210, 170, 185)
-                    bw = 2
-                else:
-                    bg = COLOR_CARD_BG
-                    bc = COLOR_CARD_BORDER
-                    bw = 1
-
-                draw_rect = rect.copy()
-                if is_hover and not is_equipped:
-                    draw_rect.y -= 3
-
-                # Card drop shadow
-                if is_equipped or is_hover:
-                    shadow = pygame.Surface((draw_rect.w + 4, draw_rect.h + 4), pygame.SRCALPHA)
-                    pygame.draw.rect(shadow, (160, 130, 145, 30),
-                                     (2, 3, draw_rect.w, draw_rect.h), border_radius=10)
-                    surface.blit(shadow, (draw_rect.x - 2, draw_rect.y - 1))
-
-                # Card fill
-                pygame.draw.rect(surface, bg, draw_rect, border_radius=10)
-
-                # Inner thumbnail area background (subtle cream)
-                thumb_area_h = CARD_H - 30
-                thumb_bg = pygame.Rect(draw_rect.x + 4, draw_rect.y + 4,
-                                       draw_rect.w - 8, thumb_area_h - 4)
-                pygame.draw.rect(surface, (248, 243, 240), thumb_bg, border_radius=7)
-
-                # Card border
-                pygame.draw.rect(surface, bc, draw_rect, bw, border_radius=10)
-
-                # Thumbnail centered in upper part of card
-                thumb = self.thumb_surfaces.get(acc.id)
-                if thumb:
-                    thx = draw_rect.centerx - thumb.get_width() // 2
-                    thy = draw_rect.y + 4 + thumb_area_h // 2 - thumb.get_height() // 2
-                    surface.blit(thumb, (thx, thy))
-
-                # Item name label at bottom of card
-                name = self.name_font.render(acc.display_name, True,
-                                             COLOR_TITLE if is_equipped else COLOR_ITEM_NAME)
-                name_x = draw_rect.centerx - name.get_width() // 2
-                name_y = draw_rect.bottom - 22
-                surface.blit(name, (name_x, name_y))
-
-                # Equipped indicator
-                if is_equipped:
-                    dot_x = draw_rect.right - 14
-                    dot_y = draw_rect.top + 14
-                    # Outer glow
-                    glow = pygame.Surface((20, 20), pygame.SRCALPHA)
-                    pygame.draw.circle(glow, (240, 115, 120, 80), (10, 10), 10)
-                    surface.blit(glow, (dot_x - 10, dot_y - 10))
-                    # Filled dot with white ring
-                    pygame.draw.circle(surface, COLOR_EQUIPPED_DOT, (dot_x, dot_y), 7)
-                    pygame.draw.circle(surface, (255, 255, 255), (dot_x, dot_y), 5)
-                    pygame.draw.circle(surface, COLOR_EQUIPPED_DOT, (dot_x, dot_y), 3)
-
-    def _draw_character_panel(self, surface, top_y):
-        """Draw the character preview in a decorative mirror-like frame."""
-        panel_x = 608
-        panel_y = top_y + 8
-        panel_w = LOGICAL_WIDTH - panel_x - 20
-        panel_h = LOGICAL_HEIGHT - panel_y - 60
+        for badge in self.slot_badges:
+            badge.draw(surface)
+
+    def _draw_mirror_frame(self, surface):
+        """Draw the decorative mirror-like frame around the character preview."""
+        frame_rect = self.frame_rect
 
         # Mirror frame (outer)
-        frame_rect = pygame.Rect(panel_x, panel_y, panel_w, panel_h)
-        pygame.draw.rect(surface, COLOR_MIRROR_FRAME, frame_rect, border_radius=16)
+        rounded_skin(COLOR_MIRROR_FRAME, radius=16).draw(surface, frame_rect)
 
         # Inner frame border
-        inner = pygame.Rect(panel_x + 6, panel_y + 6, panel_w - 12, panel_h - 12)
-        pygame.draw.rect(surface, COLOR_MIRROR_INNER, inner, border_radius=12)
+        inner = frame_rect.inflate(-12, -12)
+        rounded_skin(COLOR_MIRROR_INNER, radius=12).draw(surface, inner)
 
         # Mirror surface (light bg)
-        mirror = pygame.Rect(panel_x + 10, panel_y + 10, panel_w - 20, panel_h - 20)
-        pygame.draw.rect(surface, COLOR_MIRROR_BG, mirror, border_radius=10)
+        rounded_skin(COLOR_MIRROR_BG, radius=10).draw(surface, self.mirror_rect)
 
         # Decorative corner ornaments on frame
         ornament_size = 8
@@ -556,6 +658,11 @@ class DressUpScene(Scene):
                    (corner[0] - ornament_size, corner[1])]
             pygame.draw.polygon(surface, COLOR_ACCENT_LIGHT, pts)
 
+    def _draw_character_panel(self, surface):
+        """Draw the character preview, item count and floating accents in the mirror."""
+        frame_rect = self.frame_rect
+        mirror = self.mirror_rect
+
         # Compose and draw the character
         comp = self._compose_character()
         cx = mirror.x + mirror.w // 2 - self.preview_w // 2
@@ -564,42 +671,18 @@ class DressUpScene(Scene):
 
         # Equipped count label below character
         equipped_count = sum(1 for v in self.character.equipped.values() if v)
-        eq_text = self.small_font.render(
-            f"{equipped_count}/5 items equipped", True, COLOR_TEXT_DIM)
-        surface.blit(eq_text, (mirror.x + mirror.w // 2 - eq_text.get_width() // 2,
-                               mirror.bottom - 32))
+        self.equipped_label.set_text(f"{equipped_count}/5 items equipped")
+        self.equipped_label.move(midtop=(mirror.x + mirror.w // 2, mirror.bottom - 32))
+        self.equipped_label.draw(surface)
 
         # Animated sparkle accents on frame (subtle floating dots)
         t = self.anim_time
         for i in range(4):
             angle = t * 0.5 + i * math.pi / 2
-            sx = frame_rect.centerx + int(math.cos(angle) * (panel_w // 2 - 8))
-            sy = frame_rect.centery + int(math.sin(angle) * (panel_h // 2 - 8))
+            sx = frame_rect.centerx + int(math.cos(angle) * (frame_rect.w // 2 - 8))
+            sy = frame_rect.centery + int(math.sin(angle) * (frame_rect.h // 2 - 8))
             alpha = int(128 + 127 * math.sin(t * 2 + i))
-            sparkle = pygame.Surface((6, 6), pygame.SRCALPHA)
-            pygame.draw.circle(sparkle, (*COLOR_SPARKLE, alpha), (3, 3), 3)
-            surface.blit(sparkle, (sx - 3, sy - 3))
-
-    def _draw_pill_button(self, surface, rect, text, mouse_logical,
-                          idle_color, hover_color, bold=False):
-        is_hover = rect.collidepoint(mouse_logical)
-        bg = hover_color if is_hover else idle_color
-
-        # Pill shape (fully rounded)
-        pygame.draw.rect(surface, bg, rect, border_radius=rect.height // 2)
-        pygame.draw.rect(surface, COLOR_SHELF_BORDER, rect, 1, border_radius=rect.height // 2)
-
-        # Subtle top highlight
-        if not is_hover:
-            hl = pygame.Rect(rect.x + 4, rect.y + 2, rect.w - 8, rect.h // 3)
-            hl_surf = pygame.Surface((hl.w, hl.h), pygame.SRCALPHA)
-            pygame.draw.rect(hl_surf, (255, 255, 255, 35), (0, 0, hl.w, hl.h),
-                             border_radius=rect.height // 4)
-            surface.blit(hl_surf, hl)
-
-        font = self.font if bold else self.small_font
-        t = font.render(text, True, COLOR_BUTTON_TEXT)
-        surface.blit(t, t.get_rect(center=rect.center))
+            surface.blit(effects.circle(3, COLOR_SPARKLE, alpha), (sx - 3, sy - 3))
 
     def _compose_character(self):
         species = self.character.species
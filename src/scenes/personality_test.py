@@ -1,16 +1,24 @@
+import re
+from bisect import bisect_left
 import pygame
 from src.scene import Scene
-from src.font_loader import get_font
+from src.assets import Manifest
+from src.font_loader import get_font, render_with
+from src.ui.text import wrap
+from src.ui.widgets import Card, Label, ProgressBar
 from src.settings import (
     LOGICAL_WIDTH, LOGICAL_HEIGHT, COLOR_BG, COLOR_TEXT, COLOR_TEXT_DIM,
-    COLOR_TEXT_LIGHT, COLOR_ACCENT, COLOR_ACCENT_DARK, COLOR_PANEL_BG,
-    COLOR_PANEL_BORDER, COLOR_PANEL_HOVER, COLOR_RULE_LINE
+    COLOR_TEXT_LIGHT, COLOR_ACCENT, COLOR_ACCENT_DARK,
+    COLOR_PANEL_BORDER, COLOR_RULE_LINE
 )
 from src.data.questions import QUESTIONS
 from src.systems.profile_engine import assign_profile, PROFILE_BASELINES
 
 
 class PersonalityTestScene(Scene):
+    tracks_damage = True
+    upcoming = ("AVATAR_SELECT",)
+
     def __init__(self):
         super().__init__()
         self.current_q = 0
@@ -23,7 +31,15 @@ class PersonalityTestScene(Scene):
         self.process_timer = 0
         self.typewriter_timer = 0
         self.typewriter_index = 0
-        self.answer_rects = []
+        self.header = None
+        self.hint = None
+        self.question_labels = []
+        self.question_reveal = []
+        self.question_widths = []
+        self.answer_cards = []
+        self.processing_label = None
+        self.processing_sub = None
+        self.progress_bar = None
 
     def startup(self, persistent):
         super().startup(persistent)
@@ -37,31 +53,132 @@ class PersonalityTestScene(Scene):
         self.font = get_font(34, bold=True)
         self.small_font = get_font(30)
         self.q_font = get_font(40, italic=True)
+        if self.header is None:
+            self._build_widgets()
+        self._build_question()
 
-    def handle_events(self, events):
+    def manifest(self, persistent):
+        return Manifest(fonts=[(34, True, False), (30, False, False), (40, False, True)])
+
+    def unload(self):
+        super().unload()
+        self.header = self.hint = None
+        self.processing_label = self.processing_sub = self.progress_bar = None
+        self.question_labels = []
+        self.question_reveal = []
+        self.question_widths = []
+        self.answer_cards = []
+
+    def _build_widgets(self):
+        cx = LOGICAL_WIDTH // 2
+        self.header = Label("", self.small_font, COLOR_TEXT_DIM, topleft=(80, 50))
+        self.hint = Label("\u2191\u2193 or mouse  \u00b7  Enter to confirm", self.small_font,
+                          COLOR_TEXT_LIGHT, topleft=(100, LOGICAL_HEIGHT - 110))
+        self.processing_label = Label("Processing your profile\u2026", self.q_font, COLOR_TEXT,
+                                      midtop=(cx, LOGICAL_HEIGHT // 2 - 80))
+        bar_w, bar_h = 520, 28
+        self.progress_bar = ProgressBar(((LOGICAL_WIDTH - bar_w) // 2, LOGICAL_HEIGHT // 2, bar_w, bar_h))
+        self.processing_sub = Label("Holistic deliberation in progress\u2026", self.small_font,
+                                    COLOR_TEXT_LIGHT, midtop=(cx, LOGICAL_HEIGHT // 2 + 48))
+
+    def _set_header(self):
+        q_num = self.current_q + 1 if self.state == "question" else len(QUESTIONS)
+        self.header.set_text(f"Intake Assessment  \u00b7  Question {q_num} of {len(QUESTIONS)}")
+
+    def _build_question(self):
+        """Lay out the current question at its full length and its answer cards
+        below it, once; the typewriter then only reveals the rendered lines."""
+        self._set_header()
+        self.router.clear()
+        self.answer_cards = []
+        self.question_labels = []
+        self.question_reveal = []
+        self.question_widths = []
         if self.state != "question":
             return
         question = QUESTIONS[self.current_q]
-        num_answers = len(question["answers"])
+        text = question["text"]
+        # wrap() splits at any run of whitespace and rejoins words with one
+        # space, so lines are matched back to the text word by word
+        words = [(m.start(), m.end()) for m in re.finditer(r"\S+", text)]
+        w = 0
+        for i, line in enumerate(wrap(text, self.q_font, LOGICAL_WIDTH - 200)):
+            label = Label(line, self.q_font, COLOR_ACCENT_DARK, topleft=(100, 130 + i * 44))
+            # Where in text each character of the line comes from (a joining
+            # space from the whitespace it stands for)...
+            spans = words[w:w + len(line.split())]
+            w += len(spans)
+            offsets = []
+            for j, (start, end) in enumerate(spans):
+                if j:
+                    offsets.append(spans[j - 1][1])
+                offsets.extend(range(start, end))
+            # ...and the width of each prefix of the line; the whole line
+            # shows the rendered surface uncut, overhang included
+            widths = [self.q_font.size(line[:k])[0] for k in range(len(line))]
+            widths.append(label.rect.width)
+            self.question_labels.append(label)
+            self.question_reveal.append((offsets, widths))
+        self.question_widths = self._revealed(self.typewriter_index)
+        y = max(130 + len(self.question_labels) * 44 + 50, 280)
+        card_w = LOGICAL_WIDTH - 200
+        for i, answer in enumerate(question["answers"]):
+            card = Card((100, y + i * 120, card_w, 100),
+                        content=self._answer_content(answer["text"], card_w - 100), radius=8)
+            card.set_selected(i == self.selected)
+            self.answer_cards.append(card)
+            self.router.add(card, on_click=self._click_answer, on_hover=self._hover_answer)
+
+    def _revealed(self, index):
+        """Return how much of each question line shows, in pixels, once the
+        typewriter has reached character index."""
+        return [widths[bisect_left(offsets, index)] for offsets, widths in self.question_reveal]
+
+    def _answer_content(self, text, text_width):
+        """Return the Card callback painting an answer's bullet and its text,
+        wrapped once to text_width."""
+        lines = wrap(text, self.font, text_width)
+
+        def paint(surface, rect, state):
+            bx, by = rect.x + 36, rect.centery
+            if state == "selected":
+                pygame.draw.circle(surface, COLOR_ACCENT, (bx, by), 10)
+            else:
+                pygame.draw.circle(surface, COLOR_PANEL_BORDER, (bx, by), 10, 2)
+            color = COLOR_TEXT if state == "selected" else COLOR_TEXT_DIM
+            ay = rect.y + 16
+            for line in lines:
+                surface.blit(render_with(self.font, line, color), (rect.x + 72, ay))
+                ay += 36
+        return paint
+
+    def handle_events(self, events):
+        if self.state != "question":
+            return
+        num_answers = len(QUESTIONS[self.current_q]["answers"])
         for event in events:
             if event.type == pygame.KEYDOWN:
                 if event.key == pygame.K_UP:
-                    self.selected = (self.selected - 1) % num_answers
+                    self._select((self.selected - 1) % num_answers)
                 elif event.key == pygame.K_DOWN:
-                    self.selected = (self.selected + 1) % num_answers
+                    self._select((self.selected + 1) % num_answers)
                 elif event.key == pygame.K_RETURN:
                     self._confirm_answer()
-            elif event.type == pygame.MOUSEBUTTONDOWN and event.button == 1:
-                for i, rect in enumerate(self.answer_rects):
-                    if rect.collidepoint(event.pos):
-                        self.selected = i
-                        self._confirm_answer()
-                        break
-            elif event.type == pygame.MOUSEMOTION:
-                for i, rect in enumerate(self.answer_rects):
-                    if rect.collidepoint(event.pos):
-                        self.selected = i
-                        break
+
+    def _hover_answer(self, card):
+        self._select(self.answer_cards.index(card))
+
+    def _click_answer(self, card):
+        self._select(self.answer_cards.index(card))
+        self._confirm_answer()
+
+    def _select(self, index):
+        if index == self.selected:
+            return
+        for card in (self.answer_cards[self.selected], self.answer_cards[index]):
+            card.set_selected(card is self.answer_cards[index])
+            self.invalidate(card.bounds)
+        self.selected = index
 
     def _confirm_answer(self):
         self.answers.append(self.selected)
@@ -72,102 +189,60 @@ class PersonalityTestScene(Scene):
         if self.current_q >= len(QUESTIONS):
             self.state = "processing"
             self.process_timer = 0
+            self.progress_bar.set_value(0)
+        self._build_question()
+        self.invalidate()
+
+    def is_animating(self):
+        if self.state == "question":
+            return self.typewriter_index < len(QUESTIONS[self.current_q]["text"])
+        return self.state == "processing"
 
     def update(self, dt):
         if self.state == "question":
             self.typewriter_timer += dt
             text_len = len(QUESTIONS[self.current_q]["text"])
-            self.typewriter_index = min(int(self.typewriter_timer * 40), text_len)
+            index = min(int(self.typewriter_timer * 40), text_len)
+            if index != self.typewriter_index:
+                self.typewriter_index = index
+                widths = self._revealed(index)
+                for label, was, now in zip(self.question_labels, self.question_widths, widths):
+                    if now != was:
+                        self.invalidate((label.rect.x + min(was, now), label.rect.y,
+                                         abs(now - was), label.rect.h))
+                self.question_widths = widths
         elif self.state == "processing":
             self.process_timer += dt
+            t = self.process_timer / 2.5
+            if t < 0.3: progress = t / 0.3 * 0.33
+            elif t < 0.45: progress = 0.33
+            elif t < 0.65: progress = 0.33 + (t - 0.45) / 0.2 * 0.33
+            elif t < 0.8: progress = 0.66
+            else: progress = 0.66 + (t - 0.8) / 0.2 * 0.34
+            if self.progress_bar.set_value(progress):
+                self.invalidate(self.progress_bar.rect)
             if self.process_timer >= 2.5:
                 profile_key, profile_label = assign_profile(self.answers)
-                self.persistent["quiz_answers"] = self.answers
-                self.persistent["profile"] = profile_key
-                self.persistent["profile_label"] = profile_label
-                self.persistent["base_stats"] = dict(PROFILE_BASELINES[profile_key])
+                self.persistent.quiz_answers = self.answers
+                self.persistent.profile = profile_key
+                self.persistent.profile_label = profile_label
+                self.persistent.base_stats = dict(PROFILE_BASELINES[profile_key])
                 self.next_scene = "AVATAR_SELECT"
                 self.done = True
 
     def draw(self, surface):
         surface.fill(COLOR_BG)
-        q_num = self.current_q + 1 if self.state == "question" else len(QUESTIONS)
-        header = self.small_font.render(
-            f"Intake Assessment  \u00b7  Question {q_num} of {len(QUESTIONS)}", True, COLOR_TEXT_DIM)
-        surface.blit(header, (80, 50))
+        self.header.draw(surface)
         pygame.draw.line(surface, COLOR_RULE_LINE, (80, 88), (LOGICAL_WIDTH - 80, 88), 2)
 
         if self.state == "question":
-            self._draw_question(surface)
+            for label, width in zip(self.question_labels, self.question_widths):
+                if width:
+                    surface.blit(label.surface(), label.rect, (0, 0, width, label.rect.h))
+            for card in self.answer_cards:
+                card.draw(surface)
+            self.hint.draw(surface)
         elif self.state == "processing":
-            self._draw_processing(surface)
-
-    def _draw_question(self, surface):
-        question = QUESTIONS[self.current_q]
-        visible = question["text"][:self.typewriter_index]
-        lines = self._wrap_text(visible, self.q_font, LOGICAL_WIDTH - 200)
-        y = 130
-        for line in lines:
-            surface.blit(self.q_font.render(line, True, COLOR_ACCENT_DARK), (100, y))
-            y += 44
-
-        y = max(y + 50, 280)
-        self.answer_rects = []
-        for i, answer in enumerate(question["answers"]):
-            rect = pygame.Rect(100, y, LOGICAL_WIDTH - 200, 100)
-            self.answer_rects.append(rect)
-            is_sel = (i == self.selected)
-            bg = COLOR_PANEL_HOVER if is_sel else COLOR_PANEL_BG
-            pygame.draw.rect(surface, bg, rect, border_radius=8)
-            border = COLOR_ACCENT if is_sel else COLOR_PANEL_BORDER
-            pygame.draw.rect(surface, border, rect, 2, border_radius=8)
-            bx, by = rect.x + 36, rect.centery
-            if is_sel:
-                pygame.draw.circle(surface, COLOR_ACCENT, (bx, by), 10)
-            else:
-                pygame.draw.circle(surface, COLOR_PANEL_BORDER, (bx, by), 10, 2)
-            alines = self._wrap_text(answer["text"], self.font, rect.width - 100)
-            ay = rect.y + 16
-            for al in alines:
-                color = COLOR_TEXT if is_sel else COLOR_TEXT_DIM
-                surface.blit(self.font.render(al, True, color), (rect.x + 72, ay))
-                ay += 36
-            y += 120
-
-        hint = self.small_font.render(
-            "\u2191\u2193 or mouse  \u00b7  Enter to confirm", True, COLOR_TEXT_LIGHT)
-        surface.blit(hint, (100, LOGICAL_HEIGHT - 110))
-
-    def _draw_processing(self, surface):
-        cx = LOGICAL_WIDTH // 2
-        label = self.q_font.render("Processing your profile\u2026", True, COLOR_TEXT)
-        surface.blit(label, (cx - label.get_width() // 2, LOGICAL_HEIGHT // 2 - 80))
-        bar_w, bar_h = 520, 28
-        bar_x = (LOGICAL_WIDTH - bar_w) // 2
-        bar_y = LOGICAL_HEIGHT // 2
-        t = self.process_timer / 2.5
-        if t < 0.3: progress = t / 0.3 * 0.33
-        elif t < 0.45: progress = 0.33
-        elif t < 0.65: progress = 0.33 + (t - 0.45) / 0.2 * 0.33
-        elif t < 0.8: progress = 0.66
-        else: progress = 0.66 + (t - 0.8) / 0.2 * 0.34
-        progress = min(progress, 1.0)
-        pygame.draw.rect(surface, COLOR_PANEL_BORDER, (bar_x, bar_y, bar_w, bar_h), border_radius=14)
-        fw = int(bar_w * progress)
-        if fw > 0:
-            pygame.draw.rect(surface, COLOR_ACCENT, (bar_x, bar_y, fw, bar_h), border_radius=14)
-        sub = self.small_font.render("Holistic deliberation in progress\u2026", True, COLOR_TEXT_LIGHT)
-        surface.blit(sub, (cx - sub.get_width() // 2, bar_y + 48))
-
-    def _wrap_text(self, text, font, max_width):
-        words = text.split()
-        lines, current = [], ""
-        for word in words:
-            test = current + (" " if current else "") + word
-            if font.size(test)[0] <= max_width:
-                current = test
-            else:
-                if current: lines.append(current)
-                current = word
-        if current: lines.append(current)
-        return lines or [""]
+            self.processing_label.draw(surface)
+            self.progress_bar.draw(surface)
+            self.processing_sub.draw(surface)
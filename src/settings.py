@@ -6,7 +6,57 @@ LOGICAL_HEIGHT = 960
 SCALE_FACTOR = 1
 WINDOW_WIDTH = LOGICAL_WIDTH
 WINDOW_HEIGHT = LOGICAL_HEIGHT
-FPS = 60
+FPS = 60  # render rate; simulation steps at SIM_HZ below
+# When no scene animation is running the loop sleeps until input arrives,
+# waking at IDLE_FPS for timers; input keeps it at FPS for IDLE_GRACE seconds.
+IDLE_FPS = 10
+IDLE_GRACE = 0.5
+
+# Simulation runs in fixed SIM_DT steps independent of the render rate above.
+# Frame time beyond MAX_FRAME_DT (a stall, a debugger pause) is dropped.
+SIM_HZ = 60
+SIM_DT = 1.0 / SIM_HZ
+MAX_FRAME_DT = 0.25
+
+# Scene warm-up tasks get this much time per frame in the background, and
+# more while a scene switch is waiting on them (seconds).
+WARMUP_BUDGET = 0.004
+WARMUP_SWITCH_BUDGET = 0.012
+
+# Scenes are constructed on first use. Of the scenes not on screen, only the
+# SCENE_KEEP_WARM most recently left keep their loaded resources, and fewer
+# if together they hold more than SCENE_MEMORY_BUDGET bytes (None: no limit).
+SCENE_KEEP_WARM = 2
+SCENE_MEMORY_BUDGET = None
+
+# Scene switches animate from a snapshot of the outgoing frame: "crossfade",
+# "slide" or "cut" (none), over SCENE_TRANSITION_TIME seconds. Scenes can
+# pick their own with a transition attribute.
+SCENE_TRANSITION = "crossfade"
+SCENE_TRANSITION_TIME = 0.3
+
+# Translucent decorations (shadows, glows, sparkles) are rendered once per
+# shape, size, color and alpha; this many are kept, least recently used
+# dropped first. Fading sparkles alone cycle through a few hundred alphas,
+# and a long dress-up session settles at about 1000 entries (~300 KB).
+EFFECT_CACHE_SIZE = 2048
+
+# Rendered text surfaces are shared through an LRU cache holding at most
+# this many bytes of pixels; see font_loader.render_text.
+TEXT_CACHE_BYTES = 8 * 1024 * 1024
+
+# Line breaks and truncations memoized by src.ui.text, and the word widths
+# behind them: this many of each are kept.
+TEXT_LAYOUT_CACHE_SIZE = 1024
+
+# Dirty-rect presentation: a frame whose damage covers more than this
+# fraction of the logical surface is presented whole.
+DIRTY_RECT_MAX_COVERAGE = 0.5
+
+# Frame profiler (F3 toggles the overlay): samples kept per scene and phase,
+# and how often the overlay re-renders its numbers, in seconds.
+PROFILER_SAMPLES = 600
+PROFILER_OVERLAY_INTERVAL = 0.25
 
 # Character sprite display size (scaled down from 1024x1024)
 CHAR_DISPLAY_SIZE = 320  # pixels in logical space
@@ -60,3 +110,4 @@ SPRITE_DIR = os.path.join(ASSETS_DIR, "sprites")
 STARTING_TOKENS = 5
 ACCESSORY_COST = 1
 MAX_COLLEGE_APPS = 2
+MAX_STATEMENT_LENGTH = 1000
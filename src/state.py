@@ -0,0 +1,123 @@
+import copy
+from src.systems.decision_engine import compute_all_decisions
+from src.systems.stat_engine import compute_final_stats
+
+# Fields the scenes fill in as the player goes, in the order they're set
+FIELDS = (
+    "quiz_answers", "profile", "profile_label", "base_stats", "species",
+    "equipped_accessories", "owned_accessories", "cosmetic_tags",
+    "applications", "tokens_remaining",
+)
+
+# Derived value -> (its inputs, a function of those inputs in order). Inputs
+# may themselves be derived.
+DERIVED = {
+    "decisions": (("profile", "cosmetic_tags", "applications"), compute_all_decisions),
+    "stats": (("profile", "cosmetic_tags", "decisions"), compute_final_stats),
+}
+
+
+class GameState:
+    """Everything the scenes share about the player's run.
+
+    Game hands one instance to every scene's startup(). Each field keeps a
+    version that moves whenever the field is assigned; mutate a container
+    in place and the change goes unseen unless you reassign it or touch()
+    it. decisions and stats are derived on first read and recomputed only
+    once one of their inputs' versions has moved. A derived value's own
+    version only moves when its result actually changes, so re-entering
+    the decision scene with the same inputs leaves stats cached.
+    Derived results are shared; don't mutate them.
+
+    to_dict() and from_dict() convert to and from the plain dict that
+    save_manager and the tools work with.
+    """
+
+    __slots__ = FIELDS + ("_versions", "_derived")
+
+    def __init__(self):
+        object.__setattr__(self, "_versions", dict.fromkeys(FIELDS + tuple(DERIVED), 0))
+        # derived name -> (input versions it was computed from, value)
+        object.__setattr__(self, "_derived", {})
+        self.quiz_answers = []          # answer index per question
+        self.profile = None             # profile_engine key, e.g. "legacy"
+        self.profile_label = None
+        self.base_stats = {}
+        self.species = None
+        self.equipped_accessories = {}  # slot -> accessory id or None
+        self.owned_accessories = []
+        self.cosmetic_tags = {}         # tag -> weight
+        self.applications = []          # one dict per submitted application
+        self.tokens_remaining = 0
+
+    def __setattr__(self, name, value):
+        object.__setattr__(self, name, value)
+        self._versions[name] += 1
+
+    def touch(self, name):
+        """Mark a field changed after mutating its value in place."""
+        self._versions[name] += 1
+
+    def version(self, name):
+        """Return a counter for field (or derived value) name that moves
+        whenever it changes."""
+        if name in DERIVED:
+            self._derive(name)
+        return self._versions[name]
+
+    @property
+    def decisions(self):
+        """{college name: "accepted" | "waitlisted" | "rejected"} per application."""
+        return self._derive("decisions")
+
+    @property
+    def stats(self):
+        """The six final stats, from the profile, tags and decisions."""
+        return self._derive("stats")
+
+    def _derive(self, name):
+        inputs, compute = DERIVED[name]
+        values = [self._derive(key) if key in DERIVED else getattr(self, key) for key in inputs]
+        stamp = tuple(self._versions[key] for key in inputs)
+        cached = self._derived.get(name)
+        if cached is not None and cached[0] == stamp:
+            return cached[1]
+        value = compute(*values)
+        if cached is None or value != cached[1]:
+            self._versions[name] += 1
+        self._derived[name] = (stamp, value)
+        return value
+
+    def update(self, other):
+        """Assign every field from another GameState, or those present in a
+        dict of field values."""
+        if other is self:
+            return
+        if isinstance(other, GameState):
+            other = {name: getattr(other, name) for name in FIELDS}
+        for name in FIELDS:
+            if name in other:
+                setattr(self, name, other[name])
+
+    def replace(self, **changes):
+        """Return a copy with some fields changed, sharing the other values."""
+        state = GameState()
+        state.update(self)
+        for name, value in changes.items():
+            setattr(state, name, value)
+        return state
+
+    def to_dict(self):
+        """Return the fields and derived values as one plain dict."""
+        data = {name: getattr(self, name) for name in FIELDS}
+        for name in DERIVED:
+            data[name] = getattr(self, name)
+        return data
+
+    @classmethod
+    def from_dict(cls, data):
+        """Build a state from a to_dict()-shaped dict, deep-copying its values.
+        Derived values in data are ignored and recomputed when read."""
+        state = cls()
+        state.update({name: copy.deepcopy(data[name]) for name in FIELDS if name in data})
+        return state
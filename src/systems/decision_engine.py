@@ -20,15 +20,14 @@ ACCEPT_THRESHOLD = 22
 WAITLIST_THRESHOLD = 16
 
 
-def compute_decision(persistent, college_id):
+def compute_decision(profile, cosmetic_tags, applications, college_id):
     """
     Returns 'accepted', 'waitlisted', or 'rejected' based on:
     1. Profile alignment with college bias
     2. Cosmetic tag alignment
     3. Extracurricular choices (small bonus)
     """
-    profile = persistent.get("profile", "first_gen")
-    cosmetic_tags = persistent.get("cosmetic_tags", {})
+    profile = profile or "first_gen"
     college = COLLEGE_LOOKUP[college_id]
 
     # 1. Profile alignment score
@@ -46,7 +45,7 @@ def compute_decision(persistent, college_id):
 
     # 3. Small extracurricular bonus (check if apps match)
     extra_bonus = 0
-    for app in persistent.get("applications", []):
+    for app in applications:
         if app.get("college_id") == college_id:
             # More selections = small boost
             extra_bonus += len(app.get("extracurricular_selections", [])) * 0.5
@@ -61,13 +60,13 @@ def compute_decision(persistent, college_id):
         return "rejected"
 
 
-def compute_all_decisions(persistent):
+def compute_all_decisions(profile, cosmetic_tags, applications):
     """Compute decisions for all applied colleges. Returns dict of {college_name: result}."""
     decisions = {}
-    for app in persistent.get("applications", []):
+    for app in applications:
         college_id = app.get("college_id")
         if college_id:
             college = COLLEGE_LOOKUP[college_id]
-            result = compute_decision(persistent, college_id)
+            result = compute_decision(profile, cosmetic_tags, applications, college_id)
             decisions[college.name] = result
     return decisions
@@ -6,33 +6,49 @@ from src.settings import SAVES_DIR, EXPORTS_DIR
 
 IS_WEB = sys.platform == "emscripten"
 
+# While dry_run is set (tools/replay.py sets it), saves and exports are named
+# but not written, and exports are stamped DRY_RUN_TIMESTAMP instead of the
+# clock, so replaying a session leaves the disk alone and draws the same
+# "Saved to"/"Exported:" messages every time.
+dry_run = False
+DRY_RUN_TIMESTAMP = "00000000_000000"
 
-def save_local(persistent, filename="character_save.json"):
-    """Save character data to the local saves/ directory."""
+
+def set_dry_run(enabled=True):
+    global dry_run
+    dry_run = enabled
+
+
+def save_local(state, filename="character_save.json"):
+    """Save a GameState's character data to the local saves/ directory."""
     if IS_WEB:
         return None
-    os.makedirs(SAVES_DIR, exist_ok=True)
     path = os.path.join(SAVES_DIR, filename)
-    with open(path, "w") as f:
-        json.dump(_build_payload(persistent), f, indent=2)
+    if not dry_run:
+        _write(path, state)
     return path
 
 
-def export_downloadable(persistent, filename=None):
-    """Export character data to the exports/ directory."""
+def export_downloadable(state, filename=None):
+    """Export a GameState's character data to the exports/ directory."""
     if IS_WEB:
         return None
-    os.makedirs(EXPORTS_DIR, exist_ok=True)
     if filename is None:
-        ts = datetime.now().strftime("%Y%m%d_%H%M%S")
-        species = persistent.get("species", "unknown")
+        ts = DRY_RUN_TIMESTAMP if dry_run else datetime.now().strftime("%Y%m%d_%H%M%S")
+        species = state.species or "unknown"
         filename = f"hybris_{species}_{ts}.json"
     path = os.path.join(EXPORTS_DIR, filename)
-    with open(path, "w") as f:
-        json.dump(_build_payload(persistent), f, indent=2)
+    if not dry_run:
+        _write(path, state)
     return path
 
 
+def _write(path, state):
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    with open(path, "w") as f:
+        json.dump(_build_payload(state.to_dict()), f, indent=2)
+
+
 def _build_payload(persistent):
     """Construct the canonical export payload."""
     return {
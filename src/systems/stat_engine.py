@@ -1,16 +1,14 @@
 from src.systems.profile_engine import PROFILE_BASELINES
 
 
-def compute_final_stats(persistent):
+def compute_final_stats(profile, cosmetic_tags, decisions):
     """
     Compute the 6 final stats from:
     1. Profile baseline
     2. Cosmetic tag modifiers
     3. Decision outcome modifiers
     """
-    profile = persistent.get("profile", "first_gen")
-    cosmetic_tags = persistent.get("cosmetic_tags", {})
-    decisions = persistent.get("decisions", {})
+    profile = profile or "first_gen"
 
     # 1. Start with base stats
     stats = dict(PROFILE_BASELINES[profile])
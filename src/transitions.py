@@ -0,0 +1,94 @@
+import pygame
+from src.settings import LOGICAL_WIDTH, LOGICAL_HEIGHT
+
+# Eased progress (smoothstep) sampled at RAMP_STEPS points, and the snapshot
+# alpha for each; built once and indexed by linear progress.
+RAMP_STEPS = 64
+EASE_RAMP = tuple(t * t * (3 - 2 * t) for t in (i / (RAMP_STEPS - 1) for i in range(RAMP_STEPS)))
+ALPHA_RAMP = tuple(round(255 * (1 - e)) for e in EASE_RAMP)
+
+
+class Transition:
+    """Animates from a snapshot of the outgoing scene's last frame to the
+    live incoming scene, over duration seconds.
+
+    Game holds the snapshot on screen while the incoming scene warms up, calls
+    start() once it has started up, and then draw() every frame until done.
+    Nothing but the incoming scene is drawn live; the outgoing one is a single
+    copied surface.
+    """
+
+    name = None
+
+    def __init__(self, snapshot, duration):
+        self.snapshot = snapshot
+        self.duration = duration
+        self.elapsed = 0.0
+        self.started = False
+
+    def start(self):
+        self.started = True
+        self.elapsed = 0.0
+
+    @property
+    def done(self):
+        return self.started and self.elapsed >= self.duration
+
+    def update(self, dt):
+        if self.started:
+            self.elapsed += dt
+
+    def step_index(self):
+        """Index into the ramps for the current linear progress."""
+        t = min(self.elapsed / self.duration, 1.0) if self.duration > 0 else 1.0
+        return int(t * (RAMP_STEPS - 1))
+
+    def draw(self, surface, scene):
+        """Paint this frame of the transition onto surface, drawing scene."""
+        raise NotImplementedError
+
+
+class Crossfade(Transition):
+    """Draws the incoming scene, then the snapshot over it at a falling alpha."""
+
+    name = "crossfade"
+
+    def draw(self, surface, scene):
+        scene.draw(surface)
+        alpha = ALPHA_RAMP[self.step_index()]
+        if alpha:
+            # Opaque steps (the first, which also pays for the incoming
+            # scene's first draw) skip per-pixel blending
+            self.snapshot.set_alpha(None if alpha == 255 else alpha)
+            surface.blit(self.snapshot, (0, 0))
+
+
+class Slide(Transition):
+    """Pushes the snapshot out to the left as the incoming scene slides in
+    from the right. The incoming scene draws into its own buffer."""
+
+    name = "slide"
+
+    def __init__(self, snapshot, duration):
+        super().__init__(snapshot, duration)
+        self.buffer = pygame.Surface((LOGICAL_WIDTH, LOGICAL_HEIGHT))
+
+    def draw(self, surface, scene):
+        scene.draw(self.buffer)
+        x = round(LOGICAL_WIDTH * EASE_RAMP[self.step_index()])
+        if x < LOGICAL_WIDTH:
+            surface.blit(self.snapshot, (0, 0), (x, 0, LOGICAL_WIDTH - x, LOGICAL_HEIGHT))
+        surface.blit(self.buffer, (LOGICAL_WIDTH - x, 0), (0, 0, x, LOGICAL_HEIGHT))
+
+
+TRANSITIONS = {
+    Crossfade.name: Crossfade,
+    Slide.name: Slide,
+}
+
+
+def create_transition(name, snapshot, duration):
+    """Create the named transition from snapshot, or None for a hard cut."""
+    if name is None or name == "cut" or duration <= 0:
+        return None
+    return TRANSITIONS[name](snapshot, duration)
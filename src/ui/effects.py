@@ -0,0 +1,43 @@
+from collections import OrderedDict
+import pygame
+from src.settings import EFFECT_CACHE_SIZE
+
+# (shape, size, color, alpha, extra) -> translucent surface, least recently
+# used first
+_cache = OrderedDict()
+
+
+def _effect(key, paint):
+    surf = _cache.get(key)
+    if surf is not None:
+        _cache.move_to_end(key)
+        return surf
+    surf = pygame.Surface(key[1], pygame.SRCALPHA)
+    paint(surf)
+    _cache[key] = surf
+    if len(_cache) > EFFECT_CACHE_SIZE:
+        _cache.popitem(last=False)
+    return surf
+
+
+def circle(radius, color, alpha=255):
+    """Return a shared (2*radius)-square surface holding a filled circle of
+    color at alpha, centred at (radius, radius). Blit it; don't draw on it."""
+    rgba = (*color[:3], alpha)
+    return _effect(("circle", (2 * radius, 2 * radius), rgba[:3], alpha, None),
+                   lambda surf: pygame.draw.circle(surf, rgba, (radius, radius), radius))
+
+
+def rect(size, color, alpha=255, radius=0):
+    """Return a shared surface of size filled with color at alpha, with
+    corners rounded by radius. Blit it; don't draw on it."""
+    size = tuple(size)
+    rgba = (*color[:3], alpha)
+    return _effect(("rect", size, rgba[:3], alpha, radius),
+                   lambda surf: pygame.draw.rect(surf, rgba, surf.get_rect(),
+                                                 border_radius=radius))
+
+
+def clear():
+    """Drop every cached effect surface."""
+    _cache.clear()
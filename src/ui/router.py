@@ -0,0 +1,111 @@
+import pygame
+
+# Side of the square grid cells the router buckets widget rects into
+CELL_SIZE = 128
+
+
+class EventRouter:
+    """Routes a scene's mouse input to its registered widgets.
+
+    Widget rects are bucketed into a grid so a hit test only looks at the
+    widgets overlapping one cell; later registrations sit on top. handle()
+    tracks which widget is hovered and which is held down, pushes that into
+    the widgets with Widget.set_pointer(), and calls invalidate(rect) only
+    for widgets whose visual state actually changed.
+
+    Call reindex() after moving registered widgets, and clear() before
+    registering a new set.
+    """
+
+    def __init__(self, invalidate):
+        self.invalidate = invalidate
+        self.callbacks = {}
+        self.grid = {}
+        self.hovered = None
+        self.pressed = None
+        self.mouse_pos = None
+
+    def clear(self):
+        for widget in (self.hovered, self.pressed):
+            if widget is not None:
+                widget.set_pointer(False, False)
+        self.callbacks = {}
+        self.grid = {}
+        self.hovered = None
+        self.pressed = None
+
+    def add(self, widget, on_click=None, on_hover=None):
+        """Register widget. on_click(widget) runs on a left press over it;
+        on_hover(widget) runs when the pointer moves onto it."""
+        self.callbacks[widget] = (on_click, on_hover)
+        self._index(widget)
+
+    def reindex(self):
+        """Re-bucket every widget after rects moved, and re-test hover.
+
+        on_hover is not called: the widget moved under the pointer, not the
+        other way round."""
+        self.grid = {}
+        for widget in self.callbacks:
+            self._index(widget)
+        if self.mouse_pos is not None:
+            self._hover(self.mouse_pos, notify=False)
+
+    def _index(self, widget):
+        rect = widget.rect
+        for cx in range(rect.left // CELL_SIZE, (rect.right - 1) // CELL_SIZE + 1):
+            for cy in range(rect.top // CELL_SIZE, (rect.bottom - 1) // CELL_SIZE + 1):
+                self.grid.setdefault((cx, cy), []).append(widget)
+
+    def hit(self, pos):
+        """Return the topmost registered widget under pos that accepts input, or None."""
+        for widget in reversed(self.grid.get((pos[0] // CELL_SIZE, pos[1] // CELL_SIZE), ())):
+            if widget.collidepoint(pos):
+                return widget
+        return None
+
+    def handle(self, frame_input):
+        """Update hover and press state from a FrameInput and run click callbacks."""
+        for event in frame_input.events:
+            etype = event.type
+            if etype == pygame.MOUSEMOTION:
+                self._hover(event.pos)
+            elif etype == pygame.MOUSEBUTTONDOWN and event.button == 1:
+                self._hover(event.pos)
+                widget = self.hovered
+                self._set_pressed(widget)
+                if widget is not None:
+                    on_click = self.callbacks[widget][0]
+                    if on_click:
+                        on_click(widget)
+                    # The callback may have selected or disabled it
+                    if widget in self.callbacks:
+                        self._sync(widget)
+            elif etype == pygame.MOUSEBUTTONUP and event.button == 1:
+                self._set_pressed(None)
+
+    def _hover(self, pos, notify=True):
+        self.mouse_pos = pos
+        widget = self.hit(pos)
+        if widget is self.hovered:
+            return
+        previous, self.hovered = self.hovered, widget
+        if previous is not None:
+            self._sync(previous)
+        if widget is not None:
+            self._sync(widget)
+            on_hover = self.callbacks[widget][1]
+            if on_hover and notify:
+                on_hover(widget)
+
+    def _set_pressed(self, widget):
+        if widget is self.pressed:
+            return
+        previous, self.pressed = self.pressed, widget
+        for changed in (previous, widget):
+            if changed is not None:
+                self._sync(changed)
+
+    def _sync(self, widget):
+        if widget.set_pointer(widget is self.hovered, widget is self.pressed):
+            self.invalidate(widget.bounds)
@@ -0,0 +1,190 @@
+import pygame
+
+# Opaque borders are only reassembled from slices on rects at least this
+# big (width + height) and at least 2px thick; pygame.draw rasterises
+# thinner or shorter outlines faster (see tools/bench_skins.py)
+SLICE_MIN_SPAN = 480
+SLICE_MIN_BORDER = 2
+
+# RoundedSkin per (fill, border, border_width, radius), shared by every
+# widget and scene using the style.
+_rounded = {}
+
+
+class NineSlice:
+    """A source surface cut into a 3x3 grid of pieces, reassembled at any size.
+
+    insets (left, top, right, bottom) are the widths of the border columns and
+    heights of the border rows. Corners are blitted as they are, edges are
+    stretched along their length and the centre both ways, so a panel costs
+    at most nine blits instead of re-rasterising its outline.
+    """
+
+    def __init__(self, source, insets):
+        left, top, right, bottom = insets
+        w, h = source.get_size()
+        self.insets = insets
+        self.min_size = (left + right, top + bottom)
+        xs = (0, left, w - right, w)
+        ys = (0, top, h - bottom, h)
+        self.pieces = [[self._cut(source, xs[i], ys[j], xs[i + 1], ys[j + 1])
+                        for i in range(3)] for j in range(3)]
+        # Flat edges and centres are painted with fill() instead of scaled
+        # copies; see _runs
+        self.runs = [[self._runs(self.pieces[j][i], stretch_x=i == 1, stretch_y=j == 1)
+                      for i in range(3)] for j in range(3)]
+
+    @staticmethod
+    def _cut(source, x0, y0, x1, y1):
+        if x1 <= x0 or y1 <= y0:
+            return None
+        return source.subsurface((x0, y0, x1 - x0, y1 - y0)).copy()
+
+    @staticmethod
+    def _runs(piece, stretch_x, stretch_y):
+        """Describe a piece that is one pixel long along each axis it is
+        stretched on, with only opaque or clear pixels, as a list of
+        (x, y, w, h, color) bands to fill() (w or h None where it stretches).
+        Returns None for any other piece, which is scaled and blitted."""
+        if piece is None or not (stretch_x or stretch_y):
+            return None
+        w, h = piece.get_size()
+        if (stretch_x and w != 1) or (stretch_y and h != 1):
+            return None
+        runs = []
+        across = h if stretch_x else w
+        for k in range(across):
+            color = piece.get_at((0, k) if stretch_x else (k, 0))
+            if color.a not in (0, 255):
+                return None
+            if runs and runs[-1][2] == color:
+                runs[-1][1] += 1
+            else:
+                runs.append([k, 1, color])
+        bands = []
+        for start, length, color in runs:
+            if color.a == 0:
+                continue
+            if stretch_x and stretch_y:
+                bands.append((0, 0, None, None, color))
+            elif stretch_x:
+                bands.append((0, start, None, length, color))
+            else:
+                bands.append((start, 0, length, None, color))
+        return bands
+
+    def draw(self, surface, rect):
+        """Assemble the pieces over rect, which must be at least min_size."""
+        rect = pygame.Rect(rect)
+        left, top, right, bottom = self.insets
+        cols = ((rect.x, left), (rect.x + left, rect.w - left - right), (rect.right - right, right))
+        rows = ((rect.y, top), (rect.y + top, rect.h - top - bottom), (rect.bottom - bottom, bottom))
+        for j, (y, h) in enumerate(rows):
+            if h <= 0:
+                continue
+            for i, (x, w) in enumerate(cols):
+                piece = self.pieces[j][i]
+                if piece is None or w <= 0:
+                    continue
+                runs = self.runs[j][i]
+                if runs is not None:
+                    for bx, by, bw, bh, color in runs:
+                        surface.fill(color, (x + bx, y + by, w if bw is None else bw,
+                                             h if bh is None else bh))
+                    continue
+                if piece.get_size() != (w, h):
+                    piece = pygame.transform.scale(piece, (w, h))
+                surface.blit(piece, (x, y))
+
+    def render(self, size):
+        """Return a new transparent surface of size holding the assembled skin."""
+        surf = pygame.Surface(size, pygame.SRCALPHA)
+        self.draw(surf, surf.get_rect())
+        return surf
+
+
+class RoundedSkin:
+    """Rounded rect with an optional fill and border, drawn from cached pieces.
+
+    Draws what pygame.draw.rect(fill, border_radius=radius) followed by
+    pygame.draw.rect(border, border_width, border_radius=radius) would, with
+    translucent colors blended onto the target. An opaque fill is drawn by
+    pygame.draw itself, which already fills rounded rects faster than any
+    blit. The border (and a translucent fill) is rasterised once into a
+    (2c+1)-pixel square, c being the larger of radius and border_width, and
+    reassembled with NineSlice. Rects narrower than that on one axis (pills,
+    thin bars) get slices cut at that exact extent. Rects small on both axes
+    or thinner than two borders, and opaque borders below SLICE_MIN_SPAN or
+    SLICE_MIN_BORDER, are drawn directly.
+    """
+
+    def __init__(self, fill=None, border=None, border_width=0, radius=0):
+        self.fill = fill
+        self.border = border if border_width else None
+        self.border_width = border_width
+        self.radius = radius
+        self.corner = max(radius, border_width, 0)
+        self.translucent = any(_translucent(color) for color in (fill, self.border))
+        # The fill drawn with pygame.draw, and the colors cut into slices
+        self.body = None if fill is None or _translucent(fill) else fill
+        self.sliced_fill = None if self.body is not None else fill
+        self._slices = {}
+
+    def paint(self, surface, rect):
+        """Rasterise the whole style straight onto surface with pygame.draw."""
+        if self.fill is not None:
+            pygame.draw.rect(surface, self.fill, rect, border_radius=self.radius)
+        self._paint_sliced(surface, rect, fill=False)
+
+    def _paint_sliced(self, surface, rect, fill=True):
+        if fill and self.sliced_fill is not None:
+            pygame.draw.rect(surface, self.sliced_fill, rect, border_radius=self.radius)
+        if self.border is not None:
+            pygame.draw.rect(surface, self.border, rect, self.border_width,
+                             border_radius=self.radius)
+
+    def _source(self, size):
+        surf = pygame.Surface(size, pygame.SRCALPHA)
+        self._paint_sliced(surf, surf.get_rect())
+        return surf
+
+    def draw(self, surface, rect):
+        """Draw the skin over rect."""
+        rect = pygame.Rect(rect)
+        if rect.w <= 0 or rect.h <= 0:
+            return
+        if self.body is not None:
+            pygame.draw.rect(surface, self.body, rect, border_radius=self.radius)
+        if self.sliced_fill is None and self.border is None:
+            return
+        full = 2 * self.corner + 1
+        w, h = min(rect.w, full), min(rect.h, full)
+        # pygame fills rects thinner than two borders its own way; so do we
+        if ((w < full and h < full) or min(w, h) < 2 * self.border_width
+                or (not self.translucent and (self.border_width < SLICE_MIN_BORDER
+                                              or rect.w + rect.h < SLICE_MIN_SPAN))):
+            if self.translucent:
+                surface.blit(self._source(rect.size), rect)
+            else:
+                self._paint_sliced(surface, rect)
+            return
+        slices = self._slices.get((w, h))
+        if slices is None:
+            c = self.corner
+            insets = (c if w == full else w, c if h == full else h,
+                      c if w == full else 0, c if h == full else 0)
+            slices = self._slices[(w, h)] = NineSlice(self._source((w, h)), insets)
+        slices.draw(surface, rect)
+
+
+def _translucent(color):
+    return color is not None and len(color) == 4 and color[3] != 255
+
+
+def rounded_skin(fill=None, border=None, border_width=0, radius=0):
+    """Return the shared RoundedSkin for a style."""
+    key = (fill and tuple(fill), border and tuple(border), border_width, radius)
+    skin = _rounded.get(key)
+    if skin is None:
+        skin = _rounded[key] = RoundedSkin(fill, border, border_width, radius)
+    return skin
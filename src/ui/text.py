@@ -0,0 +1,100 @@
+from collections import OrderedDict
+from src.settings import TEXT_LAYOUT_CACHE_SIZE
+
+ELLIPSIS = "…"
+
+# (function, text, font, width) -> result, and (font, word) -> width; least
+# recently used first
+_layouts = OrderedDict()
+_word_widths = OrderedDict()
+
+
+def _remember(cache, key, value):
+    cache[key] = value
+    if len(cache) > TEXT_LAYOUT_CACHE_SIZE:
+        cache.popitem(last=False)
+    return value
+
+
+def _recall(cache, key):
+    value = cache.get(key)
+    if value is not None:
+        cache.move_to_end(key)
+    return value
+
+
+def word_width(word, font):
+    """Return font.size(word)[0], cached."""
+    key = (font, word)
+    width = _recall(_word_widths, key)
+    if width is None:
+        width = _remember(_word_widths, key, font.size(word)[0])
+    return width
+
+
+def wrap(text, font, max_width):
+    """Break text into lines no wider than max_width, returning a tuple of
+    strings (a single "" for blank text). A word wider than max_width gets a
+    line of its own.
+
+    Breaks are first guessed from cached word widths, then checked with
+    font.size() on the line itself, so the lines match measuring every
+    candidate line in turn; results are memoized by (text, font, width).
+    """
+    key = ("wrap", text, font, max_width)
+    lines = _recall(_layouts, key)
+    if lines is None:
+        lines = _remember(_layouts, key, tuple(_wrap(text.split(), font, max_width)) or ("",))
+    return lines
+
+
+def _wrap(words, font, max_width):
+    space = word_width(" ", font)
+    lines = []
+    start = 0
+    while start < len(words):
+        # Guess how many words fit from their summed widths...
+        end = start + 1
+        width = word_width(words[start], font)
+        while end < len(words):
+            width += space + word_width(words[end], font)
+            if width > max_width:
+                break
+            end += 1
+        # ...then settle it on the measured line
+        while end > start + 1 and font.size(" ".join(words[start:end]))[0] > max_width:
+            end -= 1
+        while end < len(words) and font.size(" ".join(words[start:end + 1]))[0] <= max_width:
+            end += 1
+        lines.append(" ".join(words[start:end]))
+        start = end
+    return lines
+
+
+def truncate(text, font, max_width):
+    """Return text, or its longest prefix that fits max_width with an
+    ellipsis appended, found by binary search and memoized."""
+    key = ("truncate", text, font, max_width)
+    result = _recall(_layouts, key)
+    if result is None:
+        result = _remember(_layouts, key, _truncate(text, font, max_width))
+    return result
+
+
+def _truncate(text, font, max_width):
+    if font.size(text)[0] <= max_width:
+        return text
+    low, high = 0, len(text) - 1
+    while low < high:
+        mid = (low + high + 1) // 2
+        if font.size(text[:mid] + ELLIPSIS)[0] <= max_width:
+            low = mid
+        else:
+            high = mid - 1
+    return text[:low] + ELLIPSIS
+
+
+def clear():
+    """Drop every memoized layout and word width."""
+    _layouts.clear()
+    _word_widths.clear()
@@ -0,0 +1,432 @@
+import pygame
+from src.font_loader import render_with
+from src.ui import effects
+from src.ui.skins import rounded_skin
+from src.settings import (
+    COLOR_BG_ALT, COLOR_TEXT_LIGHT, COLOR_ACCENT, COLOR_PANEL_BG,
+    COLOR_PANEL_BORDER, COLOR_PANEL_HOVER, COLOR_BUTTON_IDLE,
+    COLOR_BUTTON_HOVER, COLOR_BUTTON_PRESSED, COLOR_BUTTON_TEXT
+)
+
+# Visual states a widget can be in. Not every widget draws each one
+# differently; styles fall back to "idle" for states they don't define.
+STATES = ("idle", "hover", "pressed", "selected", "disabled")
+
+
+def _styled(style, state):
+    return style.get(state, style["idle"])
+
+
+class Widget:
+    """Retained UI element that keeps its rendered surface per visual state.
+
+    render() paints the current state into a fresh surface the size of rect,
+    grown by bleed pixels on every side for content that overhangs the rect
+    (text descenders, shadows). The result is reused until the state's
+    surface is dropped by changed(), or the rect is resized. Moving rect is free.
+    """
+
+    bleed = 0
+    # States shown while the pointer is over / holding down the widget, or
+    # None to stay idle; see set_pointer. Selected and disabled widgets keep
+    # their state regardless.
+    pointer_states = (None, None)
+
+    def __init__(self, rect):
+        self.rect = pygame.Rect(rect)
+        self.state = "idle"
+        self.visible = True
+        self._surfaces = {}
+        self._size = self.rect.size
+
+    def changed(self):
+        """Drop every cached surface; call after changing what render() paints."""
+        self._surfaces.clear()
+
+    def set_state(self, state):
+        """Switch visual state. Returns True if it changed, so callers can invalidate rect."""
+        if state == self.state:
+            return False
+        self.state = state
+        return True
+
+    def set_pointer(self, hovered, pressed):
+        """Reflect pointer hover/press in the state. Returns True if it changed."""
+        if self.state in ("selected", "disabled"):
+            return False
+        hover_state, pressed_state = self.pointer_states
+        state = pressed_state if pressed else hover_state if hovered else None
+        return self.set_state(state or "idle")
+
+    @property
+    def bounds(self):
+        """Screen area the widget paints, including bleed."""
+        return self.rect.inflate(2 * self.bleed, 2 * self.bleed)
+
+    def collidepoint(self, pos):
+        return self.visible and self.rect.collidepoint(pos)
+
+    def surface(self):
+        if self.rect.size != self._size:
+            self._surfaces.clear()
+            self._size = self.rect.size
+        surf = self._surfaces.get(self.state)
+        if surf is None:
+            surf = self._surfaces[self.state] = self.render()
+        return surf
+
+    def render(self):
+        raise NotImplementedError
+
+    def draw(self, surface):
+        if self.visible:
+            surface.blit(self.surface(), (self.rect.x - self.bleed, self.rect.y - self.bleed))
+
+
+class Label(Widget):
+    """One line of text; its rect is sized to the text and placed by an anchor.
+
+    Label("Title", font, color, center=(640, 100)) keeps the text centred on
+    that point as it changes, like Surface.get_rect(center=...). Labels whose
+    text keeps changing (counters, tooltips) pass cached=False to render
+    with font.render, leaving the shared text cache to text that repeats.
+    """
+
+    def __init__(self, text, font, color, cached=True, **anchor):
+        super().__init__((0, 0, 0, 0))
+        self.text = None
+        self.font = font
+        self.color = color
+        self.cached = cached
+        self.anchor = anchor or {"topleft": (0, 0)}
+        self.set_text(text)
+
+    def set_text(self, text, color=None):
+        """Change text and/or color. Returns True if the label needs redrawing."""
+        color = self.color if color is None else color
+        if text == self.text and color == self.color:
+            return False
+        self.text = text
+        self.color = color
+        self.changed()
+        surf = self._surfaces[self.state] = self.render()
+        self.rect = surf.get_rect(**self.anchor)
+        self._size = self.rect.size
+        return True
+
+    def move(self, **anchor):
+        self.anchor = anchor
+        self.rect = self.surface().get_rect(**anchor)
+
+    def render(self):
+        if not self.cached:
+            return self.font.render(self.text, True, self.color)
+        return render_with(self.font, self.text, self.color)
+
+
+class Panel(Widget):
+    """Flat, optionally rounded rectangle with a border."""
+
+    def __init__(self, rect, fill=COLOR_PANEL_BG, border=COLOR_PANEL_BORDER,
+                 border_width=2, radius=0):
+        super().__init__(rect)
+        self.fill = fill
+        self.border = border
+        self.border_width = border_width
+        self.radius = radius
+
+    def render(self):
+        surf = pygame.Surface(self.rect.size, pygame.SRCALPHA)
+        rounded_skin(self.fill, self.border, self.border_width, self.radius).draw(
+            surf, surf.get_rect())
+        return surf
+
+
+class Button(Widget):
+    """Rounded button with a centred label; fill, border and text color per state.
+
+    gloss adds the soft top highlight used by pill buttons while not hovered.
+    A label wider than the button overhangs both sides, as it would if drawn
+    straight onto the screen.
+    """
+
+    pointer_states = ("hover", "pressed")
+
+    def __init__(self, rect, text, font, fills=None, borders=None, text_colors=None,
+                 border_width=2, radius=8, gloss=False):
+        super().__init__(rect)
+        self.text = text
+        self.font = font
+        self.fills = fills or {
+            "idle": COLOR_BUTTON_IDLE, "hover": COLOR_BUTTON_HOVER,
+            "pressed": COLOR_BUTTON_PRESSED, "disabled": COLOR_BG_ALT,
+        }
+        self.borders = borders or {"idle": COLOR_PANEL_BORDER}
+        self.text_colors = text_colors or {"idle": COLOR_BUTTON_TEXT, "disabled": COLOR_TEXT_LIGHT}
+        self.border_width = border_width
+        self.radius = radius
+        self.gloss = gloss
+        self._fit_label()
+
+    @property
+    def enabled(self):
+        return self.state != "disabled"
+
+    def set_text(self, text):
+        if text == self.text:
+            return False
+        self.text = text
+        self._fit_label()
+        self.changed()
+        return True
+
+    def _fit_label(self):
+        self.bleed = max(0, self.font.size(self.text)[0] - self.rect.w + 1) // 2
+
+    def set_enabled(self, enabled):
+        if enabled == self.enabled:
+            return False
+        return self.set_state("idle" if enabled else "disabled")
+
+    def collidepoint(self, pos):
+        return self.enabled and super().collidepoint(pos)
+
+    def render(self):
+        state = self.state
+        b = self.bleed
+        surf = pygame.Surface((self.rect.w + 2 * b, self.rect.h + 2 * b), pygame.SRCALPHA)
+        local = pygame.Rect(b, b, self.rect.w, self.rect.h)
+        rounded_skin(_styled(self.fills, state), _styled(self.borders, state),
+                     self.border_width, self.radius).draw(surf, local)
+        if self.gloss and state not in ("hover", "pressed"):
+            surf.blit(effects.rect((local.w - 8, local.h // 3), (255, 255, 255), 35,
+                                   radius=local.h // 4), (local.x + 4, local.y + 2))
+        label = render_with(self.font, self.text, _styled(self.text_colors, state))
+        surf.blit(label, label.get_rect(center=local.center))
+        return surf
+
+
+class Card(Widget):
+    """Selectable panel whose content is painted by a callback.
+
+    content(surface, rect, state) draws over the panel background and border,
+    once per state until changed() is called; rect is where the card sits in
+    surface (offset by bleed).
+    """
+
+    def __init__(self, rect, content=None, fills=None, borders=None,
+                 border_width=2, selected_border_width=None, radius=10, bleed=None):
+        super().__init__(rect)
+        if bleed is not None:
+            self.bleed = bleed
+        self.content = content
+        self.fills = fills or {"idle": COLOR_PANEL_BG, "selected": COLOR_PANEL_HOVER}
+        self.borders = borders or {"idle": COLOR_PANEL_BORDER, "selected": COLOR_ACCENT}
+        self.border_width = border_width
+        self.selected_border_width = selected_border_width or border_width
+        self.radius = radius
+
+    @property
+    def selected(self):
+        return self.state == "selected"
+
+    def set_selected(self, selected):
+        return self.set_state("selected" if selected else "idle")
+
+    def render(self):
+        state = self.state
+        b = self.bleed
+        surf = pygame.Surface((self.rect.w + 2 * b, self.rect.h + 2 * b), pygame.SRCALPHA)
+        local = pygame.Rect(b, b, self.rect.w, self.rect.h)
+        width = self.selected_border_width if state == "selected" else self.border_width
+        rounded_skin(_styled(self.fills, state), _styled(self.borders, state),
+                     width, self.radius).draw(surf, local)
+        if self.content:
+            self.content(surf, local, state)
+        return surf
+
+
+class ProgressBar(Widget):
+    """Rounded track with a fill; re-rendered only when the fill width changes."""
+
+    def __init__(self, rect, track=COLOR_PANEL_BORDER, fill=COLOR_ACCENT, radius=None):
+        super().__init__(rect)
+        self.track = track
+        self.fill = fill
+        self.radius = self.rect.height // 2 if radius is None else radius
+        self.fill_width = 0
+
+    def set_value(self, value, maximum=1.0):
+        """Set progress as value out of maximum. Returns True if the bar needs redrawing."""
+        value = min(max(value, 0), maximum)
+        fill_width = int(self.rect.width * value / maximum)
+        if fill_width == self.fill_width:
+            return False
+        self.fill_width = fill_width
+        self.changed()
+        return True
+
+    def render(self):
+        surf = pygame.Surface(self.rect.size, pygame.SRCALPHA)
+        rounded_skin(self.track, radius=self.radius).draw(surf, surf.get_rect())
+        if self.fill_width > 0:
+            rounded_skin(self.fill, radius=self.radius).draw(
+                surf, (0, 0, self.fill_width, self.rect.height))
+        return surf
+
+
+class TextInput(Widget):
+    """Box of editable text, typed and erased at its end, drawn without a
+    background (put a Panel behind it).
+
+    The text is broken into lines at spaces to fit rect, or kept on one line
+    if multiline is False, and each line keeps its rendered surface: typing
+    re-breaks and re-renders only the last line, and erasing the last two
+    (a shortened word may fit back on the line above). When the lines
+    outgrow rect they scroll up to keep the last in view, and when the last
+    line is wider than rect (one long word, or a single-line box) that line
+    alone scrolls left by pixels to keep the caret in view. The caret is
+    blitted separately, so blinking it redraws nothing.
+    """
+
+    caret_width = 2
+
+    def __init__(self, rect, font, color, caret_color=None, max_length=None, multiline=True):
+        super().__init__(rect)
+        self.font = font
+        self.color = color
+        self.caret_color = caret_color or color
+        self.max_length = max_length
+        self.multiline = multiline
+        self.line_height = font.get_linesize()
+        self.rows = max(1, self.rect.height // self.line_height) if multiline else 1
+        self.caret_visible = True
+        self.text = ""
+        # Where each line starts in text, its text, width and surface
+        self.starts = [0]
+        self.lines = [""]
+        self.widths = [0]
+        self.segments = [self._render("")]
+        self.scroll = (0, 0)  # (first line shown, pixels the last is scrolled left)
+
+    def _render(self, line):
+        # Not render_with: every keystroke makes a new line, which would only
+        # churn the shared text cache
+        return self.font.render(line, True, self.color)
+
+    def set_text(self, text):
+        """Replace the text. Returns the rect to redraw, or None if unchanged."""
+        if self.max_length is not None:
+            text = text[:self.max_length]
+        if text == self.text:
+            return None
+        self.text = text
+        return self._reflow(0)
+
+    def append(self, text):
+        """Type text at the end, as far as max_length allows. Returns the rect
+        to redraw, or None if nothing was added."""
+        if self.max_length is not None:
+            text = text[:max(0, self.max_length - len(self.text))]
+        if not text:
+            return None
+        self.text += text
+        return self._reflow(len(self.starts) - 1)
+
+    def backspace(self):
+        """Erase the last character. Returns the rect to redraw, or None if empty."""
+        if not self.text:
+            return None
+        self.text = self.text[:-1]
+        return self._reflow(len(self.starts) - 2)
+
+    def _break(self, start):
+        """Return where the line beginning at start should end, just after a
+        space, or None if the rest of the text fits on it.
+
+        The line ends after the last space that fits what comes before it,
+        found by binary search; a word wider than rect ends its line after
+        the space that follows it.
+        """
+        text, width = self.text, self.rect.width - self.caret_width
+        if self.font.size(text[start:])[0] <= width:
+            return None
+        spaces = [i for i in range(start, len(text)) if text[i] == " "]
+        low, high = 0, len(spaces)
+        while low < high:
+            mid = (low + high) // 2
+            if self.font.size(text[start:spaces[mid]])[0] <= width:
+                low = mid + 1
+            else:
+                high = mid
+        if low:
+            return spaces[low - 1] + 1
+        return spaces[0] + 1 if spaces else None
+
+    def _reflow(self, first):
+        """Re-break the text from line first on, re-rendering the lines whose
+        text changed. Returns the rect to redraw."""
+        first = max(0, first)
+        starts = self.starts[:first + 1]
+        while self.multiline:
+            end = self._break(starts[-1])
+            if end is None:
+                break
+            starts.append(end)
+        lines = [self.text[a:b] for a, b in zip(starts, starts[1:] + [len(self.text)])]
+        changed = len(lines)
+        for i in range(first, len(lines)):
+            if i < len(self.lines) and lines[i] == self.lines[i]:
+                continue
+            changed = min(changed, i)
+            if i < len(self.lines):
+                self.widths[i] = self.font.size(lines[i])[0]
+                self.segments[i] = self._render(lines[i])
+            else:
+                self.widths.append(self.font.size(lines[i])[0])
+                self.segments.append(self._render(lines[i]))
+        if len(lines) < len(self.lines):
+            changed = min(changed, len(lines) - 1)
+            del self.widths[len(lines):]
+            del self.segments[len(lines):]
+        self.starts, self.lines = starts, lines
+
+        old_scroll = self.scroll
+        self.scroll = (max(0, len(lines) - self.rows),
+                       max(0, self.widths[-1] + self.caret_width - self.rect.width))
+        if self.scroll[0] != old_scroll[0]:
+            return self.rect.copy()
+        if self.scroll[1] != old_scroll[1]:
+            changed = min(changed, len(lines) - 1)
+        # Everything from the first changed line down; the caret is on the last
+        top = self.rect.y + (changed - self.scroll[0]) * self.line_height
+        return pygame.Rect(self.rect.x, top, self.rect.width, self.rect.bottom - top).clip(self.rect)
+
+    @property
+    def caret_rect(self):
+        top, scroll_x = self.scroll
+        return pygame.Rect(self.rect.x + self.widths[-1] - scroll_x,
+                           self.rect.y + (len(self.lines) - 1 - top) * self.line_height,
+                           self.caret_width, self.line_height).clip(self.rect)
+
+    def set_caret_visible(self, visible):
+        """Show or hide the caret. Returns True if caret_rect needs redrawing."""
+        if visible == self.caret_visible:
+            return False
+        self.caret_visible = visible
+        return True
+
+    def draw(self, surface):
+        if not self.visible:
+            return
+        clip = surface.get_clip()
+        surface.set_clip(self.rect.clip(clip))
+        top, scroll_x = self.scroll
+        last = len(self.segments) - 1
+        y = self.rect.y
+        for i in range(top, min(top + self.rows, last + 1)):
+            surface.blit(self.segments[i], (self.rect.x - (scroll_x if i == last else 0), y))
+            y += self.line_height
+        if self.caret_visible:
+            surface.fill(self.caret_color, self.caret_rect)
+        surface.set_clip(clip)
@@ -0,0 +1,101 @@
+#!/usr/bin/env python3
+"""
+Presentation cost benchmark across window sizes (720p to 4K).
+Times one full-frame present of the main menu per iteration for:
+  legacy  - fill the whole window, scale into a new surface, blit, flip
+  surface - SurfacePresenter: scale into the content rect, update only it
+  sdl2    - RendererPresenter with the software renderer (--with-sdl2)
+Prints per-size mean/p50/p95/p99 milliseconds as JSON.
+Run from the project root: python tools/bench_present.py --frames 200
+"""
+
+import argparse
+import json
+import os
+import sys
+import time
+
+# Add project root to path
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+os.environ.setdefault("PYGAME_HIDE_SUPPORT_PROMPT", "1")  # keep stdout pure JSON
+
+import pygame
+
+from main import build_scenes
+from src.game import Game
+from src.presentation import create_presenter
+from src.profiler import summarize
+from src.settings import COLOR_BG_DARK
+
+SIZES = ["1280x720", "1920x1080", "2560x1440", "3840x2160"]
+
+
+def legacy_present(game):
+    """The pre-presenter path: full-window fill plus a freshly allocated scale."""
+    screen = game.presenter.screen
+    scaled = pygame.transform.scale(game.logical_surface, (game.scaled_w, game.scaled_h))
+    screen.fill(COLOR_BG_DARK)
+    screen.blit(scaled, (game.offset_x, game.offset_y))
+    pygame.display.flip()
+
+
+def time_present(game, present, frames):
+    times = []
+    for _ in range(frames):
+        start = time.perf_counter()
+        present()
+        times.append(time.perf_counter() - start)
+    return summarize(times)
+
+
+def bench_size(size, backends, frames):
+    results = {}
+    for backend in backends:
+        presenter = create_presenter("sdl2" if backend == "sdl2" else "surface",
+                                     size, "HYBRIS present benchmark")
+        game = Game(presenter, build_scenes(), "MAIN_MENU")
+        game.current_scene.draw(game.logical_surface)
+        if backend == "legacy":
+            present = lambda: legacy_present(game)
+        else:
+            present = lambda: presenter.present_full(game.logical_surface)
+        present()  # paints the letterbox once, as after a resize
+        results[backend] = time_present(game, present, frames)
+        if backend == "sdl2":
+            presenter.window.destroy()
+    return results
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--frames", type=int, default=200, help="presents timed per size")
+    parser.add_argument("--sizes", nargs="*", default=SIZES, help="window sizes, WxH")
+    parser.add_argument("--with-sdl2", action="store_true", help="also time the sdl2 backend")
+    parser.add_argument("--output", help="write JSON here instead of stdout")
+    args = parser.parse_args()
+
+    pygame.init()
+    backends = ["legacy", "surface"] + (["sdl2"] if args.with_sdl2 else [])
+    report = {
+        "config": {"frames": args.frames, "video_driver": os.environ["SDL_VIDEODRIVER"],
+                   "pygame": pygame.version.ver},
+        "sizes": {},
+    }
+    for text in args.sizes:
+        size = tuple(int(v) for v in text.lower().split("x"))
+        report["sizes"][text] = bench_size(size, backends, args.frames)
+    pygame.quit()
+
+    text = json.dumps(report, indent=2)
+    if args.output:
+        with open(args.output, "w") as f:
+            f.write(text + "\n")
+    else:
+        print(text)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,150 @@
+#!/usr/bin/env python3
+"""
+Micro-benchmark of nine-slice skins against the pygame.draw calls they replace.
+Renders every scenario from tools/benchmark.py once, records each distinct
+rounded-rect style and size the scenes draw, then times per draw:
+  draw - pygame.draw.rect fill plus border, as the scenes used to (through
+         a temporary surface for translucent colors, so they blend)
+  skin - RoundedSkin assembled from its cached pieces
+and the parchment NineSlice against scaling the whole texture, at a few
+panel sizes. Prints p50 microseconds per draw and totals as JSON.
+Run from the project root: python tools/bench_skins.py --repeat 200
+"""
+
+import argparse
+import json
+import os
+import sys
+import time
+
+# Add project root to path
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+os.environ.setdefault("PYGAME_HIDE_SUPPORT_PROMPT", "1")  # keep stdout pure JSON
+
+import pygame
+
+from main import build_scenes
+from src.game import Game
+from src.presentation import create_presenter
+from src.profiler import summarize
+from src.ui.skins import NineSlice, RoundedSkin
+from src.settings import LOGICAL_WIDTH, LOGICAL_HEIGHT, SPRITE_DIR
+from tools.benchmark import SCENARIOS, enter_scene
+
+# A prototype frame cut from the parchment texture, whose darkened rim is
+# about PARCHMENT_INSETS wide in source pixels. No panel is drawn from it yet.
+PARCHMENT_PATH = os.path.join(SPRITE_DIR, "ui", "parchment_bg.png")
+PARCHMENT_INSETS = (96, 96, 96, 96)
+PARCHMENT_SIZES = [(360, 240), (560, 400), (LOGICAL_WIDTH, LOGICAL_HEIGHT)]
+
+
+def record_skins(game):
+    """Render each scenario once; return the (skin, size) pairs drawn, in order."""
+    drawn = {}
+    original = RoundedSkin.draw
+
+    def draw(skin, surface, rect):
+        rect = pygame.Rect(rect)
+        drawn.setdefault((skin, rect.size), None)
+        original(skin, surface, rect)
+
+    RoundedSkin.draw = draw
+    try:
+        for label, name, setup in SCENARIOS:
+            enter_scene(game, name, setup)
+            game.current_scene.draw(game.logical_surface)
+    finally:
+        RoundedSkin.draw = original
+    return list(drawn)
+
+
+def time_us(fn, repeat):
+    times = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        fn()
+        times.append(time.perf_counter() - start)
+    return round(summarize(times)["p50"] * 1000.0, 2)
+
+
+def describe(skin):
+    return "fill={} border={}/{} r={}".format(
+        skin.fill, skin.border, skin.border_width, skin.radius)
+
+
+def legacy_draw(skin, surface, rect):
+    if skin.translucent:
+        layer = pygame.Surface(rect.size, pygame.SRCALPHA)
+        skin.paint(layer, layer.get_rect())
+        surface.blit(layer, rect)
+    else:
+        skin.paint(surface, rect)
+
+
+def bench_rounded(pairs, repeat):
+    rows = []
+    for skin, size in pairs:
+        target = pygame.Surface(size, pygame.SRCALPHA)
+        rect = target.get_rect()
+        skin.draw(target, rect)  # cut the slices outside the timing
+        rows.append({
+            "style": describe(skin), "size": list(size),
+            "draw_us": time_us(lambda: legacy_draw(skin, target, rect), repeat),
+            "skin_us": time_us(lambda: skin.draw(target, rect), repeat),
+        })
+    return rows
+
+
+def bench_parchment(repeat):
+    if not os.path.exists(PARCHMENT_PATH):
+        return None
+    image = pygame.image.load(PARCHMENT_PATH).convert_alpha()
+    skin = NineSlice(image, PARCHMENT_INSETS)
+    rows = []
+    for size in PARCHMENT_SIZES:
+        target = pygame.Surface(size, pygame.SRCALPHA)
+        rect = target.get_rect()
+        rows.append({
+            "size": list(size),
+            "scale_us": time_us(lambda: target.blit(pygame.transform.scale(image, size), (0, 0)),
+                                repeat),
+            "skin_us": time_us(lambda: skin.draw(target, rect), repeat),
+        })
+    return rows
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--repeat", type=int, default=200, help="timed draws per style and size")
+    parser.add_argument("--output", help="write JSON here instead of stdout")
+    args = parser.parse_args()
+
+    pygame.init()
+    presenter = create_presenter("surface", (LOGICAL_WIDTH, LOGICAL_HEIGHT), "HYBRIS skin benchmark")
+    game = Game(presenter, build_scenes(), "MAIN_MENU")
+    rounded = bench_rounded(record_skins(game), args.repeat)
+    report = {
+        "config": {"repeat": args.repeat, "video_driver": os.environ["SDL_VIDEODRIVER"],
+                   "pygame": pygame.version.ver},
+        "rounded": rounded,
+        "rounded_total_us": {
+            "draw": round(sum(row["draw_us"] for row in rounded), 1),
+            "skin": round(sum(row["skin_us"] for row in rounded), 1),
+        },
+        "parchment": bench_parchment(args.repeat),
+    }
+    pygame.quit()
+
+    text = json.dumps(report, indent=2)
+    if args.output:
+        with open(args.output, "w") as f:
+            f.write(text + "\n")
+    else:
+        print(text)
+
+
+if __name__ == "__main__":
+    main()
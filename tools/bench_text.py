@@ -0,0 +1,210 @@
+#!/usr/bin/env python3
+"""
+Micro-benchmark of a glyph-atlas text renderer against Font.render, for
+the strings the scenes change most often: the personal statement as it is
+typed and its n/200 counter, the question header, the processing
+subtexts and the dress-up tooltips. For each group prints p50
+microseconds per string for:
+  render - Font.render, what Label.set_text pays once per change
+  blit   - blitting that rendered label, what each redraw pays after it
+  atlas  - GlyphAtlas.draw below, what each redraw would pay instead
+and how far the atlas strays from Font.render: the largest width
+difference in pixels and the share of pixels differing visibly.
+Run from the project root: python tools/bench_text.py --repeat 200
+"""
+
+import argparse
+import json
+import os
+import sys
+import time
+
+# Add project root to path
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+os.environ.setdefault("PYGAME_HIDE_SUPPORT_PROMPT", "1")  # keep stdout pure JSON
+
+import pygame
+
+from src.data.accessories import ACCESSORIES
+from src.data.euphemisms import LOADING_SUBTEXTS
+from src.data.questions import QUESTIONS
+from src.font_loader import get_font
+from src.profiler import summarize
+from src.scenes.dress_up import COLOR_TITLE
+from src.settings import COLOR_BG, COLOR_TEXT, COLOR_TEXT_DIM, COLOR_TEXT_LIGHT
+
+STATEMENT = "I have always believed that holistic excellence begins at home, with a family."
+
+# Characters rasterised into every atlas up front; others are added on first use
+PRELOAD = "".join(map(chr, range(32, 127))) + "…·—–“”‘’"
+
+# Summed RGB difference above which a pixel counts as visibly different
+VISIBLE_DIFF = 30
+
+
+class GlyphAtlas:
+    """One font's glyphs in one color, rasterised side by side into a
+    single strip surface; draw() lays a string out from the glyphs'
+    advances and bearings (Font.metrics()) and a per-pair step measured
+    once with Font.size(), and paints it with one blits() call.
+
+    Font.render places glyphs at fractional advances and shapes pairs
+    with kerning and ligatures, so long strings drift a few pixels.
+    """
+
+    def __init__(self, font, color):
+        self.font = font
+        self.color = color
+        self.height = font.get_height()
+        self.surface = pygame.Surface((0, self.height), pygame.SRCALPHA)
+        # char -> (area of the atlas surface, advance, left bearing, right extent)
+        self.glyphs = {}
+        # (left char, right char) -> pen step from the left char to the right
+        self.steps = {}
+        self._add(PRELOAD)
+
+    def _add(self, chars):
+        chars = [c for c in dict.fromkeys(chars) if c not in self.glyphs]
+        if not chars:
+            return
+        rendered = [self.font.render(c, True, self.color) for c in chars]
+        x = self.surface.get_width()
+        atlas = pygame.Surface((x + sum(s.get_width() for s in rendered), self.height),
+                               pygame.SRCALPHA)
+        atlas.blit(self.surface, (0, 0))
+        size = self.font.size
+        for c, glyph, metrics in zip(chars, rendered, self.font.metrics("".join(chars))):
+            minx, _, _, _, advance = metrics or (0, 0, 0, 0, glyph.get_width())
+            atlas.blit(glyph, (x, 0))
+            # Font.render shifts a glyph with negative bearing right to fit it
+            bearing = min(minx, 0)
+            self.glyphs[c] = (pygame.Rect(x, 0, glyph.get_width(), self.height),
+                              advance, bearing, size(c)[0] + bearing)
+            x += glyph.get_width()
+        self.surface = atlas
+
+    def _step(self, pair):
+        # Font.size() of the pair less the right glyph's own extent
+        step = self.font.size(pair[0] + pair[1])[0] + self.glyphs[pair[0]][2] - self.glyphs[pair[1]][3]
+        self.steps[pair] = step
+        return step
+
+    def draw(self, surface, text, pos):
+        """Draw text with its top-left at pos. Returns the width covered."""
+        glyphs = self.glyphs
+        if not all(c in glyphs for c in text):
+            self._add(text)
+        if not text:
+            return 0
+        atlas, steps = self.surface, self.steps
+        x, y = pos
+        pen = x - glyphs[text[0]][2]
+        prev = None
+        blits = []
+        for c in text:
+            if prev is not None:
+                step = steps.get((prev, c))
+                pen += self._step((prev, c)) if step is None else step
+            area, _, bearing, _ = glyphs[c]
+            blits.append((atlas, (pen + bearing, y), area))
+            prev = c
+        surface.blits(blits, doreturn=False)
+        return pen + glyphs[prev][3] - x
+
+
+def string_groups():
+    """(label, font, color, strings) as the scenes draw them."""
+    questions = len(QUESTIONS)
+    return [
+        ("statement", get_font(30), COLOR_TEXT,
+         [STATEMENT[:n] + "|" for n in range(len(STATEMENT) + 1)]),
+        ("statement_count", get_font(26), COLOR_TEXT_LIGHT,
+         [f"{n}/200" for n in range(201)]),
+        ("question_header", get_font(30), COLOR_TEXT_DIM,
+         [f"Intake Assessment  ·  Question {n} of {questions}" for n in range(1, questions + 1)]),
+        ("processing_subtext", get_font(26), COLOR_TEXT_LIGHT, list(LOADING_SUBTEXTS)),
+        ("tooltip", get_font(22), COLOR_TITLE,
+         [f"“{acc.flavor_text}”" for acc in ACCESSORIES if acc.flavor_text]
+         + [f"Removed {acc.display_name}" for acc in ACCESSORIES]),
+    ]
+
+
+def time_us(fn, strings, repeat):
+    """p50 microseconds of fn(text), over repeat passes through strings."""
+    times = []
+    for _ in range(repeat):
+        for text in strings:
+            start = time.perf_counter()
+            fn(text)
+            times.append(time.perf_counter() - start)
+    return round(summarize(times)["p50"] * 1000.0, 2)
+
+
+def compare(font, color, atlas, text):
+    """Return (width difference, visibly different pixels, pixels compared)."""
+    reference = font.render(text, True, color)
+    size = (reference.get_width() + 40, font.get_height())
+    expected = pygame.Surface(size)
+    expected.fill(COLOR_BG)
+    expected.blit(reference, (0, 0))
+    actual = pygame.Surface(size)
+    actual.fill(COLOR_BG)
+    width = atlas.draw(actual, text, (0, 0))
+    different = 0
+    for x in range(size[0]):
+        for y in range(size[1]):
+            a, b = expected.get_at((x, y)), actual.get_at((x, y))
+            if abs(a.r - b.r) + abs(a.g - b.g) + abs(a.b - b.b) > VISIBLE_DIFF:
+                different += 1
+    return abs(width - reference.get_width()), different, size[0] * size[1]
+
+
+def bench_group(font, color, strings, repeat):
+    atlas = GlyphAtlas(font, color)
+    # Opaque, like the logical surface the scenes draw on
+    target = pygame.Surface((1280, font.get_height()))
+    rendered = {text: font.render(text, True, color) for text in strings}
+    widths, different, total = [], 0, 0
+    for text in strings:
+        width_diff, diff, pixels = compare(font, color, atlas, text)
+        widths.append(width_diff)
+        different += diff
+        total += pixels
+    return {
+        "strings": len(strings),
+        "render_us": time_us(lambda text: font.render(text, True, color), strings, repeat),
+        "blit_us": time_us(lambda text: target.blit(rendered[text], (0, 0)), strings, repeat),
+        "atlas_us": time_us(lambda text: atlas.draw(target, text, (0, 0)), strings, repeat),
+        "max_width_error_px": max(widths),
+        "visibly_different_pct": round(100.0 * different / total, 2),
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--repeat", type=int, default=200, help="timed passes per string group")
+    parser.add_argument("--output", help="write JSON here instead of stdout")
+    args = parser.parse_args()
+
+    pygame.init()
+    report = {
+        "config": {"repeat": args.repeat, "video_driver": os.environ["SDL_VIDEODRIVER"],
+                   "pygame": pygame.version.ver, "sdl_ttf": list(pygame.font.get_sdl_ttf_version())},
+        "groups": {label: bench_group(font, color, strings, args.repeat)
+                   for label, font, color, strings in string_groups()},
+    }
+    pygame.quit()
+
+    text = json.dumps(report, indent=2)
+    if args.output:
+        with open(args.output, "w") as f:
+            f.write(text + "\n")
+    else:
+        print(text)
+
+
+if __name__ == "__main__":
+    main()
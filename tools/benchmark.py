@@ -0,0 +1,221 @@
+#!/usr/bin/env python3
+"""
+Headless per-scene frame-rate benchmark for HYBRIS.
+Boots Game under the SDL dummy video driver, seeds representative state for
+each scene and drives N frames of synthetic mouse motion through Game.step.
+Prints frames/sec, frame-time percentiles and resident surface memory per
+scene, and the text cache's hit and miss counts, as JSON. TRANSITION:*
+scenarios time only the animated frames of scene transitions into the
+dress-up scene, the most expensive to draw.
+Run from the project root: python tools/benchmark.py --frames 300
+"""
+
+import argparse
+import json
+import math
+import os
+import sys
+import time
+
+# Add project root to path
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+os.environ.setdefault("PYGAME_HIDE_SUPPORT_PROMPT", "1")  # keep stdout pure JSON
+
+import pygame
+
+from main import build_scenes
+from src.game import Game
+from src.presentation import PRESENTERS, create_presenter
+from src.font_loader import text_cache_stats
+from src.profiler import summarize
+from src.state import GameState
+from src.settings import FPS
+from src.data.accessories import ACCESSORY_LOOKUP
+
+# Representative persistent state at the point each scene is entered
+BASE_STATE = {
+    "quiz_answers": [0, 1, 2, 0, 1],
+    "profile": "legacy",
+    "profile_label": "Well-Rounded Leader",
+    "species": "fox",
+    "equipped_accessories": {
+        "hat": "hat_graduation", "glasses": "glasses_wire", "neck": None,
+        "top": "top_blazer", "bottoms": "bottoms_trousers",
+    },
+    "cosmetic_tags": {"wealth": 6, "striving": 0, "rebellion": 0},
+    "applications": [
+        {"college": "Princesstown University", "college_id": "princesstown",
+         "essay_topic_index": 0, "extracurricular_selections": [0, 2],
+         "personal_statement_length": 120},
+        {"college": "California Institute of Technology", "college_id": "cit",
+         "essay_topic_index": 1, "extracurricular_selections": [1],
+         "personal_statement_length": 80},
+    ],
+}
+
+
+def _dress_up(scene):
+    for acc_id in BASE_STATE["equipped_accessories"].values():
+        if acc_id in ACCESSORY_LOOKUP:
+            scene.character.equip(ACCESSORY_LOOKUP[acc_id])
+    scene._sync_cards()
+
+
+def _college_apply(scene):
+    scene.selected_colleges = [0, 1]
+    scene.phase = "apply"
+    scene.current_app_index = 0
+    scene._build_app_layout()
+    scene.statement_input.set_text("I have always believed that holistic excellence begins at home.")
+    scene._sync_statement()
+
+
+def _decision_revealed(scene):
+    scene.state = "revealed"
+    scene._build_widgets()
+
+
+# (label, scene name, optional setup applied after startup)
+SCENARIOS = [
+    ("MAIN_MENU", "MAIN_MENU", None),
+    ("PERSONALITY_TEST", "PERSONALITY_TEST", None),
+    ("AVATAR_SELECT", "AVATAR_SELECT", None),
+    ("DRESS_UP", "DRESS_UP", _dress_up),
+    ("COLLEGE_APP:select", "COLLEGE_APP", None),
+    ("COLLEGE_APP:apply", "COLLEGE_APP", _college_apply),
+    ("DECISION:envelope", "DECISION", None),
+    ("DECISION:revealed", "DECISION", _decision_revealed),
+    ("EXPORT", "EXPORT", None),
+]
+
+# (label, transition, from scene, to scene)
+TRANSITION_SCENARIOS = [
+    ("TRANSITION:crossfade", "crossfade", "AVATAR_SELECT", "DRESS_UP"),
+    ("TRANSITION:slide", "slide", "AVATAR_SELECT", "DRESS_UP"),
+]
+
+
+def synthetic_motion(frame, size):
+    """Mouse motion along a Lissajous path covering most of the window."""
+    w, h = size
+    x = int(w / 2 + math.sin(frame * 0.037) * w * 0.45)
+    y = int(h / 2 + math.sin(frame * 0.053 + 1.0) * h * 0.45)
+    return pygame.event.Event(pygame.MOUSEMOTION, pos=(x, y), rel=(0, 0), buttons=(0, 0, 0))
+
+
+def enter_scene(game, name, setup):
+    game.persistent.update(GameState.from_dict(BASE_STATE))
+    game.goto(name)
+    if setup:
+        setup(game.current_scene)
+        game.current_scene.invalidate()
+
+
+def run_scenario(game, label, name, setup, frames, warmup, phases):
+    enter_scene(game, name, setup)
+    dt = 1.0 / FPS
+    size = game.presenter.get_size()
+    for i in range(warmup):
+        game.step(dt, [synthetic_motion(i, size)])
+    game.profiler.reset()
+    times = []
+    for i in range(warmup, warmup + frames):
+        if game.current_scene_name != name:
+            break
+        events = [synthetic_motion(i, size)]
+        start = time.perf_counter()
+        game.step(dt, events)
+        times.append(time.perf_counter() - start)
+    total = sum(times)
+    result = {
+        "frames": len(times),
+        "fps": len(times) / total if total else None,
+        "frame_ms": summarize(times),
+        "resident_kb": game.current_scene.resident_bytes() // 1024,
+    }
+    if game.current_scene_name != name:
+        result["left_scene_for"] = game.current_scene_name
+    if phases:
+        result["phases"] = game.profiler.stats(name)
+    return result
+
+
+def run_transition(game, style, source, target, frames):
+    """Play the style transition from source to target until frames
+    animated frames have been timed. Warm-ups finish inline, untimed."""
+    dt = 1.0 / FPS
+    times = []
+    runs = 0
+    while len(times) < frames:
+        enter_scene(game, source, None)
+        game.step(dt, [])  # the frame the transition snapshots
+        game.goto(target, transition=style)
+        runs += 1
+        if game.transition is None:
+            break
+        while game.transition is not None and len(times) < frames:
+            start = time.perf_counter()
+            game.step(dt, [])
+            times.append(time.perf_counter() - start)
+    total = sum(times)
+    return {
+        "frames": len(times),
+        "transitions": runs,
+        "fps": len(times) / total if total else None,
+        "frame_ms": summarize(times),
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--frames", type=int, default=300, help="measured frames per scene")
+    parser.add_argument("--warmup", type=int, default=30, help="unmeasured frames per scene")
+    parser.add_argument("--size", default="1280x960", help="window size, WxH")
+    parser.add_argument("--renderer", choices=sorted(PRESENTERS), default="surface")
+    parser.add_argument("--scenes", nargs="*", help="scenario labels to run (default: all)")
+    parser.add_argument("--phases", action="store_true", help="include per-phase profiler stats")
+    parser.add_argument("--output", help="write JSON here instead of stdout")
+    args = parser.parse_args()
+
+    pygame.init()
+    size = tuple(int(v) for v in args.size.lower().split("x"))
+    presenter = create_presenter(args.renderer, size, "HYBRIS benchmark")
+    game = Game(presenter, build_scenes(), "MAIN_MENU")
+    game.set_profiling(args.phases)
+
+    report = {
+        "config": {
+            "frames": args.frames, "warmup": args.warmup, "size": list(size),
+            "renderer": args.renderer, "video_driver": os.environ["SDL_VIDEODRIVER"],
+            "pygame": pygame.version.ver,
+        },
+        "scenes": {},
+    }
+    for label, name, setup in SCENARIOS:
+        if args.scenes and label not in args.scenes:
+            continue
+        report["scenes"][label] = run_scenario(
+            game, label, name, setup, args.frames, args.warmup, args.phases)
+    for label, style, source, target in TRANSITION_SCENARIOS:
+        if args.scenes and label not in args.scenes:
+            continue
+        report["scenes"][label] = run_transition(game, style, source, target, args.frames)
+    # What each scene still holds after the run, given the registry's residency policy
+    report["resident_kb"] = {name: size // 1024
+                             for name, size in game.scenes.resident_bytes().items()}
+    report["text_cache"] = text_cache_stats()
+    pygame.quit()
+
+    text = json.dumps(report, indent=2)
+    if args.output:
+        with open(args.output, "w") as f:
+            f.write(text + "\n")
+    else:
+        print(text)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,109 @@
+#!/usr/bin/env python3
+"""
+Replay an input recording made with main.py --record, headlessly.
+Reseeds the shared rng, boots Game at the logical size under the SDL dummy
+video driver (so recorded logical coordinates pass through unscaled) and
+feeds each recorded frame's events and dt to Game.step, running exactly the
+recorded number of warm-up steps. Runs at full speed, or paced to the
+recorded dt with --realtime. Saves and exports the session makes are named
+but not written (see save_manager.dry_run). Prints frame-time stats per
+scene as JSON and, with --digest, a hash of every frame drawn: two replays
+of one recording match bit for bit.
+Run from the project root: python tools/replay.py session.jsonl.gz --digest
+"""
+
+import argparse
+import hashlib
+import json
+import os
+import sys
+import time
+
+# Add project root to path
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+os.environ.setdefault("PYGAME_HIDE_SUPPORT_PROMPT", "1")  # keep stdout pure JSON
+
+import pygame
+
+from main import build_scenes
+from src.game import Game
+from src.presentation import create_presenter
+from src.profiler import summarize
+from src.replay import load_recording
+from src.rng import reseed
+from src.systems.save_manager import set_dry_run
+from src.settings import LOGICAL_WIDTH, LOGICAL_HEIGHT
+
+
+def replay(game, recording, realtime, digest):
+    """Step game through recording. Returns (frame times per scene, frames
+    whose warm-up steps fell short of the recording)."""
+    times = {}
+    short = 0
+    for dt, steps, events in recording.frames:
+        name = game.current_scene_name
+        game.warmup_quota = steps
+        start = time.perf_counter()
+        game.step(dt, events)
+        elapsed = time.perf_counter() - start
+        times.setdefault(name, []).append(elapsed)
+        if game.warmup_steps != steps:
+            short += 1
+        if digest is not None:
+            digest.update(pygame.image.tobytes(game.logical_surface, "RGB"))
+        if realtime and dt > elapsed:
+            time.sleep(dt - elapsed)
+        if not game.running:
+            break
+    game.warmup_quota = None
+    return times, short
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("recording", help="file written by main.py --record")
+    parser.add_argument("--realtime", action="store_true", help="pace frames to the recorded dt")
+    parser.add_argument("--digest", action="store_true", help="hash every frame drawn")
+    parser.add_argument("--phases", action="store_true", help="include per-phase profiler stats")
+    parser.add_argument("--output", help="write JSON here instead of stdout")
+    args = parser.parse_args()
+
+    recording = load_recording(args.recording)
+    pygame.init()
+    reseed(recording.seed)
+    set_dry_run()
+    presenter = create_presenter("surface", (LOGICAL_WIDTH, LOGICAL_HEIGHT), "HYBRIS replay")
+    game = Game(presenter, build_scenes(), recording.start_scene)
+    game.set_profiling(args.phases)
+    digest = hashlib.sha256() if args.digest else None
+    times, short = replay(game, recording, args.realtime, digest)
+
+    report = {
+        "config": {"recording": args.recording, "frames": len(recording), "seed": recording.seed,
+                   "realtime": args.realtime, "video_driver": os.environ["SDL_VIDEODRIVER"],
+                   "pygame": pygame.version.ver, "recorded_with": recording.pygame_version},
+        "scenes": {name: {"frames": len(values), "frame_ms": summarize(values)}
+                   for name, values in times.items()},
+        "total_s": round(sum(sum(values) for values in times.values()), 3),
+        "warmup_short_frames": short,
+    }
+    if args.phases:
+        for name in times:
+            report["scenes"][name]["phases"] = game.profiler.stats(name)
+    if digest is not None:
+        report["digest"] = digest.hexdigest()
+    pygame.quit()
+
+    text = json.dumps(report, indent=2)
+    if args.output:
+        with open(args.output, "w") as f:
+            f.write(text + "\n")
+    else:
+        print(text)
+
+
+if __name__ == "__main__":
+    main()